@@ -26,8 +26,13 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # ----------------------------------------------------------------------
 
+import bisect
 import os
+import re
 import traceback
+import nsiqcppstyle_facts
+import nsiqcppstyle_preprocessor
+from nsiqcppstyle_rulemanifest import STAGE_FILENAME, STAGE_CONTEXT
 from nsiqcppstyle_outputer import _consoleOutputer as console
 from nsiqcppstyle_rulehelper import *  # @UnusedWildImport
 # Reserved words
@@ -326,21 +331,106 @@ def t_error(t):
     t.lexer.skip(1)
 
 
+class LineInfo(object):
+    """
+    Classification of a source line. See CppLexerNavigator.GetLineTable()
+    - lineno - line number (> 0)
+    - text - line text
+    - length - length of the line text
+    - blank - the line contains only white spaces
+    - commentOnly - the line contains comments and no code
+    - preprocessor - the line is a part of a preprocessor directive
+    - continuation - the previous line ends with a backslash
+    - indent - width of the leading spaces and tabs (a tab counts as 1)
+    - mixedIndent - the leading indent contains both spaces and tabs
+    - firstToken - the first non white space token of the line, or None
+      when no active token starts on the line (i.e. inside a block comment)
+    """
+    __slots__ = ("lineno", "text", "length", "blank", "commentOnly", "preprocessor",
+                 "continuation", "indent", "mixedIndent", "firstToken")
+
+    def __init__(self, lineno, text):
+        self.lineno = lineno
+        self.text = text
+        self.length = len(text)
+        stripped = text.lstrip(" \t")
+        self.blank = (len(text.strip()) == 0)
+        self.commentOnly = False
+        self.preprocessor = False
+        self.continuation = False
+        self.indent = len(text) - len(stripped)
+        leading = text[:self.indent]
+        self.mixedIndent = (" " in leading and "\t" in leading)
+        self.firstToken = None
+
+
+# Tokens in front of the return type
+_functionSpecifiers = ("static", "virtual", "inline", "__inline", "explicit",
+                       "extern", "friend", "constexpr")
+
+# Tokens counted to tell if a parameter is named (the name and the type words)
+_parameterNameTypes = ("ID", "BOOL", "CHAR", "INT", "LONG", "DOUBLE", "FLOAT", "SHORT", "VOID")
+
+_whiteSpaceTypes = ("SPACE", "LINEFEED", "COMMENT", "CPPCOMMENT")
+
+_directiveKinds = ("define", "undef", "include", "if", "ifdef", "ifndef",
+                   "elif", "else", "endif", "pragma")
+
+
+# The lexer built from the token rules once per process. Each file is lexed
+# by a copy of it.
+_templateLexer = None
+
+
+def _CreateLexer():
+    global _templateLexer
+    if _templateLexer is None:
+        import nsiqcppstyle_lexer
+        _templateLexer = nsiqcppstyle_lexer.lex()
+    return _templateLexer.clone()
+
+
+class FileNameNavigator(object):
+    """
+    Stands in for CppLexerNavigator when the rules only need the file name.
+    The file is neither read nor lexed.
+    """
+
+    def __init__(self, filename, data=None):
+        self.filename = filename
+        self.data = data
+        self.facts = nsiqcppstyle_facts.FileFacts(self)
+
+    def Backup(self):
+        return None
+
+    def Restore(self, data):
+        pass
+
+
 class CppLexerNavigator(object):
     """
     Main class for Cpp Lexer
     """
 
-    def __init__(self, filename, data=None):
+    def __init__(self, filename, data=None, macros=None):
         self.filename = filename
         self.tokenlist = []
         self.indexstack = []
         self.tokenindex = -1
         self.matchingPair = {}
         self.reverseMatchingPair = {}
-        self.ifdefstack = []
-        import nsiqcppstyle_lexer
-        lexer = nsiqcppstyle_lexer.lex()
+        if macros is None:
+            macros = nsiqcppstyle_state._nsiqcppstyle_state.macros
+        self.conditionalState = nsiqcppstyle_preprocessor.ConditionalState(macros)
+        self.directives = []
+        self.directivesByKind = {}
+        self.directivesByToken = {}
+        self.lineTable = None
+        self.tokenOffsets = None
+        self.lineOffsets = None
+        self.facts = nsiqcppstyle_facts.FileFacts(self)
+        lexer = _CreateLexer()
         self.data = data
         if data is None:
             with open(filename) as f:
@@ -365,8 +455,12 @@ class CppLexerNavigator(object):
             tok.line = self.lines[tok.lineno - 1]
             tok.filename = self.filename
             tok.pp = None
+            # Set by ConstructContextInfo. None if the context isn't constructed.
+            tok.contextStack = None
+            tok.context = None
 #                self.ProcessIfdef(tok)
         self.tokenlistsize = len(self.tokenlist)
+        self._BuildDirectives()
         self.PushTokenIndex()
         while(True):
             t = self.GetNextToken()
@@ -375,23 +469,86 @@ class CppLexerNavigator(object):
             t.inactive = self.ProcessIfdef(t)
         self.PopTokenIndex()
 
+    def _BuildDirectives(self):
+        level = 0
+        index = 0
+        while index < self.tokenlistsize:
+            token = self.tokenlist[index]
+            index += 1
+            if token.type != "PREPROCESSOR":
+                continue
+            word = token.value[1:].strip()
+            kind = word if word in _directiveKinds else "other"
+            if kind in ["elif", "else"]:
+                directive = PreprocessorDirective(token, kind, word, max(level - 1, 0))
+            elif kind == "endif":
+                level = max(level - 1, 0)
+                directive = PreprocessorDirective(token, kind, word, level)
+            else:
+                directive = PreprocessorDirective(token, kind, word, level)
+                if kind in ["if", "ifdef", "ifndef"]:
+                    level += 1
+            # The directive ends at the line feed which doesn't follow a backslash
+            text = [token.value]
+            continued = False
+            while index < self.tokenlistsize:
+                t = self.tokenlist[index]
+                if t.type == "LINEFEED":
+                    if not continued or len(t.value) > 1:
+                        break
+                    continued = False
+                    index += 1
+                    directive.endLine = t.lineno + 1
+                    continue
+                index += 1
+                if t.type == "PREPROCESSORNEXT":
+                    continued = True
+                    text.append(" ")
+                    continue
+                directive.endLine = t.lineno + t.value.count("\n")
+                text.append(t.value)
+                if t.type != "SPACE":
+                    continued = False
+                if t.type not in _whiteSpaceTypes:
+                    directive.args.append(t)
+            directive.text = "".join(text).rstrip()
+            if kind in ["define", "undef", "ifdef", "ifndef"]:
+                if directive.args and directive.args[0].type == "ID":
+                    directive.name = directive.args[0].value
+            elif kind == "include" and directive.args:
+                directive.name = "".join(t.value for t in directive.args)
+            self.directives.append(directive)
+            self.directivesByKind.setdefault(kind, []).append(directive)
+            self.directivesByToken[token] = directive
+
+    def GetDirectives(self, kind=None):
+        """
+        Get the preprocessor directives of the given kind (all if kind is None)
+        """
+        if kind is None:
+            return self.directives
+        return self.directivesByKind.get(kind, [])
+
+    def GetDirective(self, token):
+        """
+        Get the preprocessor directive of the given PREPROCESSOR token
+        """
+        return self.directivesByToken.get(token)
+
     def ProcessIfdef(self, token):
+        """
+        Update the conditional state with the directive and
+        return True if the token is in an inactive branch.
+        """
         if token.type == "PREPROCESSOR":
-            if Match(r"^#\s*if(n)?def$", token.value):
-                self.ifdefstack.append(True)
-            elif Match(r"^#\s*if$", token.value):
-                nextToken = self.PeekNextTokenSkipWhiteSpaceAndComment()
-                if nextToken is not None and nextToken.value == "0":
-                    self.ifdefstack.append(False)
-                else:
-                    self.ifdefstack.append(True)
-            elif Match(r"^#\s*endif$", token.value):
-                if len(self.ifdefstack) != 0:
-                    self.ifdefstack.pop()
-        for ifdef in self.ifdefstack:
-            if not ifdef:
-                return True
-        return False
+            # A PREPROCESSOR token in the continued line of a directive (e.g.
+            # the stringizing #x of a macro) is an argument, not a directive
+            directive = self.directivesByToken.get(token)
+            if directive is not None and \
+                    directive.kind in ["if", "ifdef", "ifndef", "elif", "else", "endif"]:
+                self.conditionalState.Process(directive.kind,
+                                              " ".join(t.value for t in directive.args))
+        return not self.conditionalState.IsActive()
 
     def Backup(self):
         """
@@ -423,6 +580,200 @@ class CppLexerNavigator(object):
             return self.lines[curToken.lineno - 1]
         return None
 
+    def GetLineTable(self):
+        """
+        Get the LineInfo list of the file (index is lineno - 1).
+        It's built on the first call and kept until the end of the file.
+        """
+        if self.lineTable is None:
+            self.lineTable = self._BuildLineTable()
+        return self.lineTable
+
+    def GetFact(self, name, *args):
+        """
+        Get the fact of the file (see nsiqcppstyle_facts).
+        It's computed on the first call and kept until the end of the file.
+        """
+        return self.facts.Get(name, *args)
+
+    def GetFunctionSignature(self, token):
+        """
+        Get the FunctionSignature of the given FUNCTION token.
+        It's parsed on the first call and kept until the end of the file.
+        """
+        return self.GetFact("functionSignature", token)
+
+    def ParseFunctionSignature(self, token):
+        """
+        Parse the signature of the given FUNCTION token.
+        None is returned if it's not a function or the parameter list isn't closed.
+        """
+        lparen = getattr(token, "paramStart", None)
+        if token.type != "FUNCTION" or lparen is None:
+            return None
+        rparen = self.matchingPair.get(lparen)
+        if rparen is None:
+            self.PushTokenIndex()
+            self._MoveToToken(lparen)
+            rparen = self.GetNextMatchingToken()
+            self.PopTokenIndex()
+            if rparen is None:
+                return None
+        signature = FunctionSignature(token, lparen, rparen)
+        self.PushTokenIndex()
+        self._ParseFunctionPrefix(signature)
+        self._ParseFunctionParameters(signature)
+        self._ParseFunctionQualifiers(signature)
+        self.PopTokenIndex()
+        return signature
+
+    def _ParseFunctionPrefix(self, signature):
+        self._MoveToToken(signature.functionToken)
+        prefix = []
+        # Skip the qualified name (A::B::~C)
+        while True:
+            t = self.GetPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
+            if t is None or t.type not in ["NOT", "DOUBLECOLON"]:
+                break
+            if t.type == "DOUBLECOLON":
+                t = self.GetPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
+                if t is not None and t.type in ["GT", "RSHIFT"]:
+                    self.GetPrevMatchingLT()
+                    t = self.GetPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
+                if t is None or t.type != "ID":
+                    break
+        while t is not None and t.type not in ["SEMI", "LBRACE", "RBRACE", "RPAREN"]:
+            if t.type == "COLON":
+                prev = self.PeekPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
+                if prev is None or prev.type in ["PUBLIC", "PRIVATE", "PROTECTED"]:
+                    break
+            if t.type in ["GT", "RSHIFT"]:
+                gt = t
+                lt = self.GetPrevMatchingLT()
+                t = self.GetPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
+                if lt is None or (t is not None and t.type == "TEMPLATE"):
+                    break
+                prefix.extend(reversed(self.tokenlist[lt.index:gt.index + 1]))
+                continue
+            prefix.append(t)
+            t = self.GetPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
+        prefix.reverse()
+        for t in prefix:
+            if t.type in _whiteSpaceTypes:
+                continue
+            if t.value in _functionSpecifiers:
+                signature.specifiers.append(t)
+            else:
+                signature.returnType.append(t)
+        if prefix:
+            signature.startLine = prefix[0].lineno
+
+    def _ParseFunctionParameters(self, signature):
+        self._MoveToToken(signature.lparen)
+        parameter = FunctionParameter()
+        named = []
+        depth = 0
+        angle = 0
+        while True:
+            t = self.GetNextTokenSkipWhiteSpaceAndCommentAndPreprocess()
+            if t is None or t == signature.rparen:
+                break
+            signature.tokens.append(t)
+            if depth == 0 and t.type == "COMMA":
+                signature.commas.append(t)
+            if depth == 0 and angle == 0 and t.type == "COMMA":
+                self._AddFunctionParameter(signature, parameter, named)
+                parameter = FunctionParameter()
+                named = []
+                continue
+            parameter.tokens.append(t)
+            inTemplate = angle > 0
+            if t.type in ["LPAREN", "LBRACKET", "LBRACE"]:
+                depth += 1
+            elif t.type in ["RPAREN", "RBRACKET", "RBRACE"]:
+                depth -= 1
+            elif t.type == "LT":
+                angle += 1
+            elif t.type == "GT" and angle > 0:
+                angle -= 1
+            elif t.type == "RSHIFT" and angle > 0:
+                angle = max(angle - 2, 0)
+            if parameter.default or (depth == 0 and angle == 0 and t.type == "EQUALS"):
+                parameter.default.append(t)
+                continue
+            if not inTemplate and t.type in _parameterNameTypes:
+                named.append(t)
+            parameter.typeTokens.append(t)
+        self._AddFunctionParameter(signature, parameter, named)
+        if len(signature.parameters) == 1 and \
+                [t.type for t in signature.parameters[0].tokens] == ["VOID"]:
+            signature.parameters = []
+
+    def _AddFunctionParameter(self, signature, parameter, named):
+        if not parameter.tokens:
+            return
+        parameter.default = parameter.default[1:]
+        # The last identifier is the name if there is a type in front of it
+        names = [t for t in named if t.type == "ID"]
+        if len(named) >= 2 and names:
+            parameter.nameToken = names[-1]
+            parameter.typeTokens.remove(names[-1])
+        signature.parameters.append(parameter)
+
+    def _ParseFunctionQualifiers(self, signature):
+        self._MoveToToken(signature.rparen)
+        while True:
+            t = self.GetNextTokenSkipWhiteSpaceAndCommentAndPreprocess()
+            if t is None or t.type in ["LBRACE", "SEMI", "COLON"]:
+                break
+            signature.qualifiers.append(t)
+            signature.endLine = t.lineno
+
+    def GetTokenAt(self, offset):
+        """
+        Get the token which contains the given offset of the file data.
+        """
+        if self.tokenOffsets is None:
+            self.tokenOffsets = [token.lexpos for token in self.tokenlist]
+        index = bisect.bisect_right(self.tokenOffsets, offset) - 1
+        if index < 0:
+            return None
+        return self.tokenlist[index]
+
+    def GetLineNumberAt(self, offset):
+        """
+        Get the line number (> 0) of the given offset of the file data.
+        """
+        if self.lineOffsets is None:
+            self.lineOffsets = [match.start() for match in re.finditer("\n", self.data)]
+        return bisect.bisect_left(self.lineOffsets, offset) + 1
+
+    def _BuildLineTable(self):
+        table = [LineInfo(lineno, text) for lineno, text in enumerate(self.lines, 1)]
+        size = len(table)
+        hasCode = [False] * size
+        hasComment = [False] * size
+        for token in self.tokenlist:
+            if token.type in ("SPACE", "LINEFEED"):
+                continue
+            lineno = token.lineno
+            if lineno > size:
+                break
+            info = table[lineno - 1]
+            if info.firstToken is None and not token.inactive:
+                info.firstToken = token
+                if token.type == "PREPROCESSOR":
+                    info.preprocessor = True
+            marks = hasComment if token.type in ("COMMENT", "CPPCOMMENT") else hasCode
+            for index in range(lineno - 1, min(lineno + token.value.count("\n"), size)):
+                marks[index] = True
+        for index, info in enumerate(table):
+            info.commentOnly = hasComment[index] and not hasCode[index]
+            if index > 0 and table[index - 1].text.endswith("\\"):
+                info.continuation = True
+                info.preprocessor = info.preprocessor or table[index - 1].preprocessor
+        return table
+
     def _MoveToToken(self, token):
         self.tokenindex = token.index
 
@@ -595,6 +946,8 @@ class CppLexerNavigator(object):
             nextToken = self._GetNextToken()
             if nextToken is None:
                 return None
+            elif nextToken.inactive:
+                continue
             elif nextToken.type in ["LT"]:
                 tokenStack.append(nextToken)
 
@@ -641,6 +994,8 @@ class CppLexerNavigator(object):
                 self.matchingPair[searchToken] = lastPopedToken
                 self.reverseMatchingPair[lastPopedToken] = searchToken
                 return lastPopedToken
+            if nextToken.inactive:
+                continue
             if nextToken.type in ["LPAREN", "LBRACE", "LBRACKET"]:
                 tokenStack.append(nextToken)
                 # print "Push", nextToken
@@ -712,6 +1067,8 @@ class CppLexerNavigator(object):
             prevToken = self._GetPrevToken()
             if prevToken is None:
                 return None
+            elif prevToken.inactive:
+                continue
             elif prevToken.type in ["GT"]:
                 tokenStack.append(prevToken)
             elif prevToken.type in ["RSHIFT"]:
@@ -746,6 +1103,8 @@ class CppLexerNavigator(object):
             prevToken = self._GetPrevToken()
             if prevToken is None:
                 return None
+            if prevToken.inactive:
+                continue
             if prevToken.type in ["RPAREN", "RBRACE", "RBRACKET"]:
                 tokenStack.append(prevToken)
                 # print "Push", nextToken
@@ -881,6 +1240,79 @@ class CppLexerNavigator(object):
         return False
 
 
+class PreprocessorDirective:
+    """
+    Preprocessor directive (see CppLexerNavigator.GetDirectives)
+    - kind - define, undef, include, if, ifdef, ifndef, elif, else, endif, pragma or other
+    - directive - the directive word (e.g. include_next)
+    - token - the PREPROCESSOR token
+    - name - the macro name of define, undef, ifdef and ifndef or
+      the header of include ("a.h" or <a.h>). None for the others
+    - args - tokens after the directive word without white spaces, comments and
+      line continuations
+    - text - the directive text with the line continuations joined
+    - startLine, endLine - line span of the directive
+    - level - the number of the conditional blocks (#if ... #endif) around the directive.
+      #else, #elif and #endif have the level of their #if
+    """
+
+    def __init__(self, token, kind, directive, level):
+        self.token = token
+        self.kind = kind
+        self.directive = directive
+        self.name = None
+        self.args = []
+        self.text = token.value
+        self.startLine = token.lineno
+        self.endLine = token.lineno
+        self.level = level
+
+
+class FunctionParameter:
+    """
+    Parameter of a function signature
+    - tokens - all tokens of the parameter
+    - typeTokens - tokens before the default value except the name
+    - nameToken - the parameter name, None if the parameter isn't named
+    - default - tokens of the default value (after =)
+    """
+
+    def __init__(self):
+        self.tokens = []
+        self.typeTokens = []
+        self.nameToken = None
+        self.default = []
+
+
+class FunctionSignature:
+    """
+    Signature of a function (see CppLexerNavigator.GetFunctionSignature)
+    - functionToken - the FUNCTION token
+    - specifiers - static, virtual, inline, ... tokens in front of the return type
+    - returnType - return type tokens (empty for constructors and destructors)
+    - lparen, rparen - parentheses of the parameter list
+    - tokens - all tokens between the parentheses
+    - parameters - list of FunctionParameter. (void) has no parameter
+    - commas - COMMA tokens out of the nested parentheses. The ones in the
+      template arguments are included (e.g. 2 for (A<B, C> a, int b))
+    - qualifiers - const, &, noexcept, override, = 0 ... tokens after the parameter list
+    - startLine, endLine - line span of the signature
+    """
+
+    def __init__(self, functionToken, lparen, rparen):
+        self.functionToken = functionToken
+        self.specifiers = []
+        self.returnType = []
+        self.lparen = lparen
+        self.rparen = rparen
+        self.tokens = []
+        self.parameters = []
+        self.commas = []
+        self.qualifiers = []
+        self.startLine = functionToken.lineno
+        self.endLine = rparen.lineno
+
+
 class Context:
     def __init__(self, type, name, sig=False, starttoken=None, endtoken=None):
         self.type = type
@@ -988,6 +1420,12 @@ class _ContextStackStack:
 
 def ProcessFile(ruleManager, file, data=None):
     #    print file
+    # Stop at the analysis stage which the rules need
+    stage = ruleManager.GetRequiredStage()
+    if stage == STAGE_FILENAME:
+        ResetFileRuleSuppression(file, data)
+        RunRules(ruleManager, FileNameNavigator(file, data), stage)
+        return
     try:
         lexer = CppLexerNavigator(file, data)
     except UnicodeDecodeError:
@@ -997,10 +1435,40 @@ def ProcessFile(ruleManager, file, data=None):
         # other than skip the processing of the file, which is why we
         # just return.
         return
-    ConstructContextInfo(lexer)
+    if stage == STAGE_CONTEXT:
+        ConstructContextInfo(lexer)
+    else:
+        nsiqcppstyle_state._nsiqcppstyle_state.ResetRuleSuppression()
+        ProcessRuleSuppression(lexer)
     # Run Rules
     lexer.Reset()
-    RunRules(ruleManager, lexer)
+    RunRules(ruleManager, lexer, stage)
+
+
+def ProcessRuleSuppression(lexer):
+    """ Suppress the rules given as "-- RULE_NAME" in the first comment of the file """
+    comment = lexer.GetNextTokenInTypeList(("COMMENT", "CPPCOMMENT"), True)
+    if comment is not None:
+        for e in FindAll(r"--\s*(RULE\w*)", comment.value):
+            nsiqcppstyle_state._nsiqcppstyle_state.SuppressRule(e)
+
+
+def ResetFileRuleSuppression(file, data=None):
+    """
+    Reset the rule suppression to the one of the file without reading it.
+    The file is lexed only when a rule reports to check the rule suppression.
+    """
+    nsiqcppstyle_state._nsiqcppstyle_state.ResetRuleSuppression(
+        lambda: _ProcessFileRuleSuppression(file, data))
+
+
+def _ProcessFileRuleSuppression(file, data):
+    try:
+        lexer = CppLexerNavigator(file, data)
+    except UnicodeDecodeError:
+        return
+    ProcessRuleSuppression(lexer)
+
 
 def ConstructContextInfo(lexer):
     #    classstate = None
@@ -1013,10 +1481,7 @@ def ConstructContextInfo(lexer):
     prevLine = 0
     templateContext = None
     nsiqcppstyle_state._nsiqcppstyle_state.ResetRuleSuppression()
-    comment = lexer.GetNextTokenInTypeList(("COMMENT", "CPPCOMMENT"), True)
-    if comment is not None:
-        for e in FindAll(r"--\s*(RULE\w*)", comment.value):
-            nsiqcppstyle_state._nsiqcppstyle_state.SuppressRule(e)
+    ProcessRuleSuppression(lexer)
     t = None
     # Construct Context
     while(True):
@@ -1194,6 +1659,7 @@ def ConstructContextInfo(lexer):
                     # RunFunctionRule(lexer, functionName, decl, contextStack, contextPrediction)
                     t.type = "FUNCTION"
                     t.fullName = fullName
+                    t.paramStart = t2
                     t.context = contextPrediction
                     t.decl = not impl
                     lexer.PopTokenIndex()
@@ -1207,13 +1673,66 @@ def ConstructContextInfo(lexer):
             console.Err.Verbose(traceback.format_exc())
 
 
-def RunRules(ruleManager, lexer):
+def RunRules(ruleManager, lexer, stage=STAGE_CONTEXT):
     try:
         ruleManager.RunFileStartRule(lexer, os.path.basename(lexer.filename),
                                      os.path.dirname(lexer.filename))
     except Exception as e:
         console.Err.Verbose("Rule Error : ", e)
         console.Err.Verbose(traceback.format_exc())
+    if stage != STAGE_FILENAME:
+        RunTokenRules(ruleManager, lexer, stage)
+    try:
+        ruleManager.RunMapRules(lexer, os.path.basename(lexer.filename),
+                                os.path.dirname(lexer.filename))
+    except Exception as e:
+        ruleManager.mappedValues = []
+        console.Err.Verbose("Rule Error : ", e)
+        console.Err.Verbose(traceback.format_exc())
+    try:
+        ruleManager.RunFileEndRule(lexer, os.path.basename(lexer.filename),
+                                   os.path.dirname(lexer.filename))
+    except Exception as e:
+        console.Err.Verbose("Rule Error : ", e)
+        console.Err.Verbose(traceback.format_exc())
+    if not ruleManager.deferReduce:
+        try:
+            ruleManager.RunReduceRules(lexer.filename, ruleManager.mappedValues)
+        except Exception as e:
+            console.Err.Verbose("Rule Error : ", e)
+            console.Err.Verbose(traceback.format_exc())
+
+
+def ReduceFile(ruleManager, file, mappedValues):
+    """
+    Reduce the values mapped from the file, when the reduce is deferred
+    (ruleManager.deferReduce) or the file isn't analyzed again.
+    """
+    if not any(value is not None for value in mappedValues):
+        return
+    ResetFileRuleSuppression(file)
+    try:
+        ruleManager.RunReduceRules(file, mappedValues)
+    except Exception as e:
+        console.Err.Verbose("Rule Error : ", e)
+        console.Err.Verbose(traceback.format_exc())
+
+
+def RunTokenRules(ruleManager, lexer, stage=STAGE_CONTEXT):
+    """
+    Run the rules on the lines and the tokens.
+    Only the line rules run if the context is not constructed.
+    """
+    try:
+        ruleManager.RunBulkLineRule(lexer)
+    except Exception as e:
+        console.Err.Verbose("Rule Error : ", e)
+        console.Err.Verbose(traceback.format_exc())
+    try:
+        ruleManager.RunFileTextRule(lexer)
+    except Exception as e:
+        console.Err.Verbose("Rule Error : ", e)
+        console.Err.Verbose(traceback.format_exc())
     currentLine = 0
     t = None
     while(True):
@@ -1225,6 +1744,8 @@ def RunRules(ruleManager, lexer):
                 currentLine = t.lineno
                 ruleManager.RunLineRule(
                     lexer, lexer.GetCurTokenLine(), currentLine)
+            if stage != STAGE_CONTEXT:
+                continue
 
             if t.pp == True:
                 ruleManager.RunPreprocessRule(lexer, t.contextStack)
@@ -1249,9 +1770,3 @@ def RunRules(ruleManager, lexer):
         except Exception as e:
             console.Err.Verbose("Rule Error : ", t, t.contextStack, e)
             console.Err.Verbose(traceback.format_exc())
-    try:
-        ruleManager.RunFileEndRule(lexer, os.path.basename(lexer.filename),
-                                   os.path.dirname(lexer.filename))
-    except Exception as e:
-        console.Err.Verbose("Rule Error : ", e)
-        console.Err.Verbose(traceback.format_exc())
@@ -0,0 +1,91 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Client of the daemon mode (see nsiqcppstyle_daemon)
+#
+#   python nsiqcppstyle_client.py --socket=path [nsiqcppstyle options] targets
+#   python nsiqcppstyle_client.py --socket=path --stop
+#
+# The options and the targets are the ones of nsiqcppstyle. The output and
+# the exit code are the same as the command line, but the analysis is done by
+# the daemon started with "nsiqcppstyle --daemon=path". The socket path can be
+# given by the NSIQCPPSTYLE_SOCKET environment variable as well. Only the
+# standard library is imported, so the client starts fast. With --stdin, the
+# standard input of the client is sent as the buffer of --stdin-filename.
+
+import json
+import os
+import socket
+import sys
+
+
+def Request(socketPath, request):
+    """ Send the request to the daemon and return the response """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socketPath)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        return json.loads(client.makefile("rb").readline().decode("utf-8"))
+    finally:
+        client.close()
+
+
+def GetStdinRequest(args):
+    """
+    The daemon doesn't take --stdin. The standard input is sent as the buffer
+    of --stdin-filename, which is given as the target instead.
+    """
+    if "--stdin" not in args:
+        return args, {}
+    stdinFilename = None
+    remainingArgs = []
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        if arg.startswith("--stdin-filename="):
+            stdinFilename = arg[len("--stdin-filename="):]
+        elif arg == "--stdin-filename" and index + 1 < len(args):
+            index += 1
+            stdinFilename = args[index]
+        elif arg != "--stdin":
+            remainingArgs.append(arg)
+        index += 1
+    if stdinFilename is None:
+        # The daemon rejects --stdin without the target to analyze
+        return args, {}
+    return remainingArgs + [stdinFilename], {stdinFilename: sys.stdin.read()}
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv
+    socketPath = os.environ.get("NSIQCPPSTYLE_SOCKET", "")
+    stop = False
+    args = []
+    for arg in argv[1:]:
+        if arg.startswith("--socket="):
+            socketPath = arg[len("--socket="):]
+        elif arg == "--stop":
+            stop = True
+        else:
+            args.append(arg)
+    if not socketPath:
+        sys.stderr.write("The socket path must be given by --socket or NSIQCPPSTYLE_SOCKET\n")
+        return -1
+    if stop:
+        request = {"command": "stop"}
+    else:
+        args, buffers = GetStdinRequest(args)
+        request = {"argv": args, "cwd": os.getcwd(), "buffers": buffers}
+    try:
+        response = Request(socketPath, request)
+    except (OSError, ValueError) as e:
+        sys.stderr.write("The daemon on %s can't be reached (%s)\n" % (socketPath, e))
+        return -1
+    sys.stdout.write(response.get("output", ""))
+    sys.stderr.write(response.get("errorOutput", ""))
+    return response.get("exitCode", -1)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Daemon mode (--daemon)
+#
+# The daemon keeps the interpreter, the modules, the rule manifest and the
+# lexer warm and analyzes the requests received on a Unix domain socket, so
+# the start-up cost isn't paid on every save of the editor or every commit.
+#
+# The request and the response are a JSON object on one line each:
+#
+#   request:  {"argv": [...], "cwd": "...", "buffers": {"path": "content"}}
+#   response: {"output": "...", "errorOutput": "...", "exitCode": 0}
+#
+# The argv is the command line of nsiqcppstyle without the program name, and
+# the output is what the command line prints (e.g. the violations in the
+# --output format). The buffers are analyzed instead of the files at the
+# paths (e.g. the unsaved editor buffers). --daemon, --watch and --stdin
+# can't be given in the argv. {"command": "stop"} stops the daemon. The
+# requests are analyzed one by one, as the analysis state is global to the
+# process.
+
+import io
+import json
+import os
+import socket
+import sys
+import traceback
+
+from nsiqcppstyle_outputer import _consoleOutputer as console
+from nsiqcppstyle_state import _nsiqcppstyle_state
+
+
+class DaemonError(Exception):
+    pass
+
+
+_rejectedOptions = ["daemon", "watch", "stdin"]
+
+
+def Listen(socketPath):
+    """ Bind the socket. The socket left by a daemon which isn't running is removed. """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("Unix domain sockets are not available on this platform")
+    if os.path.exists(socketPath):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socketPath)
+        except OSError:
+            os.remove(socketPath)
+        else:
+            raise DaemonError("A daemon is already running on %s" % socketPath)
+        finally:
+            probe.close()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # The socket is created accessible by the user only. Changing the mode
+    # after the bind would leave a window where others could connect.
+    umask = os.umask(0o177)
+    try:
+        server.bind(socketPath)
+        server.listen(8)
+    except OSError:
+        server.close()
+        raise
+    finally:
+        os.umask(umask)
+    return server
+
+
+def CheckArgv(argv):
+    """
+    The options which would block or replace the daemon (--daemon, --watch and
+    --stdin) are rejected. The abbreviations getopt accepts are rejected too.
+    The client sends the standard input as the buffer of the target instead.
+    """
+    for arg in argv:
+        if arg == "--":
+            break
+        name = arg[2:].split("=", 1)[0]
+        if arg.startswith("--") and name:
+            for rejectedName in _rejectedOptions:
+                if rejectedName.startswith(name):
+                    raise DaemonError("--%s can't be given to the daemon" % rejectedName)
+
+
+def Serve(socketPath, analyze):
+    """
+    Serve the requests until the stop command. analyze is the main function
+    of the command line which is called with the argv of each request.
+    """
+    socketPath = os.path.abspath(socketPath)
+    server = Listen(socketPath)
+    console.Out.Ci("Serving on %s" % socketPath)
+    try:
+        running = True
+        while running:
+            connection, address = server.accept()
+            with connection:
+                try:
+                    request = json.loads(connection.makefile("rb").readline().decode("utf-8"))
+                except ValueError as e:
+                    response = {"output": "", "errorOutput": "Invalid request: %s\n" % e, "exitCode": -1}
+                else:
+                    if isinstance(request, dict) and request.get("command") == "stop":
+                        running = False
+                        response = {"output": "", "errorOutput": "", "exitCode": 0}
+                    else:
+                        response = HandleRequest(request, analyze)
+                try:
+                    connection.sendall((json.dumps(response) + "\n").encode("utf-8"))
+                except OSError:
+                    # The client is gone
+                    pass
+    finally:
+        server.close()
+        if os.path.exists(socketPath):
+            os.remove(socketPath)
+    return 0
+
+
+def HandleRequest(request, analyze):
+    """ Analyze the request as the command line does and return the response """
+    output = io.StringIO()
+    errorOutput = io.StringIO()
+    stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+    cwd = os.getcwd()
+    # The standard input of the client is sent as a buffer
+    sys.stdin = io.StringIO()
+    sys.stdout, sys.stderr = output, errorOutput
+    console.Out.SetStream(output)
+    console.Err.SetStream(errorOutput)
+    try:
+        if not isinstance(request, dict) or not isinstance(request.get("argv", []), list):
+            raise DaemonError("The request should be an object with the argv list")
+        argv = [str(arg) for arg in request.get("argv", [])]
+        CheckArgv(argv)
+        os.chdir(request.get("cwd", cwd))
+        # Nothing is kept from the last request but the loaded modules
+        _nsiqcppstyle_state.__init__()
+        _nsiqcppstyle_state.buffers = dict((os.path.realpath(path), data)
+                                           for path, data in request.get("buffers", {}).items())
+        console.SetLevel(console.Level.Info)
+        try:
+            exitCode = analyze(["nsiqcppstyle"] + argv)
+        except SystemExit as e:
+            exitCode = e.code
+        if exitCode is None:
+            exitCode = 0
+        elif not isinstance(exitCode, int):
+            errorOutput.write("%s\n" % exitCode)
+            exitCode = 1
+    except Exception:
+        errorOutput.write(traceback.format_exc())
+        exitCode = -1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        console.Out.SetStream(stdout)
+        console.Err.SetStream(stderr)
+        _nsiqcppstyle_state.buffers = {}
+        os.chdir(cwd)
+    return {"output": output.getvalue(), "errorOutput": errorOutput.getvalue(), "exitCode": exitCode}
@@ -28,13 +28,22 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 import getopt
+import json
 import re
 import copy
+import time
+import zlib
 import nsiqcppstyle_checker
+import nsiqcppstyle_daemon
+import nsiqcppstyle_git
+import nsiqcppstyle_incremental
+import nsiqcppstyle_parallel
+import nsiqcppstyle_preprocessor
 from nsiqcppstyle_outputer import _consoleOutputer as console
 import nsiqcppstyle_state
 import nsiqcppstyle_rulemanager
 import nsiqcppstyle_reporter
+import nsiqcppstyle_watch
 import updateagent.agent
 from nsiqcppstyle_util import *
 
@@ -76,6 +85,67 @@ Usage: nsiqcppstyle [Options]
                 to create one (e.g., in a read-only file system)
   --var=key: value,key: value
                 provide the variables to customize the rule behavior.
+  -D NAME[=VALUE] / --define=NAME[=VALUE]
+                Define the macro used to evaluate #if, #ifdef and #elif. The tokens
+                in the inactive branches are not analyzed. NAME is defined as 1.
+  -U NAME / --undef=NAME
+                Undefine the macro. The branches depending on the macros which
+                are neither defined nor undefined are all analyzed.
+  -j N / --jobs=N
+                Analyze the files with N processes. 0 uses all CPUs. Default
+                value is 1. The output is the same as the one of 1 process.
+                If a rule keeps the state across files (e.g. RULE_3_2_B),
+                the files are analyzed in 1 process.
+  --manifest=path
+                Analyze only the files which are new or changed since the last run
+                with the same rules and configuration, and record the analyzed
+                files and their violations in the manifest at the path. The
+                violations of the unchanged files are reported from the manifest.
+                It's used instead of basefilelist.txt.
+  --git-diff=base
+                Analyze only the files changed since the base revision (e.g. a
+                branch, a commit or "origin/main...HEAD") in the git repository
+                of the target, and report only the violations on the changed
+                lines. The violations of the rules checking the file as a whole
+                (e.g. the filename) are reported on any changed file.
+  --git-staged  Analyze the staged content of the files changed in the index of the git
+                repository of the target (e.g. in a pre-commit hook), and report only
+                the violations on the staged lines, as --git-diff does.
+  --skip-file-rules
+                With --git-diff or --git-staged, don't apply the rules checking the
+                file as a whole.
+  --files-from=path
+                Analyze the files listed in the file (one path per line, or separated
+                by NUL characters) instead of walking the target directory. "-" reads
+                the list from the standard input. The filters and the extensions are
+                still applied and the listed files outside the targets are ignored.
+  --compile-commands=path
+                Analyze the source files of the compile_commands.json at the path
+                instead of walking the target directory, as --files-from does.
+  --shard=K/N   Analyze only the K-th of N parts of the files of each target directory
+                (e.g. on N CI machines), and keep its results in the manifest
+                given by --manifest. The files are partitioned by the hash of their
+                path relative to the target.
+  --shard-by=path|size
+                With --shard, partition the files by the hash of the path (default)
+                or balance the bytes of the shards by the file sizes.
+  --merge=path  Report the results of the shards kept in the manifest at the path,
+                as if the target directory was analyzed at once. It's given once
+                for each shard. The cross-file rules run on the files of all the
+                shards. The sources are not read again.
+  --stdin --stdin-filename=path
+                Analyze the content read from the standard input (e.g. the unsaved
+                buffer of an editor) as the file at the path. The file doesn't need
+                to exist. The filefilter.txt is looked up in its directory.
+  --watch       Keep running after the analysis of the target directory, analyze
+                the files which are new or changed again and report the new and
+                the fixed violations. Stop it with Ctrl+C. Only the changed files
+                are lexed again, but the map/reduce rules reduce the kept values
+                of all files again on every pass.
+  --daemon=socket
+                Keep running and analyze the requests of nsiqcppstyle_client.py
+                received on the Unix domain socket at the path. The modules, the
+                rule manifest and the lexer are kept warm across the requests.
   --list-rules / -r  Show all rules available.
                 Add file extensions to be counted as assigned languages.
   -s            Assign Filter scope name to be applied in this analysis
@@ -86,6 +156,14 @@ Usage: nsiqcppstyle [Options]
                 "nsiqcppstyle_result.xml" respectively, if you don't provide -o option.
   --ci          Continuous Integration mode. If this mode is on, this tool only reports summary.
   --quiet / -q  Quiet mode. If this mode is on, this tool only reports errors.
+  --rule-budget=<seconds>
+                CPU time budget of each rule per file. The rule which exceeds it
+                is skipped for the rest of the file and "rule skipped (budget)"
+                is reported. Default value is 0 (no limit).
+  --file-budget=<seconds>
+                CPU time budget of all rules per file. When it's exceeded, the
+                remaining rules are skipped for the rest of the file.
+                Default value is 0 (no limit).
 
 * nsiqcppstyle reports coding standard violations on C/C++ source code.
 * In default, it doesn't apply any rules on the source. If you want to apply rule,
@@ -96,6 +174,10 @@ Usage: nsiqcppstyle [Options]
   tool and you can put it in the filefilter.txt. The format is following.
   % key: value
 
+* The macros can be defined and undefined in the filefilter.txt as well.
+  D NAME[=VALUE]
+  U NAME
+
 * If you want to filter in or out some source code files in the target directory
   please locate filefilter.txt file in the target directory in the form of
 
@@ -120,7 +202,9 @@ Usage: nsiqcppstyle [Options]
 * It the basefilelist.txt (pair of filename and filesize) is in the target directory,
   nsiqcppstyle recognizes it and check the file are modified or new.
   And It checks only new and modified file. Please refer the nsiqcollector
-  to generate basefilelist.txt.
+  to generate basefilelist.txt. --manifest keeps the analyzed files by nsiqcppstyle
+  itself, without the filename collisions and the size-only check of basefilelist.txt,
+  and reports the violations of the unchanged files as well.
 
 """)
     sys.exit(0)
@@ -133,9 +217,15 @@ def main(argv=None):
         argv = sys.argv
     try:
         try:
-            opts, args = getopt.getopt(argv[1:], "o: s: hqvrf: ", ["help", "csv",
+            opts, args = getopt.getopt(argv[1:], "o: s: hqvrf: D: U: j: ", ["help", "csv",
                                                                       "output=", "list_rules", "verbose=", "show-url", "no-update",
-                                                                      "ci", "quiet", "var=", "noBase", "filter-string="])
+                                                                      "ci", "quiet", "var=", "noBase", "filter-string=",
+                                                                      "rule-budget=", "file-budget=",
+                                                                      "define=", "undef=", "jobs=", "manifest=",
+                                                                      "git-diff=", "git-staged", "skip-file-rules",
+                                                                      "daemon=", "watch", "stdin", "stdin-filename=",
+                                                                      "files-from=", "compile-commands=",
+                                                                      "shard=", "shard-by=", "merge="])
         except getopt.error as msg:
             raise ShowMessageAndExit(msg)
 
@@ -145,7 +235,24 @@ def main(argv=None):
         filterPath = ""
         filterStringList = []
         noBase = False
+        manifestPath = ""
+        gitBase = ""
+        gitStaged = False
+        skipFileRules = False
+        daemonSocketPath = ""
+        watch = False
+        useStdin = False
+        stdinFilename = ""
+        filesFromPaths = []
+        compileCommandsPaths = []
+        shard = None
+        shardBy = "path"
+        mergePaths = []
+        ruleBudget = 0
+        fileBudget = 0
+        jobs = 1
         varMap = {}
+        macros = {}
         extLangMap = {
             "Html": {"htm", "html"},
             "Java": {"java"},
@@ -185,16 +292,58 @@ def main(argv=None):
                 _nsiqcppstyle_state.output_format = a
             elif o == "--var":
                 varMap = GetCustomKeyValueMap(a, "--var=" + a)
+            elif o in ("-D", "--define"):
+                name, value = nsiqcppstyle_preprocessor.ParseDefine(a)
+                macros[name] = value
+            elif o in ("-U", "--undef"):
+                macros[a.strip()] = None
             elif o == "--ci":
                 console.SetLevel(console.Level.Ci)
             elif o in ("-q", "--quiet"):
                 console.SetLevel(console.Level.Error)
             elif o == "--noBase":
                 noBase = True
+            elif o == "--rule-budget":
+                ruleBudget = GetBudget(a, o)
+            elif o == "--file-budget":
+                fileBudget = GetBudget(a, o)
+            elif o in ("-j", "--jobs"):
+                jobs = GetJobs(a, o)
+            elif o == "--manifest":
+                manifestPath = os.path.abspath(a.strip().replace("\"", ""))
+            elif o == "--git-diff":
+                gitBase = a.strip()
+            elif o == "--git-staged":
+                gitStaged = True
+            elif o == "--skip-file-rules":
+                skipFileRules = True
+            elif o == "--daemon":
+                daemonSocketPath = a.strip()
+            elif o == "--watch":
+                watch = True
+            elif o == "--stdin":
+                useStdin = True
+            elif o == "--stdin-filename":
+                stdinFilename = a.strip().replace("\"", "")
+            elif o == "--files-from":
+                filesFromPaths.append(a.strip().replace("\"", ""))
+            elif o == "--compile-commands":
+                compileCommandsPaths.append(a.strip().replace("\"", ""))
+            elif o == "--shard":
+                shard = GetShard(a, o)
+            elif o == "--shard-by":
+                if a not in ("path", "size"):
+                    ShowMessageAndExit("Error!: %s should be path or size" % o)
+                shardBy = a
+            elif o == "--merge":
+                mergePaths.append(os.path.abspath(a.strip().replace("\"", "")))
 
         console.Out.Ci(title)
         runtimePath = GetRuntimePath()
-        sys.path.append(runtimePath)
+        if runtimePath not in sys.path:
+            sys.path.append(runtimePath)
+        if daemonSocketPath:
+            return nsiqcppstyle_daemon.Serve(daemonSocketPath, main)
         if updateNsiqCppStyle:
             console.Out.Ci(console.Separator)
             try:
@@ -202,7 +351,10 @@ def main(argv=None):
             except Exception as e:
                 console.Out.Error(e)
 
-        targetPaths = GetRealTargetPaths(args)
+        if useStdin:
+            targetPaths = [GetStdinTargetPath(args, stdinFilename)]
+        else:
+            targetPaths = GetRealTargetPaths(args)
         if len(targetPaths) == 0:
             ShowMessageAndExit("No target paths provided")
 
@@ -213,6 +365,23 @@ def main(argv=None):
         # Check: "-f" and "--filter-string" are mutually exclusive
         if filterPath and filterStringList:
             ShowMessageAndExit("'-f' and '--filter-string' command line options are mutually exclusive")
+        if gitBase and gitStaged:
+            ShowMessageAndExit("'--git-diff' and '--git-staged' command line options are mutually exclusive")
+        # The manifest keeps the files of the working tree
+        if manifestPath and gitStaged:
+            ShowMessageAndExit("'--manifest' and '--git-staged' command line options are mutually exclusive")
+        if useStdin and "-" in filesFromPaths:
+            ShowMessageAndExit("'--stdin' and '--files-from=-' command line options are mutually exclusive")
+        listedFiles = None
+        if filesFromPaths or compileCommandsPaths:
+            if gitStaged:
+                ShowMessageAndExit("'--git-staged' and the file lists are mutually exclusive")
+            listedFiles = GetListedFiles(filesFromPaths, compileCommandsPaths)
+        if shard is not None or mergePaths:
+            CheckShardOptions(targetPaths, shard, mergePaths,
+                              manifestPath, gitBase or gitStaged or listedFiles is not None)
+        if watch:
+            CheckWatchOptions(targetPaths, manifestPath or gitBase or gitStaged or listedFiles is not None)
 
         # If multiple target
         if multipleTarget:
@@ -222,6 +391,7 @@ def main(argv=None):
         else:
             outputPath = GetOutputPath(targetPaths[0], outputPath)
         ruleManager = nsiqcppstyle_rulemanager.ruleManager
+        ruleManager.SetTimeBudget(ruleBudget, fileBudget)
 
         cExtendstionSet = extLangMap.get("C/C++")
 
@@ -239,19 +409,15 @@ def main(argv=None):
 
             if filterPath != "":
                 filefilterPath = filterPath
-            elif os.path.isfile(targetPath):
+            elif IsFileTarget(targetPath):
                 filefilterPath = os.path.join(os.path.dirname(targetPath),
                                               "filefilter.txt")
             else:
                 filefilterPath = os.path.join(targetPath, "filefilter.txt")
-            if (noBase):
-                basefilelist = NullBaseFileList()
-            else:
-                basefilelist = BaseFileList(targetPath)
 
             # Get Active Filter
-            filterManager = FilterManager(filefilterPath, filterStringList, extLangMapCopy,
-                                          varMap, filterScope)
+            filterManager = GetFilterManager(filefilterPath, filterStringList, extLangMapCopy,
+                                             varMap, filterScope, macros)
 
             if filterScope != filterManager.GetActiveFilter().filterName:
                 console.Out.Error("\n%s filter scope is not available. Instead, use %s\n"
@@ -265,54 +431,133 @@ def main(argv=None):
                                    False)
                 continue
 
+            changedLines = None
+            stagedBlobs = None
+            if gitBase or gitStaged:
+                changedLines = GetChangedLines(targetPath, gitBase or None)
+                fileRules = ruleManager.GetFileRules(filter.nsiqCppStyleRules)
+                if skipFileRules:
+                    filter.nsiqCppStyleRules = [ruleName for ruleName in filter.nsiqCppStyleRules
+                                                if ruleName not in fileRules]
+                else:
+                    changedLines.fileRules = set(fileRules)
+            if gitStaged:
+                stagedBlobs = GetStagedBlobs(targetPath)
+            _nsiqcppstyle_state.changedLines = changedLines
+
             ruleManager.LoadRules(filter.nsiqCppStyleRules)
             ruleManager.RunSessionStartRules()
 
             _nsiqcppstyle_state.checkers = filter.nsiqCppStyleRules
             _nsiqcppstyle_state.varMap = filter.varMap
+            _nsiqcppstyle_state.macros = filter.macros
+            if (noBase or manifestPath or watch):
+                basefilelist = NullBaseFileList()
+            else:
+                basefilelist = BaseFileList(targetPath)
+            if manifestPath or mergePaths:
+                configHash = nsiqcppstyle_incremental.GetConfigHash(ruleManager.rulesPath, filter.nsiqCppStyleRules,
+                                                                    filter.varMap, filter.macros, version)
+            if manifestPath:
+                manifest = nsiqcppstyle_incremental.FileManifest(manifestPath, targetPath, configHash)
+            elif mergePaths:
+                manifest = GetMergedResults(mergePaths, targetPath, configHash)
+            elif watch:
+                manifest = nsiqcppstyle_watch.WatchedFiles()
+            else:
+                manifest = nsiqcppstyle_incremental.NullFileManifest()
             nsiqcppstyle_reporter.ReportRules(ruleManager.availRuleNames,
                                               filter.nsiqCppStyleRules)
 
             console.Out.Info(filter.to_string())
             console.Out.Ci(console.Separator)
+            targetJobs = jobs
+            serialRules = ruleManager.GetSerialRules()
+            if targetJobs > 1 and serialRules:
+                console.Err.Info("%s keep the state across files. The files are analyzed in 1 process."
+                                 % ", ".join(serialRules))
+                targetJobs = 1
+            # The staged content and the buffers are read by this process
+            if stagedBlobs is not None or _nsiqcppstyle_state.buffers:
+                targetJobs = 1
             console.Out.Verbose(
                 "* run nsiqcppstyle analysis on %s" %
                 targetName)
 
             # if the target is file, analyze it without condition
-            if os.path.isfile(targetPath):
+            if IsFileTarget(targetPath):
                 fileExtension = targetPath[targetPath.rfind('.') + 1:]
-                if fileExtension in cExtendstionSet:
-                    ProcessFile(ruleManager, targetPath, analyzedFiles)
+                if fileExtension in cExtendstionSet and \
+                        (changedLines is None or changedLines.IsChangedFile(targetPath)):
+                    data = ReadFileData(stagedBlobs, targetPath)
+                    if stagedBlobs is None or data is not None:
+                        ProcessFile(ruleManager, targetPath, analyzedFiles, data)
 
             # if the target is directory, analyze it with filefilter and
             # basefilelist
             else:
-                for root, dirs, files in os.walk(targetPath):
-                    if '.cvs' in dirs:
-                        dirs.remove('.cvs')
-                    if '.svn' in dirs:
-                        dirs.remove('.svn')
-                    if '.git' in dirs:
-                        dirs.remove('.git')
-                    if '.hg' in dirs:
-                        dirs.remove('.hg')
-                    for fname in files:
-                        fileExtension = fname[fname.rfind('.') + 1:]
-                        eachFile = os.path.join(root, fname)
-                        basePart = eachFile[len(targetPath):]
-                        if (fileExtension in cExtendstionSet and
-                                basefilelist.IsNewOrChanged(eachFile) and
-                                filter.CheckFileInclusion(basePart)):
-                            nsiqcppstyle_reporter.StartFile(os.path.dirname(basePart),
-                                                            fname)
-                            ProcessFile(ruleManager, eachFile, analyzedFiles)
-                            nsiqcppstyle_reporter.EndFile()
+                # The sizes to schedule the parallel analysis
+                fileSizes = {} if targetJobs > 1 else None
+                if stagedBlobs is not None:
+                    # The staged files may be deleted in the working tree
+                    targetFiles = GetChangedTargetFiles(targetPath, filter, cExtendstionSet,
+                                                        changedLines)
+                elif mergePaths:
+                    targetFiles = GetListedTargetFiles(targetPath, filter, cExtendstionSet,
+                                                       manifest.GetFiles())
+                elif listedFiles is not None:
+                    targetFiles = [eachTarget for eachTarget
+                                   in GetListedTargetFiles(targetPath, filter, cExtendstionSet, listedFiles)
+                                   if os.path.isfile(eachTarget[0]) and
+                                   basefilelist.IsNewOrChanged(eachTarget[0])]
+                else:
+                    targetFiles = list(WalkTargetFiles(targetPath, filter, cExtendstionSet,
+                                                       basefilelist, fileSizes))
+                if changedLines is not None:
+                    targetFiles = [eachTarget for eachTarget in targetFiles
+                                   if changedLines.IsChangedFile(eachTarget[0])]
+                if shard is not None:
+                    targetFiles = SelectShardFiles(targetPath, targetFiles, shard, shardBy)
+                # The buffers are analyzed every time
+                recordedResults = [None if eachFile in _nsiqcppstyle_state.buffers
+                                   else manifest.GetResult(eachFile)
+                                   for eachFile, dirname, fname in targetFiles]
+                changedFiles = [eachFile for (eachFile, dirname, fname), recordedResult
+                                in zip(targetFiles, recordedResults) if recordedResult is None]
+                results = None
+                if targetJobs > 1 and len(changedFiles) > 1:
+                    results = nsiqcppstyle_parallel.AnalyzeFiles(
+                        changedFiles, targetJobs,
+                        nsiqcppstyle_parallel.GetSettings(runtimePath, filter.nsiqCppStyleRules,
+                                                          ruleBudget, fileBudget),
+                        GetFileCosts(changedFiles, fileSizes, manifest))
+                for (eachFile, dirname, fname), recordedResult in zip(targetFiles, recordedResults):
+                    data = ReadFileData(stagedBlobs, eachFile)
+                    if stagedBlobs is not None and data is None:
+                        continue
+                    nsiqcppstyle_reporter.StartFile(dirname, fname)
+                    if recordedResult is not None:
+                        ReplayFile(ruleManager, eachFile, analyzedFiles, recordedResult)
+                    elif results is not None:
+                        result = next(results)
+                        nsiqcppstyle_parallel.WriteResult(result)
+                        analyzedFiles.append(eachFile)
+                        manifest.Record(eachFile, result.violations, result.mappedValues, result.cost)
+                    elif (manifestPath or watch) and data is None:
+                        ProcessRecordedFile(ruleManager, eachFile, analyzedFiles, manifest)
+                    else:
+                        ProcessFile(ruleManager, eachFile, analyzedFiles, data)
+                    nsiqcppstyle_reporter.EndFile()
+                manifest.Save()
+            if stagedBlobs is not None:
+                stagedBlobs.Close()
             ruleManager.RunProjectRules(targetPath)
             nsiqcppstyle_reporter.EndTarget()
 
         nsiqcppstyle_reporter.ReportSummaryToScreen(analyzedFiles,
                                                     _nsiqcppstyle_state, filter)
+        if watch:
+            WatchTarget(ruleManager, targetPaths[0], filter, cExtendstionSet, manifest)
         nsiqcppstyle_reporter.CloseReport(_nsiqcppstyle_state.output_format)
         ruleManager.RunSessionEndRules()
         return _nsiqcppstyle_state.error_count
@@ -325,12 +570,263 @@ def main(argv=None):
 
 # 3
 
-def ProcessFile(ruleManager, file, analyzedFiles):
+# Version control directories which are never analyzed
+prunedDirectories = {".cvs", ".svn", ".git", ".hg"}
+
+
+def WalkTargetFiles(targetPath, filter, extensionSet, basefilelist, fileSizes=None):
+    """
+    Walk the target directory in the same order as os.walk() and yield
+    (path, dirname, filename) of each file to analyze. The dirname is
+    relative to the target (e.g. "/src").
+    The directories which the filter excludes entirely are not visited.
+    The size of each file is kept in fileSizes if it's given.
+    """
+    directories = [targetPath]
+    while directories:
+        root = directories.pop()
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            try:
+                isDirectory = entry.is_dir()
+            except OSError:
+                isDirectory = False
+            if isDirectory:
+                if entry.name not in prunedDirectories and not entry.is_symlink():
+                    subdirectories.append(entry.path)
+                continue
+            fname = entry.name
+            if fname[fname.rfind('.') + 1:] not in extensionSet:
+                continue
+            basePart = entry.path[len(targetPath):]
+            if filter.CheckFileInclusion(basePart) and \
+                    basefilelist.IsNewOrChanged(entry.path, entry):
+                if fileSizes is not None:
+                    try:
+                        fileSizes[entry.path] = entry.stat().st_size
+                    except OSError:
+                        pass
+                yield entry.path, os.path.dirname(basePart), fname
+        for eachDirectory in reversed(subdirectories):
+            if not filter.IsDirectoryExcluded(eachDirectory[len(targetPath):] + os.sep):
+                directories.append(eachDirectory)
+
+
+def GetChangedTargetFiles(targetPath, filter, extensionSet, changedLines):
+    """
+    (path, dirname, filename) of each changed file under the target to
+    analyze, as WalkTargetFiles() does for the files in the directory
+    """
+    return GetListedTargetFiles(targetPath, filter, extensionSet, changedLines.GetFiles())
+
+
+def GetListedTargetFiles(targetPath, filter, extensionSet, files):
+    """
+    (path, dirname, filename) of each listed file under the target to
+    analyze, as WalkTargetFiles() does for the files in the directory
+    """
+    targetFiles = []
+    for eachFile in files:
+        if not eachFile.startswith(targetPath + os.sep):
+            continue
+        basePart = eachFile[len(targetPath):]
+        dirname, fname = os.path.split(basePart)
+        if fname[fname.rfind('.') + 1:] not in extensionSet:
+            continue
+        if prunedDirectories.intersection(dirname.split(os.sep)):
+            continue
+        if filter.CheckFileInclusion(basePart):
+            targetFiles.append((eachFile, dirname, fname))
+    return targetFiles
+
+
+def ProcessFile(ruleManager, file, analyzedFiles, data=None):
     console.Out.Info("Processing: ", file)
-    nsiqcppstyle_checker.ProcessFile(ruleManager, file)
+    nsiqcppstyle_checker.ProcessFile(ruleManager, file, data)
     analyzedFiles.append(file)
 
 
+def RecordFile(ruleManager, file, analyzedFiles, recorder):
+    """
+    Process the file with the recorder and return the values mapped by the
+    map/reduce rules. They're not reduced.
+    """
+    nsiqcppstyle_reporter.StartRecording(recorder)
+    ruleManager.deferReduce = True
+    try:
+        ProcessFile(ruleManager, file, analyzedFiles)
+    finally:
+        ruleManager.deferReduce = False
+        nsiqcppstyle_reporter.StopRecording()
+    return ruleManager.mappedValues
+
+
+def ProcessRecordedFile(ruleManager, file, analyzedFiles, manifest):
+    """
+    Process the file and record its violations in the manifest.
+    The violations found by the reduce of the map/reduce rules depend on
+    the other files. So the reduce runs after the recording.
+    """
+    recorder = nsiqcppstyle_reporter.ViolationRecorder()
+    startTime = time.process_time()
+    mappedValues = RecordFile(ruleManager, file, analyzedFiles, recorder)
+    manifest.Record(file, recorder.violations if recorder.complete else None, mappedValues,
+                    time.process_time() - startTime)
+    nsiqcppstyle_checker.ReduceFile(ruleManager, file, mappedValues)
+
+
+def GetFileCosts(files, fileSizes, manifest):
+    """
+    The estimated cost of each file to dispatch the costliest first: the
+    CPU time of its last analysis kept in the manifest, or its size in
+    bytes scaled by the CPU time per byte of the files analyzed last time.
+    """
+    sizes = []
+    for eachFile in files:
+        size = fileSizes.get(eachFile) if fileSizes is not None else None
+        if size is None:
+            try:
+                size = os.path.getsize(eachFile)
+            except OSError:
+                size = 0
+        sizes.append(size)
+    lastCosts = [manifest.GetCost(eachFile) for eachFile in files]
+    knownCost = sum(cost for cost in lastCosts if cost is not None)
+    knownSize = sum(size for size, cost in zip(sizes, lastCosts) if cost is not None)
+    costPerByte = knownCost / knownSize if knownCost > 0 and knownSize > 0 else 1.0
+    return [cost if cost is not None else size * costPerByte for size, cost in zip(sizes, lastCosts)]
+
+
+def ReplayFile(ruleManager, file, analyzedFiles, recordedResult):
+    """ Report the violations recorded in the manifest without analyzing the file """
+    console.Out.Info("Processing: ", file)
+    nsiqcppstyle_reporter.ReplayViolations(file, recordedResult["violations"])
+    nsiqcppstyle_checker.ReduceFile(ruleManager, file, recordedResult["mappedValues"])
+    analyzedFiles.append(file)
+
+
+def CheckWatchOptions(targetPaths, incremental):
+    if len(targetPaths) != 1 or not os.path.isdir(targetPaths[0]):
+        ShowMessageAndExit("'--watch' needs one target directory")
+    if _nsiqcppstyle_state.output_format not in ("emacs", "vs7", "eclipse"):
+        ShowMessageAndExit("'--watch' writes the violations on the screen. Use emacs, vs7 or eclipse output")
+    if incremental:
+        ShowMessageAndExit("'--watch' can't be used with '--manifest', '--git-diff', '--git-staged', "
+                           "'--files-from' or '--compile-commands'")
+
+
+def CheckShardOptions(targetPaths, shard, mergePaths, manifestPath, listed):
+    for targetPath in targetPaths:
+        if not os.path.isdir(targetPath):
+            ShowMessageAndExit("'--shard' and '--merge' need target directories")
+    if shard is not None and not manifestPath:
+        ShowMessageAndExit("'--shard' needs '--manifest' to keep the results of the shard")
+    if mergePaths and (shard is not None or manifestPath or listed):
+        ShowMessageAndExit("'--merge' can't be used with '--shard', '--manifest', '--git-diff', "
+                           "'--git-staged', '--files-from' or '--compile-commands'")
+
+
+def GetShard(value, where):
+    """ The shard K/N as (K, N) """
+    try:
+        index, count = [int(part) for part in value.split("/")]
+    except ValueError:
+        index, count = 0, 0
+    if not 1 <= index <= count:
+        ShowMessageAndExit(
+            "Error!: The shard (%s) of %s should be K/N (1 <= K <= N)" % (value, where))
+    return index, count
+
+
+def SelectShardFiles(targetPath, targetFiles, shard, shardBy):
+    """
+    The target files of the shard. Each file is in the shard of the stable
+    hash of its path relative to the target. With shardBy "size", the files
+    are assigned largest first to the shard with the fewest bytes so far.
+    Every shard computes the same partition from the same files.
+    """
+    index, count = shard
+    keys = [eachFile[len(targetPath):].replace(os.sep, "/") for eachFile, dirname, fname in targetFiles]
+    if shardBy == "size":
+        sizes = sorted(((os.path.getsize(eachTarget[0]), key) for eachTarget, key in zip(targetFiles, keys)),
+                       key=lambda sizeAndKey: (-sizeAndKey[0], sizeAndKey[1]))
+        loads = [0] * count
+        shards = {}
+        for size, key in sizes:
+            selected = loads.index(min(loads))
+            loads[selected] += size
+            shards[key] = selected
+    else:
+        shards = dict((key, zlib.crc32(key.encode("utf-8")) % count) for key in keys)
+    return [eachTarget for eachTarget, key in zip(targetFiles, keys) if shards[key] == index - 1]
+
+
+def GetMergedResults(mergePaths, targetPath, configHash):
+    try:
+        return nsiqcppstyle_incremental.MergedResults(mergePaths, targetPath, configHash)
+    except nsiqcppstyle_incremental.ManifestError as e:
+        ShowMessageAndExit("Error!: %s" % e, False)
+
+
+def ReduceWatchedFiles(ruleManager, targetPath, watchedFiles):
+    """
+    Reduce the values kept for all files with new map/reduce rules and run
+    the project rules. Their violations are kept, not written.
+
+    The values of all files are reduced again, not only the ones of the
+    changed files. A rule reduces into its own state, which can't take back
+    the values of a file, so the pass costs as many reduce calls as files.
+    """
+    recorder = nsiqcppstyle_watch.ProjectViolationRecorder()
+    nsiqcppstyle_reporter.StartRecording(recorder)
+    try:
+        ruleManager.ResetMapReduceRules()
+        for eachFile in watchedFiles.GetFiles():
+            nsiqcppstyle_checker.ReduceFile(ruleManager, eachFile, watchedFiles.GetMappedValues(eachFile))
+        ruleManager.RunProjectRules(targetPath)
+    finally:
+        nsiqcppstyle_reporter.StopRecording()
+    watchedFiles.projectViolations = recorder.violations
+
+
+def WatchTarget(ruleManager, targetPath, filter, extensionSet, watchedFiles, interval=1.0):
+    """
+    Poll the files of the target until interrupted. The new or changed
+    files are analyzed again and the delta of the violations is reported.
+    """
+    ReduceWatchedFiles(ruleManager, targetPath, watchedFiles)
+    console.Out.Ci(console.Separator)
+    console.Out.Ci("=  Watching %s (Ctrl+C to stop)" % os.path.basename(targetPath))
+    try:
+        while True:
+            sys.stdout.flush()
+            time.sleep(interval)
+            targetFiles = list(WalkTargetFiles(targetPath, filter, extensionSet, NullBaseFileList()))
+            before = watchedFiles.GetViolations()
+            changedFiles, removedFiles = watchedFiles.Update(targetFiles)
+            if not changedFiles and not removedFiles:
+                continue
+            console.Out.Ci(console.Separator)
+            for eachFile in removedFiles:
+                console.Out.Info("Removed: ", eachFile)
+            analyzedFiles = []
+            for eachFile, dirname, fname in changedFiles:
+                recorder = nsiqcppstyle_reporter.ViolationRecorder(False)
+                mappedValues = RecordFile(ruleManager, eachFile, analyzedFiles, recorder)
+                watchedFiles.Record(eachFile, recorder.violations if recorder.complete else None,
+                                    mappedValues)
+            ReduceWatchedFiles(ruleManager, targetPath, watchedFiles)
+            nsiqcppstyle_watch.ReportDelta(before, watchedFiles.GetViolations())
+            nsiqcppstyle_reporter.ReportSummaryToScreen(watchedFiles.GetFiles(), _nsiqcppstyle_state, filter)
+    except KeyboardInterrupt:
+        pass
+
+
 def Update():
     console.Out.Error("Development in progress. Please check manually")
     """
@@ -342,7 +838,7 @@ def Update():
 def GetOutputPath(outputBasePath, outputPath):
     "Returns the LOC and complexity result path"
     if outputPath == "":
-        if os.path.isfile(outputBasePath):
+        if IsFileTarget(outputBasePath):
             outputPath = os.path.dirname(outputBasePath)
         else:
             outputPath = outputBasePath
@@ -363,6 +859,72 @@ def GetRealTargetPaths(args):
                 "Error!: Target directory %s does not exist" % eachTarget)
     return targetPaths
 
+
+def GetListedFiles(filesFromPaths, compileCommandsPaths):
+    """
+    The real paths of the files given by --files-from and --compile-commands
+    without the duplicates, in the order of the lists
+    """
+    listedFiles = {}
+    for filesFromPath in filesFromPaths:
+        for eachFile in ReadFilesFrom(filesFromPath):
+            listedFiles[os.path.realpath(eachFile)] = True
+    for compileCommandsPath in compileCommandsPaths:
+        for eachFile in ReadCompileCommands(compileCommandsPath):
+            listedFiles[os.path.realpath(eachFile)] = True
+    return listedFiles
+
+
+def ReadFilesFrom(filesFromPath):
+    """ The paths separated by the newlines or the NUL characters (e.g. find -print0) """
+    try:
+        if filesFromPath == "-":
+            text = sys.stdin.read()
+        else:
+            with open(filesFromPath) as f:
+                text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        ShowMessageAndExit("Error!: The file list %s can't be read (%s)" % (filesFromPath, e), False)
+    paths = text.split("\0") if "\0" in text else text.splitlines()
+    return [path.strip("\r\n") for path in paths if path.strip()]
+
+
+def ReadCompileCommands(compileCommandsPath):
+    """ The source files of the compilation database. The relative ones are in the directory of the entry. """
+    try:
+        with open(compileCommandsPath) as f:
+            entries = json.load(f)
+    except (OSError, ValueError) as e:
+        ShowMessageAndExit("Error!: %s can't be read (%s)" % (compileCommandsPath, e), False)
+    if not isinstance(entries, list):
+        ShowMessageAndExit("Error!: %s is not a compilation database" % compileCommandsPath, False)
+    baseDirectory = os.path.dirname(os.path.abspath(compileCommandsPath))
+    paths = []
+    for entry in entries:
+        if isinstance(entry, dict) and isinstance(entry.get("file"), str):
+            paths.append(os.path.join(entry.get("directory", baseDirectory), entry["file"]))
+    return paths
+
+
+def GetStdinTargetPath(args, stdinFilename):
+    """
+    The path of the content read from the standard input. The buffer given
+    for the path (e.g. sent to the daemon by the client) is used instead.
+    """
+    if not stdinFilename:
+        ShowMessageAndExit("'--stdin' needs '--stdin-filename'")
+    if len(args) != 0:
+        ShowMessageAndExit("Target paths can't be provided with '--stdin'")
+    targetPath = os.path.realpath(stdinFilename)
+    if targetPath not in _nsiqcppstyle_state.buffers:
+        _nsiqcppstyle_state.buffers[targetPath] = sys.stdin.read()
+    return targetPath
+
+
+def IsFileTarget(targetPath):
+    """ The target is a file or a buffer analyzed as a file """
+    return targetPath in _nsiqcppstyle_state.buffers or os.path.isfile(targetPath)
+
 ##########################################################################
 
 ##############################################################################
@@ -408,13 +970,22 @@ class FilterManager:
             arg = line[1:].strip()
             if arg != "":
                 filter.AddVarMap(arg, "\"" + arg + "\" of filefilter.txt")
+        elif line.startswith("D ") or line.startswith("D\t"):
+            arg = line[1:].strip()
+            if arg != "":
+                filter.AddDefine(arg)
+        elif line.startswith("U ") or line.startswith("U\t"):
+            arg = line[1:].strip()
+            if arg != "":
+                filter.AddUndef(arg)
 
         return filter
 
-    def __init__(self, fileFilterPath, filterStringList, extLangMap, varMap, activeFilterName):
+    def __init__(self, fileFilterPath, filterStringList, extLangMap, varMap, activeFilterName, macros=None):
         self.fileFilterPath = fileFilterPath
         self.baseExtLangMap = extLangMap
         self.baseVarMap = varMap
+        self.baseMacros = macros or {}
         self.filterMap = {FilterManager.defaultFilterName:
                           self.CreateNewFilter(FilterManager.defaultFilterName)}
         filter = self.GetFilter(self.defaultFilterName)
@@ -444,7 +1015,7 @@ class FilterManager:
 
     def CreateNewFilter(self, filterName):
         return Filter(filterName, copy.deepcopy(self.baseExtLangMap),
-                      copy.deepcopy(self.baseVarMap))
+                      copy.deepcopy(self.baseVarMap), copy.deepcopy(self.baseMacros))
 
     def GetFilter(self, filterName):
         if not filterName in self.filterMap:
@@ -460,6 +1031,29 @@ class FilterManager:
         f = open(filterfile, 'r')
         return f
 
+
+_filterManagers = {}
+
+
+def GetFilterManager(fileFilterPath, filterStringList, extLangMap, varMap, activeFilterName, macros=None):
+    """
+    The FilterManager is kept by the filter file path and its modification
+    time, so the daemon and --watch don't parse the filter file again until
+    it's changed. A copy is returned as the filter is changed by the caller.
+    """
+    try:
+        fileStat = os.stat(fileFilterPath)
+        fileVersion = (fileStat.st_mtime_ns, fileStat.st_size)
+    except OSError:
+        fileVersion = None
+    key = (fileVersion, repr((filterStringList, extLangMap, varMap, activeFilterName, macros)))
+    path = os.path.realpath(fileFilterPath)
+    cached = _filterManagers.get(path)
+    if cached is None or cached[0] != key:
+        cached = _filterManagers[path] = (key, FilterManager(fileFilterPath, filterStringList, extLangMap,
+                                                             varMap, activeFilterName, macros))
+    return copy.deepcopy(cached[1])
+
 ##############################################################################
 # Filter
 # - Represent each Filter
@@ -474,11 +1068,15 @@ class Filter:
      - Check if the file is included or not
     """
 
-    def __init__(self, filterName, baseExtLangMap, baseVarMap):
+    def __init__(self, filterName, baseExtLangMap, baseVarMap, baseMacros=None):
         self.extLangMap = baseExtLangMap
         self.varMap = baseVarMap
+        self.macros = baseMacros if baseMacros is not None else {}
+        # The macros given in the command line take precedence
+        self.cmdLineMacros = set(self.macros.keys())
         self.filterName = filterName
         self.filefilter = []
+        self.matcher = None
         self.match = re.compile("^(\\\\|//)")
         self.nsiqCppStyleRules = []
 
@@ -527,6 +1125,7 @@ Current File extension and Language Settings
         if self.CheckExist(inclusion, filterString, startwith):
             self.filefilter.remove([inclusion, filterString, startwith])
         self.filefilter.append([inclusion, filterString, startwith])
+        self.matcher = None
 
     def GetFileFilter(self):
         return self.filefilter
@@ -548,17 +1147,41 @@ Current File extension and Language Settings
                         s = s + "\n"
         return s
 
+    def GetMatcher(self):
+        """
+        The filters compiled to the list of (inclusion, pattern).
+        The consecutive filters of the same inclusion are merged into one
+        pattern and the list starts from the last one, so the first pattern
+        which matches the path is the one of the last matching filter.
+        """
+        if self.matcher is None:
+            runs = []
+            for inclusion, filterString, startwith in self.filefilter:
+                if not runs or runs[-1][0] != inclusion:
+                    runs.append((inclusion, [], []))
+                runs[-1][2 if startwith else 1].append(filterString)
+            self.matcher = [(inclusion, _CompileFilterStrings(substrings, prefixes))
+                            for inclusion, substrings, prefixes in reversed(runs)]
+        return self.matcher
+
+    def IsDirectoryExcluded(self, dirStr):
+        """
+        Check all files under the directory (e.g. "/src/test/") are excluded.
+        The last filter which matches the directory path matches the path of
+        each file under it as well. If it excludes and no include filter
+        follows, no file under the directory can be included.
+        """
+        matcher = self.GetMatcher()
+        if not matcher or matcher[0][0]:
+            return False
+        return matcher[0][1].search(self.NormalizePath(dirStr)) is not None
+
     def CheckFileInclusion(self, fileStr):
         eachfile = self.NormalizePath(fileStr)
-        inclusion = True
-        for eachfilter in self.filefilter:
-            if eachfilter[2] == True:
-                if eachfile.startswith(eachfilter[1]):
-                    inclusion = eachfilter[0]
-            else:
-                if eachfile.find(eachfilter[1]) != -1:
-                    inclusion = eachfilter[0]
-        return inclusion
+        for inclusion, pattern in self.GetMatcher():
+            if pattern.search(eachfile) is not None:
+                return inclusion
+        return True
 
     def GetLangMap(self):
         return self.extLangMap
@@ -582,6 +1205,73 @@ Current File extension and Language Settings
             else:
                 self.varMap[eachVar] = varMap[eachVar]
 
+    def AddDefine(self, define):
+        name, value = nsiqcppstyle_preprocessor.ParseDefine(define)
+        if name not in self.cmdLineMacros:
+            self.macros[name] = value
+
+    def AddUndef(self, name):
+        if name not in self.cmdLineMacros:
+            self.macros[name] = None
+
+
+def GetBudget(value, where):
+    try:
+        budget = float(value)
+    except ValueError:
+        budget = -1
+    if budget < 0:
+        ShowMessageAndExit(
+            "Error!: The budget (%s) of %s should be the seconds (>= 0)" % (value, where))
+    return budget
+
+
+def GetJobs(value, where):
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        ShowMessageAndExit(
+            "Error!: The number of processes (%s) of %s should be an integer (>= 0)" % (value, where))
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return jobs
+
+
+def GetChangedLines(targetPath, base):
+    directory = targetPath if os.path.isdir(targetPath) else os.path.dirname(targetPath)
+    try:
+        return nsiqcppstyle_git.GetChangedLines(directory, base)
+    except nsiqcppstyle_git.GitError as e:
+        ShowMessageAndExit("Error!: The changes since %s can't be taken from git in %s (%s)"
+                           % (base, directory, e), False)
+
+
+def GetStagedBlobs(targetPath):
+    directory = targetPath if os.path.isdir(targetPath) else os.path.dirname(targetPath)
+    try:
+        return nsiqcppstyle_git.StagedBlobs(directory)
+    except nsiqcppstyle_git.GitError as e:
+        ShowMessageAndExit("Error!: The index can't be read from git in %s (%s)" % (directory, e), False)
+
+
+def ReadFileData(stagedBlobs, filename):
+    """
+    The content to analyze instead of the file: the staged content or the
+    buffer given (e.g. by the daemon). None reads the file, or skips it if
+    the staged content can't be read.
+    """
+    if stagedBlobs is None:
+        return _nsiqcppstyle_state.buffers.get(filename)
+    try:
+        return stagedBlobs.Read(filename)
+    except UnicodeDecodeError as e:
+        console.Out.Ci("[ERROR] UnicodeDecodeError in the staged file '%s': %s" % (filename, e))
+    except nsiqcppstyle_git.GitError as e:
+        console.Out.Ci("[ERROR] %s" % e)
+    return None
+
 
 def GetCustomKeyValueMap(keyValuePair, where):
     varMap = {}
@@ -601,6 +1291,41 @@ def GetCustomKeyValueMap(keyValuePair, where):
 ##############################################################################
 
 
+def _CompileFilterStrings(substrings, prefixes):
+    """
+    Compile the filter strings into a regex which finds any of the substrings
+    or matches any of the prefixes at the start of the path.
+    The strings are merged into a trie, so the regex doesn't try each string
+    at each position of the path.
+    """
+    alternatives = []
+    if prefixes:
+        alternatives.append("\\A" + _GetTrieRegex(prefixes))
+    if substrings:
+        alternatives.append(_GetTrieRegex(substrings))
+    return re.compile("|".join("(?:%s)" % each for each in alternatives))
+
+
+def _GetTrieRegex(strings):
+    trie = {}
+    for eachString in strings:
+        node = trie
+        for ch in eachString:
+            node = node.setdefault(ch, {})
+        node[""] = None
+    return _GetTrieNodeRegex(trie)
+
+
+def _GetTrieNodeRegex(node):
+    # A longer string contains the shorter one which ends here
+    if "" in node:
+        return ""
+    alternatives = [re.escape(ch) + _GetTrieNodeRegex(child) for ch, child in sorted(node.items())]
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
 class BaseFileList(object):
     """
      - Represent  basefilelist.txt state
@@ -616,8 +1341,13 @@ class BaseFileList(object):
                     for line in f.readlines():
                         self.baseFileList[line.strip()] = True
 
-    def IsNewOrChanged(self, filename):
-        item = os.path.basename(filename) + str(os.path.getsize(filename))
+    def IsNewOrChanged(self, filename, dirEntry=None):
+        # The size of the os.scandir() entry is kept by the entry
+        if dirEntry is not None:
+            size = dirEntry.stat().st_size
+        else:
+            size = os.path.getsize(filename)
+        item = os.path.basename(filename) + str(size)
         return not self.baseFileList.get(item, False)
 
 
@@ -630,7 +1360,7 @@ class NullBaseFileList(object):
     def __init__(self):
         pass
 
-    def IsNewOrChanged(self, filename):
+    def IsNewOrChanged(self, filename, dirEntry=None):
         return True
 
 
@@ -0,0 +1,138 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Analysis facts
+#
+# A fact is a value derived from the file being analyzed (e.g. the nearest
+# comment in front of a token) which several rules need. Each fact is
+# computed on the first request and kept for the rest of the file, so the
+# rules don't rescan the tokens for the same value.
+#
+#   lexer.GetFact("accessSpecifier", token)
+#
+# A rule declares the facts it uses with ruleManager.RequireFacts() (or the
+# facts attribute of a RuleBase class). The CPU time of the declared facts
+# and their dependencies is shown for each file in the verbose mode, and it
+# isn't charged to the budget of the rule which computes the fact first.
+
+import time
+
+# Fact name -> (provider, dependencies)
+_facts = {}
+
+
+def AddFact(name, provider, dependencies=()):
+    """
+    Register a fact. provider(lexer, *args) computes the value of the fact.
+    The dependencies are the facts used by the provider. They should be
+    registered before.
+    """
+    for eachDependency in dependencies:
+        if eachDependency not in _facts:
+            raise KeyError("Fact '%s' depends on the unknown fact '%s'" % (name, eachDependency))
+    _facts[name] = (provider, tuple(dependencies))
+
+
+def IsFactAvailable(name):
+    return name in _facts
+
+
+def GetDependencies(name):
+    """ The facts used by the fact, directly or through the other facts """
+    dependencies = []
+    for eachDependency in _facts[name][1]:
+        for each in GetDependencies(eachDependency) + [eachDependency]:
+            if each not in dependencies:
+                dependencies.append(each)
+    return dependencies
+
+
+class FileFacts(object):
+    """
+    Facts of a file. Each value is kept by the fact name and the arguments.
+    cost has the CPU time spent for each fact (including its dependencies).
+    totalCost is the CPU time spent for all facts, so the rule which computes
+    a fact first isn't charged for it (see RuleWatchdog).
+    """
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.values = {}
+        self.cost = {}
+        self.totalCost = 0.0
+        self.depth = 0
+
+    def Get(self, name, *args):
+        key = (name,) + args
+        if key in self.values:
+            return self.values[key]
+        provider = _facts[name][0]
+        start = time.process_time()
+        self.depth += 1
+        try:
+            value = provider(self.lexer, *args)
+        finally:
+            self.depth -= 1
+            cost = time.process_time() - start
+            self.cost[name] = self.cost.get(name, 0) + cost
+            if self.depth == 0:
+                self.totalCost += cost
+        self.values[key] = value
+        return value
+
+    def Clear(self):
+        self.values.clear()
+
+##########################################################################
+# Facts
+
+
+def _GetFileExtension(lexer):
+    """ The extension of the file including the dot (e.g. ".h") """
+    return lexer.filename[lexer.filename.rfind("."):]
+
+
+def _GetPreviousComment(lexer, token):
+    """ The nearest comment in front of the token (comments in the directives are skipped) """
+    lexer.PushTokenIndex()
+    lexer._MoveToToken(token)
+    comment = lexer.GetPrevTokenInType("COMMENT")
+    lexer.PopTokenIndex()
+    return comment
+
+
+def _GetAccessSpecifiers(lexer):
+    """ The access specifier tokens of each class and struct block """
+    specifiers = {}
+    for token in lexer.tokenlist:
+        if token.inactive or token.pp == True or token.type not in ["PUBLIC", "PRIVATE", "PROTECTED"]:
+            continue
+        if token.contextStack is None:
+            continue
+        context = token.contextStack.SigPeek()
+        if context is not None and context.type in ["CLASS_BLOCK", "STRUCT_BLOCK"]:
+            specifiers.setdefault(context, []).append(token)
+    return specifiers
+
+
+def _GetAccessSpecifier(lexer, token):
+    """
+    The access specifier (PUBLIC, PRIVATE or PROTECTED) in effect at the token
+    in a class or struct block. None if no access specifier is written before.
+    """
+    if token.contextStack is None:
+        return None
+    specifiers = lexer.GetFact("accessSpecifiers").get(token.contextStack.SigPeek(), [])
+    specifier = None
+    for each in specifiers:
+        if each.lexpos > token.lexpos:
+            break
+        specifier = each.type
+    return specifier
+
+
+AddFact("fileExtension", _GetFileExtension)
+AddFact("previousComment", _GetPreviousComment)
+AddFact("accessSpecifiers", _GetAccessSpecifiers)
+AddFact("accessSpecifier", _GetAccessSpecifier, ["accessSpecifiers"])
+AddFact("functionSignature", lambda lexer, token: lexer.ParseFunctionSignature(token))
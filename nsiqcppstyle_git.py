@@ -0,0 +1,156 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Git integration (--git-diff, --git-staged)
+#
+# The files and the lines changed since the base revision (or staged in the
+# index) are taken from the local git repository. Only the changed files are
+# analyzed and only the violations on the changed lines are reported. The
+# rules which check the file as a whole (e.g. the filename) report on any
+# changed file.
+#
+# The staged content is read from the object store by one "git cat-file
+# --batch" process, so neither a checkout nor a git process per file is needed.
+
+import bisect
+import codecs
+import io
+import os
+import re
+import subprocess
+
+_hunkPattern = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class GitError(Exception):
+    pass
+
+
+def RunGit(directory, args):
+    """ Run the git command in the directory and return the output """
+    try:
+        process = subprocess.run(["git", "-c", "core.quotepath=off"] + args, cwd=directory,
+                                 stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise GitError("git can't be run (%s)" % e)
+    if process.returncode != 0:
+        raise GitError(process.stderr.decode("utf-8", "replace").strip())
+    return process.stdout.decode("utf-8", "replace")
+
+
+def GetTopLevel(directory):
+    return os.path.realpath(RunGit(directory, ["rev-parse", "--show-toplevel"]).strip())
+
+
+def UnquotePath(path):
+    """ Unquote the path which git quotes in C style (e.g. "a\\tb") """
+    if not path.startswith('"'):
+        return path
+    return codecs.escape_decode(path[1:-1].encode("utf-8"))[0].decode("utf-8", "replace")
+
+
+def ParseDiff(text, topLevel):
+    """
+    Get the line ranges added or changed in each file from the output of
+    "git diff -U0". The path is joined to the top level directory.
+    """
+    lineRanges = {}
+    ranges = None
+    for line in text.splitlines():
+        if line.startswith("+++ "):
+            path = UnquotePath(line[4:].rstrip("\t"))
+            if path == "/dev/null":
+                ranges = None
+                continue
+            # The prefix given by --dst-prefix
+            path = path[len("b/"):]
+            ranges = lineRanges.setdefault(os.path.join(topLevel, *path.split("/")), [])
+        elif line.startswith("@@") and ranges is not None:
+            match = _hunkPattern.match(line)
+            if match is None:
+                continue
+            start = int(match.group(1))
+            count = 1 if match.group(2) is None else int(match.group(2))
+            if count > 0:
+                ranges.append((start, start + count - 1))
+    return lineRanges
+
+
+def GetChangedLines(directory, base=None):
+    """
+    The ChangedLines of the repository of the directory since the base
+    revision. The changes staged in the index if the base is None.
+    """
+    topLevel = GetTopLevel(directory)
+    args = ["diff", "--no-color", "--no-ext-diff", "-U0", "-M", "--diff-filter=ACMR",
+            "--src-prefix=a/", "--dst-prefix=b/"]
+    args += [base] if base is not None else ["--cached"]
+    text = RunGit(topLevel, args + ["--"])
+    return ChangedLines(ParseDiff(text, topLevel))
+
+
+class ChangedLines(object):
+    """
+     - Represent the changed files and the changed line ranges of each file
+     - It checks if the violation is reported. The violations of the
+       fileRules are reported on any line of the changed file.
+    """
+
+    def __init__(self, lineRanges, fileRules=()):
+        self.lineRanges = {}
+        for path, ranges in lineRanges.items():
+            ranges = sorted(ranges)
+            self.lineRanges[path] = ([start for start, end in ranges], [end for start, end in ranges])
+        self.fileRules = set(fileRules)
+
+    def IsChangedFile(self, filename):
+        return filename in self.lineRanges
+
+    def GetFiles(self):
+        return sorted(self.lineRanges.keys())
+
+    def IsReported(self, filename, lineno, ruleName):
+        if filename not in self.lineRanges:
+            return False
+        if ruleName in self.fileRules:
+            return True
+        starts, ends = self.lineRanges[filename]
+        index = bisect.bisect_right(starts, lineno) - 1
+        return index >= 0 and lineno <= ends[index]
+
+
+class StagedBlobs(object):
+    """
+     - Read the staged content of the files in the repository of the
+       directory through one long-lived "git cat-file --batch" process
+    """
+
+    def __init__(self, directory):
+        self.topLevel = GetTopLevel(directory)
+        try:
+            self.process = subprocess.Popen(["git", "cat-file", "--batch"], cwd=self.topLevel,
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        except OSError as e:
+            raise GitError("git can't be run (%s)" % e)
+
+    def Read(self, filename):
+        """
+        The staged content of the file decoded as the file is read by
+        CppLexerNavigator (the locale encoding and the universal newlines)
+        """
+        path = os.path.relpath(filename, self.topLevel).replace(os.sep, "/")
+        if "\n" in path:
+            raise GitError("%s can't be read from the index" % path)
+        self.process.stdin.write((":" + path + "\n").encode("utf-8"))
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().decode("utf-8", "replace").split()
+        if len(header) != 3 or header[1] != "blob" or not header[2].isdigit():
+            raise GitError("%s is not staged" % path)
+        blob = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)
+        return io.TextIOWrapper(io.BytesIO(blob)).read()
+
+    def Close(self):
+        self.process.stdin.close()
+        self.process.stdout.close()
+        self.process.wait()
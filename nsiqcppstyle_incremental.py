@@ -0,0 +1,222 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Incremental analysis (--manifest)
+#
+# The manifest keeps the files analyzed by the last run. Each entry has the
+# path relative to the target, the mtime, the size, the hash of the content
+# and the hash of the configuration (the rules, their sources, the variables
+# and the macros) used to analyze the file.
+#
+# A file is unchanged when the configuration is the same and either the mtime
+# and the size are the same (stat only) or the content hash is the same (the
+# file is read only when the mtime has changed).
+#
+# The entry keeps the violations found in the file and the values mapped by
+# the map/reduce rules as well. The unchanged file isn't analyzed. Instead,
+# its violations are reported again and its mapped values are reduced, so
+# the report is the same as the one of the full analysis.
+#
+# The CPU time spent on each file is kept as well. The parallel analysis
+# dispatches the costliest files first (see nsiqcppstyle_parallel).
+#
+# The manifests of the shards (--shard) are merged (--merge) the same way:
+# the violations of each file are reported again and the mapped values of all
+# files are reduced, so the cross-file rules see the files of all shards.
+#
+# The entries of each target are kept by the path of the target relative to
+# the current directory. The targets of the same name in other directories
+# don't share the entries, and the shards run from the same directory (e.g.
+# the root of the checkout) on other machines are merged.
+
+import hashlib
+import json
+import os
+
+MANIFEST_VERSION = 3
+
+
+class ManifestError(Exception):
+    pass
+
+
+def GetConfigHash(rulesPath, ruleNames, varMap, macros, version):
+    """ Hash of the configuration which the results of the analysis depend on """
+    sha = hashlib.sha1()
+    config = {"version": version, "rules": list(ruleNames), "varMap": varMap, "macros": macros}
+    sha.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+    for ruleName in ruleNames:
+        rulePath = os.path.join(rulesPath, ruleName + ".py")
+        if os.path.exists(rulePath):
+            with open(rulePath, "rb") as f:
+                sha.update(f.read())
+    return sha.hexdigest()
+
+
+def GetTargetKey(targetPath):
+    """ The key of the entries of the target in the manifest """
+    try:
+        key = os.path.relpath(os.path.realpath(targetPath), os.path.realpath(os.getcwd()))
+    except ValueError:
+        # On the other drive
+        key = os.path.realpath(targetPath)
+    return key.replace(os.sep, "/")
+
+
+def GetContentHash(filename):
+    sha = hashlib.sha1()
+    with open(filename, "rb") as f:
+        sha.update(f.read())
+    return sha.hexdigest()
+
+
+class FileManifest(object):
+    """
+     - Represent the manifest of a target
+     - It gives the result of the last run if the file is unchanged and
+       records the result of the analyzed files for the next run.
+    """
+
+    def __init__(self, manifestPath, targetPath, configHash):
+        self.manifestPath = manifestPath
+        self.targetPath = targetPath
+        self.targetKey = GetTargetKey(targetPath)
+        self.configHash = configHash
+        self.entries = self.Load().get(self.targetKey, {})
+        # The entries of this run. The files which are not walked are dropped.
+        self.newEntries = {}
+        # The entries of the files to analyze. They're recorded after the analysis.
+        self.pendingEntries = {}
+
+    def Load(self):
+        """ The entries of each target """
+        try:
+            with open(self.manifestPath) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("targets", {})
+
+    def GetKey(self, filename):
+        return filename[len(self.targetPath):].replace(os.sep, "/")
+
+    def GetResult(self, filename):
+        """
+        The entry of the unchanged file which has the violations and the
+        mappedValues of the last run. None if the file should be analyzed.
+        """
+        stat = os.stat(filename)
+        key = self.GetKey(filename)
+        entry = self.entries.get(key)
+        if entry is not None and entry["config"] != self.configHash:
+            entry = None
+        if entry is not None and entry["size"] == stat.st_size and \
+                entry["mtime"] == stat.st_mtime_ns:
+            self.newEntries[key] = entry
+            return entry
+        newEntry = {"mtime": stat.st_mtime_ns, "size": stat.st_size,
+                    "hash": GetContentHash(filename), "config": self.configHash}
+        if entry is not None and entry["size"] == newEntry["size"] and \
+                entry["hash"] == newEntry["hash"]:
+            # Touched, but not changed
+            newEntry["violations"] = entry["violations"]
+            newEntry["mappedValues"] = entry["mappedValues"]
+            if "cost" in entry:
+                newEntry["cost"] = entry["cost"]
+            self.newEntries[key] = newEntry
+            return newEntry
+        self.pendingEntries[key] = newEntry
+        return None
+
+    def GetCost(self, filename):
+        """ The CPU time of the last analysis of the file. None if it's unknown. """
+        return self.entries.get(self.GetKey(filename), {}).get("cost")
+
+    def Record(self, filename, violations, mappedValues, cost=None):
+        """
+        Record the result of the file analyzed. The incomplete result
+        (violations is None) or the mapped values which can't be kept in
+        JSON aren't recorded, so the file is analyzed again.
+        """
+        key = self.GetKey(filename)
+        entry = self.pendingEntries.pop(key, None)
+        if entry is None or violations is None:
+            return
+        try:
+            json.dumps(mappedValues)
+        except (TypeError, ValueError):
+            return
+        entry["violations"] = violations
+        entry["mappedValues"] = mappedValues
+        if cost is not None:
+            entry["cost"] = round(cost, 6)
+        self.newEntries[key] = entry
+
+    def Save(self):
+        targets = self.Load()
+        targets[self.targetKey] = self.newEntries
+        manifest = {"version": MANIFEST_VERSION, "targets": targets}
+        temporaryPath = self.manifestPath + ".tmp"
+        with open(temporaryPath, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(temporaryPath, self.manifestPath)
+
+
+class NullFileManifest(object):
+    """
+     - Represent no manifest. Every file is analyzed.
+    """
+
+    def GetResult(self, filename):
+        return None
+
+    def GetCost(self, filename):
+        return None
+
+    def Record(self, filename, violations, mappedValues, cost=None):
+        pass
+
+    def Save(self):
+        pass
+
+
+class MergedResults(object):
+    """
+     - Represent the results of a target merged from the manifests of the shards
+     - Every file is reported from the manifests. The sources aren't read.
+    """
+
+    def __init__(self, manifestPaths, targetPath, configHash):
+        self.targetPath = targetPath
+        targetKey = GetTargetKey(targetPath)
+        self.entries = {}
+        for manifestPath in manifestPaths:
+            try:
+                with open(manifestPath) as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                raise ManifestError("The shard results %s can't be read (%s)" % (manifestPath, e))
+            if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+                raise ManifestError("%s is not a manifest of this version" % manifestPath)
+            for key, entry in manifest.get("targets", {}).get(targetKey, {}).items():
+                if entry["config"] != configHash:
+                    raise ManifestError("%s was analyzed with other rules or configuration" % manifestPath)
+                self.entries[key] = entry
+
+    def GetFiles(self):
+        """ The files of all shards in the order of the paths """
+        return [self.targetPath + key.replace("/", os.sep) for key in sorted(self.entries)]
+
+    def GetResult(self, filename):
+        return self.entries.get(filename[len(self.targetPath):].replace(os.sep, "/"))
+
+    def GetCost(self, filename):
+        return None
+
+    def Record(self, filename, violations, mappedValues, cost=None):
+        pass
+
+    def Save(self):
+        pass
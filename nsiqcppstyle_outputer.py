@@ -50,6 +50,9 @@ class ConsoleOuputer:
     def IsLevelDisplayed(self, level):
         return level >= self.__level
 
+    def GetLevel(self):
+        return self.__level
+
     def SetLevel(self, level):
         self.__level = level
         self.Out.SetLoggerLevel(level)
@@ -88,6 +91,11 @@ class ConsoleOuputer:
         def SetLoggerLevel(self, level):
             self.__logger.setLevel(level)
 
+        def SetStream(self, output):
+            """ Redirect the output (e.g. to keep it in memory) """
+            for handler in self.__logger.handlers:
+                handler.setStream(output)
+
         def __Format(self, *msgArgs):
             # Format output the same way a direct call to print would
             return ' '.join(str(a) for a in msgArgs)
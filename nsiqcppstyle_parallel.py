@@ -0,0 +1,197 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Parallel analysis (--jobs)
+#
+# The files of a target are analyzed by a pool of worker processes. Each
+# worker loads the rules once and keeps the report of each file (the screen
+# output, the csv / xml report and the error counts) in memory. The main
+# process writes the reports in the order of the files, so the output is the
+# same as the one of the serial analysis.
+#
+# The files are dispatched largest first (by their estimated cost, e.g. the
+# size or the CPU time of the last analysis), so a big file isn't left for the
+# end while the other workers are idle. The big files are dispatched one by
+# one and the small ones in chunks of a similar cost. The idle worker takes the
+# next chunk from the queue of the pool.
+#
+# The map/reduce rules (see MapReduceRule) map each file in the worker and
+# the main process reduces the values. The other rules which keep the state
+# across files can't be split among the workers (see
+# RuleManager.GetSerialRules()). They are analyzed serially.
+
+import csv
+import io
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import nsiqcppstyle_checker
+import nsiqcppstyle_reporter
+import nsiqcppstyle_rulemanager
+from nsiqcppstyle_outputer import _consoleOutputer as console
+from nsiqcppstyle_state import _nsiqcppstyle_state
+
+# The buffers of the worker process
+_output = None
+_errorOutput = None
+_report = None
+
+
+class FileResult(object):
+    """
+    Report of a file analyzed by a worker
+    - output / errorOutput - the text written on stdout / stderr
+    - report - the text written on the csv or xml report
+    - violations - the violations recorded for the incremental analysis
+      (None if a rule was skipped)
+    - cost - the CPU time spent on the file in seconds
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.output = ""
+        self.errorOutput = ""
+        self.report = ""
+        self.errorCount = 0
+        self.errorPerChecker = {}
+        self.errorPerFile = {}
+        self.mappedValues = []
+        self.violations = None
+        self.cost = 0.0
+
+
+def GetSettings(runtimePath, ruleNames, ruleBudget, fileBudget):
+    """ The settings of the main process which the workers need """
+    return {
+        "runtimePath": runtimePath,
+        "ruleNames": list(ruleNames),
+        "ruleBudget": ruleBudget,
+        "fileBudget": fileBudget,
+        "consoleLevel": console.GetLevel(),
+        "outputFormat": _nsiqcppstyle_state.output_format,
+        "showUrl": _nsiqcppstyle_state.showUrl,
+        "varMap": dict(_nsiqcppstyle_state.varMap),
+        "macros": dict(_nsiqcppstyle_state.macros),
+        "changedLines": _nsiqcppstyle_state.changedLines,
+    }
+
+
+def AnalyzeFiles(files, jobs, settings, costs=None):
+    """
+    Analyze the files with the given number of worker processes.
+    Yield the FileResult of each file in the order of the files.
+    costs is the estimated cost of each file. The files are analyzed in
+    the order of the files if it's not given.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    nsiqcppstyle_reporter.FlushReport()
+    with ProcessPoolExecutor(jobs, initializer=_InitWorker, initargs=(settings,)) as executor:
+        futures = {}
+        for chunk in GetChunks(files, jobs, costs):
+            future = executor.submit(_AnalyzeChunk, chunk)
+            for filename in chunk:
+                futures[filename] = future
+        results = {}
+        for filename in files:
+            if filename not in results:
+                results.update((result.filename, result) for result in futures[filename].result())
+            yield results.pop(filename)
+
+
+def GetChunks(files, jobs, costs=None):
+    """
+    Split the files into the chunks dispatched to the workers, the costliest
+    first. A chunk has the files of about 1 / (16 * jobs) of the total cost.
+    """
+    if costs is None:
+        costs = [1] * len(files)
+    order = sorted(range(len(files)), key=lambda index: -costs[index])
+    limit = sum(costs) / (jobs * 16.0)
+    chunks = []
+    chunk = []
+    chunkCost = 0
+    for index in order:
+        if chunk and chunkCost + costs[index] > limit:
+            chunks.append(chunk)
+            chunk = []
+            chunkCost = 0
+        chunk.append(files[index])
+        chunkCost += costs[index]
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def WriteResult(result):
+    """ Write the report of the file as if it were analyzed in this process """
+    sys.stdout.write(result.output)
+    sys.stdout.flush()
+    sys.stderr.write(result.errorOutput)
+    nsiqcppstyle_reporter.WriteReport(result.report)
+    _nsiqcppstyle_state.MergeErrorCount(result.errorCount, result.errorPerChecker,
+                                        result.errorPerFile)
+    nsiqcppstyle_checker.ReduceFile(nsiqcppstyle_rulemanager.ruleManager, result.filename,
+                                    result.mappedValues)
+
+
+def _InitWorker(settings):
+    global _output, _errorOutput, _report
+    if settings["runtimePath"] not in sys.path:
+        sys.path.append(settings["runtimePath"])
+    _output = io.StringIO()
+    _errorOutput = io.StringIO()
+    _report = io.StringIO()
+    sys.stdout = _output
+    console.Out.SetStream(_output)
+    console.Err.SetStream(_errorOutput)
+    console.SetLevel(settings["consoleLevel"])
+
+    _nsiqcppstyle_state.output_format = settings["outputFormat"]
+    _nsiqcppstyle_state.showUrl = settings["showUrl"]
+    _nsiqcppstyle_state.varMap = settings["varMap"]
+    _nsiqcppstyle_state.macros = settings["macros"]
+    _nsiqcppstyle_state.changedLines = settings["changedLines"]
+    _nsiqcppstyle_state.checkers = settings["ruleNames"]
+    if settings["outputFormat"] == "csv":
+        nsiqcppstyle_reporter.writer = csv.writer(_report)
+    else:
+        nsiqcppstyle_reporter.writer = _report
+
+    ruleManager = nsiqcppstyle_rulemanager.ruleManager
+    ruleManager.SetTimeBudget(settings["ruleBudget"], settings["fileBudget"])
+    ruleManager.LoadRules(settings["ruleNames"])
+    ruleManager.deferReduce = True
+
+
+def _AnalyzeChunk(chunk):
+    return [_AnalyzeFile(filename) for filename in chunk]
+
+
+def _AnalyzeFile(filename):
+    for buffer in (_output, _errorOutput, _report):
+        buffer.seek(0)
+        buffer.truncate()
+    _nsiqcppstyle_state.ResetErrorCount()
+
+    console.Out.Info("Processing: ", filename)
+    nsiqcppstyle_reporter.StartRecording()
+    startTime = time.process_time()
+    try:
+        nsiqcppstyle_checker.ProcessFile(nsiqcppstyle_rulemanager.ruleManager, filename)
+    finally:
+        recorder = nsiqcppstyle_reporter.StopRecording()
+    cost = time.process_time() - startTime
+
+    result = FileResult(filename)
+    result.output = _output.getvalue()
+    result.errorOutput = _errorOutput.getvalue()
+    result.report = _report.getvalue()
+    result.errorCount = _nsiqcppstyle_state.error_count
+    result.errorPerChecker = _nsiqcppstyle_state.errorPerChecker
+    result.errorPerFile = _nsiqcppstyle_state.errorPerFile
+    result.mappedValues = nsiqcppstyle_rulemanager.ruleManager.mappedValues
+    if recorder.complete:
+        result.violations = recorder.violations
+    result.cost = cost
+    return result
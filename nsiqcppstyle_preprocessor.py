@@ -0,0 +1,326 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Conditional compilation
+#
+# Evaluates #if / #elif expressions with the macros given by --define / --undef
+# (or "D" / "U" lines of filefilter.txt) to find the inactive branches.
+#
+# The macros are given as a map of the name and the value. None is the value
+# of an undefined macro. A macro which isn't in the map is unknown, and so is
+# an expression which depends on it. The branches of an unknown condition are
+# all analyzed, as if there were no #if at all.
+
+import re
+
+_tokenPattern = re.compile(r"""
+    \s*(
+        0[xX][0-9a-fA-F]+\w*|[0-9]\w*|          # number
+        [A-Za-z_]\w*|                            # identifier
+        '(?:\\.|[^\\'])+'|                       # character
+        &&|\|\||<<|>>|<=|>=|==|!=|[-+*/%()<>!~&|^?:]
+    )""", re.VERBOSE)
+
+_escapes = {"n": 10, "t": 9, "r": 13, "0": 0, "\\": 92, "'": 39, "\"": 34}
+
+
+class ExpressionError(Exception):
+    pass
+
+
+def Tokenize(expression):
+    tokens = []
+    pos = 0
+    expression = expression.strip()
+    while pos < len(expression):
+        match = _tokenPattern.match(expression, pos)
+        if match is None:
+            raise ExpressionError("Unexpected character in '%s'" % expression)
+        tokens.append(match.group(1))
+        pos = match.end()
+    return tokens
+
+
+def ParseDefine(define):
+    """
+    Get the macro name and value from NAME or NAME=VALUE. NAME is defined as 1
+    """
+    if "=" in define:
+        name, value = define.split("=", 1)
+        return name.strip(), value.strip()
+    return define.strip(), "1"
+
+
+def Evaluate(expression, macros):
+    """
+    Evaluate the #if expression with the macros.
+    Return the integer value or None if it's unknown.
+    """
+    try:
+        return _Parser(Tokenize(expression), macros, set()).Parse()
+    except (ExpressionError, ZeroDivisionError, RecursionError):
+        return None
+
+
+class _Parser(object):
+    """
+    Recursive descent parser of the C preprocessor expression.
+    Each method returns the integer value or None (unknown).
+    """
+    _binaryLevels = (
+        ("||",), ("&&",), ("|",), ("^",), ("&",), ("==", "!="),
+        ("<", ">", "<=", ">="), ("<<", ">>"), ("+", "-"), ("*", "/", "%"))
+
+    def __init__(self, tokens, macros, expanding):
+        self.tokens = tokens
+        self.pos = 0
+        self.macros = macros
+        self.expanding = expanding
+
+    def Parse(self):
+        value = self.Conditional()
+        if self.pos != len(self.tokens):
+            raise ExpressionError("Unexpected '%s'" % self.tokens[self.pos])
+        return value
+
+    def Peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def Next(self):
+        token = self.Peek()
+        if token is None:
+            raise ExpressionError("Unexpected end of the expression")
+        self.pos += 1
+        return token
+
+    def Expect(self, token):
+        if self.Next() != token:
+            raise ExpressionError("'%s' is expected" % token)
+
+    def Conditional(self):
+        condition = self.Binary(0)
+        if self.Peek() != "?":
+            return condition
+        self.Next()
+        first = self.Conditional()
+        self.Expect(":")
+        second = self.Conditional()
+        if condition is None:
+            return first if first == second else None
+        return first if condition else second
+
+    def Binary(self, level):
+        if level == len(self._binaryLevels):
+            return self.Unary()
+        left = self.Binary(level + 1)
+        while self.Peek() in self._binaryLevels[level]:
+            op = self.Next()
+            right = self.Binary(level + 1)
+            left = _BinaryOperation(op, left, right)
+        return left
+
+    def Unary(self):
+        token = self.Peek()
+        if token in ("!", "~", "-", "+"):
+            self.Next()
+            value = self.Unary()
+            if value is None:
+                return None
+            if token == "!":
+                return int(not value)
+            if token == "~":
+                return ~value
+            if token == "-":
+                return -value
+            return value
+        return self.Primary()
+
+    def Primary(self):
+        token = self.Next()
+        if token == "(":
+            value = self.Conditional()
+            self.Expect(")")
+            return value
+        if token[0].isdigit():
+            return _ParseNumber(token)
+        if token[0] == "'":
+            return _ParseCharacter(token)
+        if token == "defined":
+            parenthesized = (self.Peek() == "(")
+            if parenthesized:
+                self.Next()
+            name = self.Next()
+            if parenthesized:
+                self.Expect(")")
+            if name not in self.macros:
+                return None
+            return int(self.macros[name] is not None)
+        if token[0].isalpha() or token[0] == "_":
+            return self.Identifier(token)
+        raise ExpressionError("Unexpected '%s'" % token)
+
+    def Identifier(self, name):
+        if self.Peek() == "(":
+            # Function like macro isn't expanded
+            depth = 0
+            while True:
+                token = self.Next()
+                if token == "(":
+                    depth += 1
+                elif token == ")":
+                    depth -= 1
+                    if depth == 0:
+                        return None
+        if name == "true":
+            return 1
+        if name == "false":
+            return 0
+        if name not in self.macros:
+            return None
+        value = self.macros[name]
+        # An undefined identifier is 0 in the #if expression
+        if value is None or name in self.expanding:
+            return 0
+        if value == "":
+            raise ExpressionError("Macro %s is empty" % name)
+        return _Parser(Tokenize(value), self.macros, self.expanding | {name}).Parse()
+
+
+def _BinaryOperation(op, left, right):
+    # The logical operators are known if one side decides the result
+    if op == "&&":
+        if left == 0 or right == 0:
+            return 0
+        if left is None or right is None:
+            return None
+        return 1
+    if op == "||":
+        if (left is not None and left != 0) or (right is not None and right != 0):
+            return 1
+        if left is None or right is None:
+            return None
+        return 0
+    if left is None or right is None:
+        return None
+    if op == "|":
+        return left | right
+    if op == "^":
+        return left ^ right
+    if op == "&":
+        return left & right
+    if op == "==":
+        return int(left == right)
+    if op == "!=":
+        return int(left != right)
+    if op == "<":
+        return int(left < right)
+    if op == ">":
+        return int(left > right)
+    if op == "<=":
+        return int(left <= right)
+    if op == ">=":
+        return int(left >= right)
+    if op == "<<":
+        return left << right
+    if op == ">>":
+        return left >> right
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "*":
+        return left * right
+    # C division truncates toward zero
+    if op == "/":
+        return int(left / right) if right != 0 else _DivisionByZero()
+    return left - right * int(left / right) if right != 0 else _DivisionByZero()
+
+
+def _DivisionByZero():
+    raise ZeroDivisionError()
+
+
+def _ParseNumber(token):
+    number = token.rstrip("uUlL")
+    try:
+        if number.lower().startswith("0x"):
+            return int(number, 16)
+        if len(number) > 1 and number.startswith("0"):
+            return int(number, 8)
+        return int(number)
+    except ValueError:
+        raise ExpressionError("Invalid number '%s'" % token)
+
+
+def _ParseCharacter(token):
+    value = token[1:-1]
+    if value.startswith("\\"):
+        return _escapes.get(value[1:], None) if len(value) == 2 else None
+    if len(value) != 1:
+        return None
+    return ord(value)
+
+
+class ConditionalState(object):
+    """
+    State of the nested #if blocks of a file
+    The conditions are evaluated even without any macro, so the constant ones
+    (e.g. #if 1 ... #else) select the branch. An unknown condition keeps the
+    branch active.
+    """
+
+    def __init__(self, macros):
+        self.macros = macros
+        # (branch is active, a branch is taken (True, False or None for unknown))
+        self.stack = []
+
+    def IsActive(self):
+        return all(active for active, taken in self.stack)
+
+    def Process(self, kind, expression):
+        """
+        Update the state with the directive (if, ifdef, ifndef, elif, else, endif)
+        """
+        if kind in ("if", "ifdef", "ifndef"):
+            if not self.IsActive():
+                self.stack.append((False, True))
+                return
+            condition = self.GetCondition(kind, expression)
+            self.stack.append((condition is not False, condition))
+        elif kind == "elif":
+            if not self.stack:
+                return
+            active, taken = self.stack.pop()
+            if not self.IsActive() or taken is True:
+                self.stack.append((False, True))
+                return
+            condition = self.GetCondition(kind, expression)
+            if condition is True:
+                self.stack.append((True, True))
+            elif condition is False:
+                self.stack.append((False, taken))
+            else:
+                self.stack.append((True, None))
+        elif kind == "else":
+            if not self.stack:
+                return
+            active, taken = self.stack.pop()
+            self.stack.append((taken is not True, True))
+        elif kind == "endif":
+            if self.stack:
+                self.stack.pop()
+
+    def GetCondition(self, kind, expression):
+        """ True, False or None (unknown) """
+        if kind in ("ifdef", "ifndef"):
+            name = expression.strip()
+            if name not in self.macros:
+                return None
+            defined = self.macros[name] is not None
+            return defined if kind == "ifdef" else not defined
+        value = Evaluate(expression, self.macros)
+        if value is None:
+            return None
+        return value != 0
@@ -44,17 +44,18 @@ def PrepareReport(outputPath, format):
     Set up sth like report headers
     """
     global writer
+    global csvfile
     if format == "csv":
         if os.path.isdir(outputPath):
             outputPath = os.path.join(outputPath, "nsiqcppstyle_report.csv")
-        csvfile = open(outputPath, "wb")
+        csvfile = open(outputPath, "w", newline="")
         writer = csv.writer(csvfile)
         writer.writerow(("File", "Line", "Column",
                          "Message", "Rule", "Rule Url"))
     elif format == "xml":
         if os.path.isdir(outputPath):
             outputPath = os.path.join(outputPath, "nsiqcppstyle_report.xml")
-        writer = open(outputPath, "wb")
+        writer = open(outputPath, "w")
         writer.write("<?xml version='1.0'?>\n<checkstyle version='4.4'>\n")
 
 
@@ -104,6 +105,30 @@ def CloseReport(format):
         global writer
         writer.write("</checkstyle>\n")
         writer.close()
+    elif format == "csv":
+        csvfile.close()
+
+
+def FlushReport():
+    """
+    Flush the report. The worker processes forked with the unflushed
+    report would write it again.
+    """
+    if _nsiqcppstyle_state.output_format == 'csv':
+        csvfile.flush()
+    elif _nsiqcppstyle_state.output_format == 'xml':
+        writer.flush()
+
+
+def WriteReport(text):
+    """
+    Write the report text of a file analyzed by a worker process
+    (see nsiqcppstyle_parallel) to the csv or xml report.
+    """
+    if _nsiqcppstyle_state.output_format == 'csv':
+        csvfile.write(text)
+    elif _nsiqcppstyle_state.output_format == 'xml':
+        writer.write(text)
 ##########################################################################
 
 # ruleMap = {}
@@ -212,31 +237,109 @@ def ErrorInternal(t, ruleName, message):
         return
     if nsiqcppstyle_checker.Search(r"//\s*NS", t.line) is None and \
             not _nsiqcppstyle_state.CheckRuleSuppression(ruleName):
-        _nsiqcppstyle_state.IncrementErrorCount(ruleName, t.filename)
-        url = ""
-        if _nsiqcppstyle_state.showUrl:
-            url = "http://nsiqcppstyle.appspot.com/rule_doc/" + ruleName
-        if _nsiqcppstyle_state.output_format == 'emacs':
-            sys.stdout.write('%s:%s:  %s  [%s] %s\n' % (t.filename, t.lineno,
-                                                        message, ruleName, url))
-        elif _nsiqcppstyle_state.output_format == 'vs7':
-            sys.stdout.write('%s(%s, %s):  %s  [%s] %s\n' % (t.filename, t.lineno,
-                                                             t.column, message, ruleName, url))
-        elif _nsiqcppstyle_state.output_format == 'eclipse':
-            sys.stdout.write('  File "%s", line %d %s (%s)\n' %
-                             (t.filename, t.lineno, message, ruleName))
-        elif _nsiqcppstyle_state.output_format == 'csv':
-            global writer
-            writer.writerow(
-                (t.filename, t.lineno, t.column, message, ruleName, url))
-        elif _nsiqcppstyle_state.output_format == 'xml':
-            writer.write("""<error line='%d' col='%d' severity='warning' message='%s' source='%s'/>\n""" %
-                         (t.lineno, t.column, escape(message).replace("'", "\""), ruleName))
+        if recorder is not None:
+            recorder.Add(t.filename, t.lineno, t.column, ruleName, message)
+            if not recorder.write:
+                return
+        WriteError(t.filename, t.lineno, t.column, ruleName, message)
+
+
+def WriteError(filename, lineno, column, ruleName, message):
+    """
+    Count and write the violation which is not suppressed
+    """
+    changedLines = _nsiqcppstyle_state.changedLines
+    if changedLines is not None and not changedLines.IsReported(filename, lineno, ruleName):
+        return
+    _nsiqcppstyle_state.IncrementErrorCount(ruleName, filename)
+    url = ""
+    if _nsiqcppstyle_state.showUrl:
+        url = "http://nsiqcppstyle.appspot.com/rule_doc/" + ruleName
+    if _nsiqcppstyle_state.output_format == 'emacs':
+        sys.stdout.write('%s:%s:  %s  [%s] %s\n' % (filename, lineno,
+                                                    message, ruleName, url))
+    elif _nsiqcppstyle_state.output_format == 'vs7':
+        sys.stdout.write('%s(%s, %s):  %s  [%s] %s\n' % (filename, lineno,
+                                                         column, message, ruleName, url))
+    elif _nsiqcppstyle_state.output_format == 'eclipse':
+        sys.stdout.write('  File "%s", line %d %s (%s)\n' %
+                         (filename, lineno, message, ruleName))
+    elif _nsiqcppstyle_state.output_format == 'csv':
+        writer.writerow(
+            (filename, lineno, column, message, ruleName, url))
+    elif _nsiqcppstyle_state.output_format == 'xml':
+        writer.write("""<error line='%d' col='%d' severity='warning' message='%s' source='%s'/>\n""" %
+                     (lineno, column, escape(message).replace("'", "\""), ruleName))
+
+
+def ReplayViolations(filename, violations):
+    """
+    Write the violations recorded by the last analysis of the file
+    (see ViolationRecorder)
+    """
+    for lineno, column, ruleName, message in violations:
+        WriteError(filename, lineno, column, ruleName, message)
 
 
 Error = ErrorInternal
 
 
+def ReportRuleSkipped(filename, ruleName, message):
+    """
+    Report that the rule is not applied on the rest of the file.
+    It's a diagnostic, not a violation. So it's not counted as an error.
+    """
+    if ruleName.startswith("rules."):
+        ruleName = ruleName[6:]
+    if recorder is not None:
+        recorder.complete = False
+    if _nsiqcppstyle_state.output_format == 'emacs':
+        sys.stdout.write('%s:%s:  %s  [%s]\n' % (filename, 1, message, ruleName))
+    elif _nsiqcppstyle_state.output_format == 'vs7':
+        sys.stdout.write('%s(%s, %s):  %s  [%s]\n' % (filename, 1, 0, message, ruleName))
+    elif _nsiqcppstyle_state.output_format == 'eclipse':
+        sys.stdout.write('  File "%s", line %d %s (%s)\n' %
+                         (filename, 1, message, ruleName))
+    elif _nsiqcppstyle_state.output_format == 'csv':
+        writer.writerow((filename, 1, 0, message, ruleName, ""))
+    elif _nsiqcppstyle_state.output_format == 'xml':
+        writer.write("""<error line='%d' col='%d' severity='info' message='%s' source='%s'/>\n""" %
+                     (1, 0, escape(message).replace("'", "\""), ruleName))
+
+
+class ViolationRecorder(object):
+    """
+    The violations reported while a file is analyzed, kept for the
+    incremental analysis. They're not complete if a rule was skipped.
+    The recorded violations are not written if write is False.
+    """
+
+    def __init__(self, write=True):
+        self.violations = []
+        self.complete = True
+        self.write = write
+
+    def Add(self, filename, lineno, column, ruleName, message):
+        self.violations.append([lineno, column, ruleName, message])
+
+
+# The recorder of the file being analyzed
+recorder = None
+
+
+def StartRecording(newRecorder=None):
+    global recorder
+    recorder = newRecorder if newRecorder is not None else ViolationRecorder()
+    return recorder
+
+
+def StopRecording():
+    global recorder
+    stopped = recorder
+    recorder = None
+    return stopped
+
+
 class DummyToken:
     def __init__(self, filename, line, lineno, column):
         self.filename = filename
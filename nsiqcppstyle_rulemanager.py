@@ -25,7 +25,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import sre_compile
+import importlib
+import re
+import time
+import nsiqcppstyle_facts
+import nsiqcppstyle_rulemanifest
 from nsiqcppstyle_outputer import _consoleOutputer as console
 from nsiqcppstyle_util import *  # @UnusedWildImport
 from typing import Callable
@@ -34,20 +38,14 @@ from nsiqcppstyle_types import *
 
 class RuleManager:
     def __init__(self, runtimePath):
-        self.availRuleNames = []
-        basePath = os.path.join(runtimePath, "rules")
-        ruleFiles = os.listdir(basePath)
-        rulePattern = sre_compile.compile(r"^(.*)\.py$")
-        for eachRuleFile in ruleFiles:
-            if os.path.isfile(os.path.join(basePath, eachRuleFile)):
-                ruleMatch = rulePattern.match(eachRuleFile)
-                if ruleMatch is not None and eachRuleFile.find(
-                        "__init__") == -1:
-                    ruleName = ruleMatch.group(1)
-                    self.availRuleNames.append(ruleName)
+        self.rulesPath = os.path.join(runtimePath, "rules")
+        self.manifest = nsiqcppstyle_rulemanifest.LoadManifest(self.rulesPath)
+        self.availRuleNames = sorted(self.manifest.keys())
         self.availRuleCount = len(self.availRuleNames)
         self.availRuleModules = {}
         self.loadedRule = []
+        # The rule list of the loaded rules. None if the registered rules may differ.
+        self.loadedRuleNames = None
         self.rules = []
         self.preprocessRules = []
         self.commentRules = []
@@ -56,119 +54,283 @@ class RuleManager:
         self.typeNameRules = []
         self.typeScopeRules = []
         self.lineRules = []
+        self.bulkLineRules = []
+        self.fileTextRules = []
+        self.fileTextScanner = None
         self.fileEndRules = []
         self.fileStartRules = []
         self.sessionEndRules = []
         self.sessionStartRules = []
         self.projectRules = []
-        self.rollBackImporter = None
-#       self.LoadAllRules()
+        self.mapReduceRules = []
+        # The values mapped from the last file by the map/reduce rules.
+        # The worker of the parallel analysis defers the reduce to the main process.
+        self.mappedValues = []
+        self.deferReduce = False
+        self.ruleClasses = []
+        self.fileRuleBindings = []
+        self.requiredFacts = set()
+        self.watchdog = None
 
     def LoadRules(self, checkingRuleNames):
         """
         Load Rules. It resets rule before loading rules
+        Only the given rules are imported.
+        The rules are kept if the same rules are loaded already (e.g. for the
+        last target) and none of them keeps the state across files. Only
+        their state is reset (see ResetRuleState).
         """
-        self.ResetRules()
-        self.ResetRegisteredRules()
-        if self.rollBackImporter is not None:
-            self.rollBackImporter.uninstall()
-
-        self.rollBackImporter = RollbackImporter()
+        keepRules = self.IsRuleListLoaded(checkingRuleNames)
+        if keepRules:
+            self.ResetRuleState()
+        else:
+            self.ResetRules()
+            self.ResetRegisteredRules()
         console.Out.Ci(console.Separator)
 
         for ruleName in checkingRuleNames:
-            count = self.availRuleNames.count(ruleName)
-            if count == 0:
+            if not self.IsRuleAvailable(ruleName):
                 console.Out.Error(
                     "%s does not exist or incompatible." % ruleName)
                 continue
             else:
                 console.Out.Info("  - ", ruleName, "is applied.")
-            ruleModule = __import__("rules." + ruleName)
+            if keepRules:
+                continue
+            # A rule module imported elsewhere (e.g. by a unit test) is imported again to register it
+            sys.modules.pop("rules." + ruleName, None)
+            ruleModule = importlib.import_module("rules." + ruleName)
             self.loadedRule.append(ruleModule)
+        self.loadedRuleNames = list(checkingRuleNames)
         if len(self.loadedRule) == 0:
             console.Out.Ci(
                 "  No Rule is specified. Please configure rules in filefilter.txt.")
         console.Out.Ci(console.Separator)
 
+    def IsRuleListLoaded(self, checkingRuleNames):
+        """
+        Check the rules are loaded and registered as they were by the last
+        LoadRules() and they keep no state across files but the values of
+        the map/reduce rules. The modules of the serial rules (module globals,
+        session instances) are imported again to reset their state.
+        """
+        if self.loadedRuleNames != list(checkingRuleNames) or self.GetSerialRules():
+            return False
+        return all(sys.modules.get(ruleModule.__name__) is ruleModule for ruleModule in self.loadedRule)
+
+    def ResetRuleState(self):
+        """ Reset the state which the loaded rules keep for a target without importing them again """
+        self.ResetMapReduceRules()
+        self.mappedValues = []
+        self._DropFileRuleInstances()
+
+    def IsRuleAvailable(self, ruleName):
+        """
+        Check the rule is in the manifest. A rule which is not in the
+        manifest yet (e.g. a newly added custom rule) is available as well.
+        """
+        if ruleName in self.manifest:
+            return True
+        return os.path.isfile(os.path.join(self.rulesPath, ruleName + ".py"))
+
+    def GetRequiredStage(self):
+        """
+        Get the analysis stage (see nsiqcppstyle_rulemanifest.STAGES) which
+        the registered rules need. A rule which is not in the manifest
+        needs the full context. The kind of each registered callback needs
+        its stage at least, even if the manifest says otherwise.
+        """
+        stages = nsiqcppstyle_rulemanifest.STAGES
+        ruleObjects = []
+        for ruleClass in self.ruleClasses:
+            for methodName, kind in _fileCallbacks:
+                if getattr(ruleClass, methodName) is not getattr(RuleBase, methodName):
+                    ruleObjects.append((ruleClass, kind))
+        for kind in set(nsiqcppstyle_rulemanifest._addMethodKinds.values()):
+            for rule in getattr(self, kind):
+                ruleObjects.append((rule[1] if kind == "fileTextRules" else rule, kind))
+        stage = nsiqcppstyle_rulemanifest.STAGE_FILENAME
+        for ruleObject, kind in ruleObjects:
+            moduleName = ruleObject.__module__
+            ruleStage = nsiqcppstyle_rulemanifest.STAGE_CONTEXT
+            if moduleName.startswith("rules."):
+                ruleStage = self.manifest.get(moduleName[len("rules."):], {}).get("stage", ruleStage)
+            kindStage = nsiqcppstyle_rulemanifest.GetKindStage(kind)
+            for each in (ruleStage, kindStage):
+                if stages.index(each) > stages.index(stage):
+                    stage = each
+        return stage
+
+    def GetSerialRules(self):
+        """
+        Get the loaded rules which can't run in the parallel workers
+        (see nsiqcppstyle_parallel). A rule which is not in the manifest
+        is regarded as serial.
+        """
+        serialRules = []
+        for ruleModule in self.loadedRule:
+            ruleName = ruleModule.__name__[len("rules."):]
+            if not self.manifest.get(ruleName, {}).get("parallel", False):
+                serialRules.append(ruleName)
+        return serialRules
+
+    def GetFileRules(self, ruleNames):
+        """
+        Get the rules which check the file as a whole without reading it
+        (the filename stage), e.g. the filename rules.
+        """
+        return [ruleName for ruleName in ruleNames
+                if self.manifest.get(ruleName, {}).get("stage") == nsiqcppstyle_rulemanifest.STAGE_FILENAME]
+
     def ResetRules(self):
+        """
+        Unload the loaded rule modules so that they are registered again
+        when they are loaded next time.
+        """
+        for ruleModule in self.loadedRule:
+            sys.modules.pop(ruleModule.__name__, None)
         self.loadedRule = []
+        self.loadedRuleNames = None
 
     ##########################################################################
     # Rule Runner
     ##########################################################################
     def RunPreprocessRule(self, lexer, contextStack):
         """ Run rules which runs in the preprecessor blocks """
-        for preprocessRule in self.preprocessRules:
-            data = lexer.Backup()
-            preprocessRule(lexer, contextStack)
-            lexer.Restore(data)
+        self._RunRules(self.preprocessRules, lexer, contextStack)
 
     def RunCommentRule(self, lexer, token):
         """ Rule when a comment is encountered """
-        for eachCommentRule in self.commentRules:
-            data = lexer.Backup()
-            eachCommentRule(lexer, token)
-            lexer.Restore(data)
+        self._RunRules(self.commentRules, lexer, token)
 
     def RunFunctionNameRule(self, lexer, functionFullName,
                             decl, contextStack, functionContext):
         """ Run rules which runs on the function name """
-        for eachFunctionNameRule in self.functionNameRules:
-            data = lexer.Backup()
-            eachFunctionNameRule(lexer, functionFullName,
-                                 decl, contextStack, functionContext)
-            lexer.Restore(data)
+        self._RunRules(self.functionNameRules, lexer, functionFullName,
+                       decl, contextStack, functionContext)
 
     def RunFunctionScopeRule(self, lexer, contextStack):
         """ Run rules which runs in the function blocks """
-        for eachFunctionScopeRule in self.functionScopeRules:
-            data = lexer.Backup()
-            eachFunctionScopeRule(lexer, contextStack)
-            lexer.Restore(data)
+        self._RunRules(self.functionScopeRules, lexer, contextStack)
 
     def RunTypeNameRule(self, lexer, typeName, typeFullName,
                         decl, contextStack, typeContext):
         """ Run rules which runs on the type names """
-        for typeNameRule in self.typeNameRules:
-            data = lexer.Backup()
-            typeNameRule(lexer, typeName, typeFullName,
-                         decl, contextStack, typeContext)
-            lexer.Restore(data)
+        self._RunRules(self.typeNameRules, lexer, typeName, typeFullName,
+                       decl, contextStack, typeContext)
 
     def RunTypeScopeRule(self, lexer, contextStack):
         """ Run rules which runs in the type blocks """
-        for typeScopeRule in self.typeScopeRules:
-            data = lexer.Backup()
-            typeScopeRule(lexer, contextStack)
-            lexer.Restore(data)
+        self._RunRules(self.typeScopeRules, lexer, contextStack)
 
     def RunRule(self, lexer, contextStack):
         """ Run rules which runs in any tokens """
-        for rule in self.rules:
-            data = lexer.Backup()
-            rule(lexer, contextStack)
-            lexer.Restore(data)
+        self._RunRules(self.rules, lexer, contextStack)
 
     def RunLineRule(self, lexer, line, lineno):
         """ Run rules which runs in each lines. """
-        for lineRule in self.lineRules:
-            data = lexer.Backup()
-            lineRule(lexer, line, lineno)
-            lexer.Restore(data)
+        self._RunRules(self.lineRules, lexer, line, lineno)
+
+    def RunBulkLineRule(self, lexer):
+        """ Run rules which runs once on the line table of the file. """
+        if self.bulkLineRules:
+            self._RunRules(self.bulkLineRules, lexer, lexer.GetLineTable())
+
+    def RunFileTextRule(self, lexer):
+        """
+        Run rules which search the text of the file.
+        The patterns of all rules are combined and the file is scanned once.
+        Each rule gets its own matches as if it searched the file alone.
+        """
+        if not self.fileTextRules:
+            return
+        if self.fileTextScanner is None:
+            self.fileTextScanner = self._CombineFileTextPatterns()
+        data = lexer.data
+        if self.fileTextScanner is False:
+            # The patterns can't be combined. Each pattern scans the file.
+            for start, index, match in self._SearchFileTextPatterns(data):
+                self._RunRules([self.fileTextRules[index][1]], lexer, match, lexer.GetTokenAt(start),
+                               lexer.GetLineNumberAt(start))
+            return
+        nextPos = [0] * len(self.fileTextRules)
+        pos = 0
+        while True:
+            found = self.fileTextScanner.search(data, pos)
+            if found is None:
+                break
+            start = found.start()
+            for index, (regex, rule) in enumerate(self.fileTextRules):
+                if nextPos[index] > start:
+                    continue
+                match = regex.match(data, start)
+                if match is None:
+                    continue
+                nextPos[index] = max(match.end(), start + 1)
+                self._RunRules([rule], lexer, match, lexer.GetTokenAt(start),
+                               lexer.GetLineNumberAt(start))
+            pos = start + 1
+
+    def _CombineFileTextPatterns(self):
+        """
+        Return the combined pattern of the text rules, or False if the
+        patterns can't be combined (e.g. the inline flags or the same group
+        name in two patterns).
+        """
+        try:
+            return re.compile("|".join("(?:%s)" % regex.pattern for regex, rule in self.fileTextRules),
+                              re.MULTILINE)
+        except re.error:
+            return False
+
+    def _SearchFileTextPatterns(self, data):
+        """ The (start, rule index, match) of each pattern, in the order of the combined scan """
+        matches = []
+        for index, (regex, rule) in enumerate(self.fileTextRules):
+            pos = 0
+            while pos <= len(data):
+                match = regex.search(data, pos)
+                if match is None:
+                    break
+                matches.append((match.start(), index, match))
+                pos = max(match.end(), match.start() + 1)
+        matches.sort(key=lambda found: found[:2])
+        return matches
 
     def RunFileEndRule(self, lexer, filename, dirname):
         """ Run rules which runs at the end of files. """
-        for fileEndRule in self.fileEndRules:
-            data = lexer.Backup()
-            fileEndRule(lexer, filename, dirname)
-            lexer.Restore(data)
+        try:
+            self._RunRules(self.fileEndRules, lexer, filename, dirname)
+        finally:
+            self._DropFileRuleInstances()
+            self._ShowFactCost(lexer)
+            lexer.facts.Clear()
+
+    def _ShowFactCost(self, lexer):
+        """ Show the CPU time of the declared facts on the file in the verbose mode """
+        if not console.IsLevelDisplayed(console.Level.Verbose):
+            return
+        for name in sorted(self.requiredFacts):
+            console.Out.Verbose("Fact Cost : %s %.6fs" % (name, lexer.facts.cost.get(name, 0.0)))
 
     def RunFileStartRule(self, lexer, filename, dirname):
         """ Run rules which runs at the start of files. """
-        for fileStartRule in self.fileStartRules:
+        self._CreateFileRuleInstances()
+        if self.watchdog is not None:
+            self.watchdog.StartFile(lexer.filename)
+        self._RunRules(self.fileStartRules, lexer, filename, dirname)
+
+    def _RunRules(self, ruleList, lexer, *args):
+        """
+        Run each rule with the given arguments. The lexer position is restored
+        after each rule. If the time budget is set, the watchdog runs it.
+        """
+        if self.watchdog is not None:
+            self.watchdog.RunRules(ruleList, lexer, args)
+            return
+        for rule in ruleList:
             data = lexer.Backup()
-            fileStartRule(lexer, filename, dirname)
+            rule(lexer, *args)
             lexer.Restore(data)
 
     def RunSessionEndRules(self):
@@ -185,6 +347,36 @@ class RuleManager:
         """ Run rules which runs once a project. """
         for projectRule in self.projectRules:
             projectRule(targetName)
+        for mapReduceRule in self.mapReduceRules:
+            mapReduceRule.report(targetName)
+
+    def ResetMapReduceRules(self):
+        """
+        Replace the map/reduce rules by new instances, so that the values
+        of all files can be reduced again (e.g. --watch)
+        """
+        self.mapReduceRules[:] = [mapReduceRule.__class__() for mapReduceRule in self.mapReduceRules]
+
+    def RunMapRules(self, lexer, filename, dirname):
+        """ Map the file for the map/reduce rules. The values are kept in mappedValues. """
+        self.mappedValues = [mapReduceRule.map(lexer, filename, dirname)
+                             for mapReduceRule in self.mapReduceRules]
+
+    def RunReduceRules(self, filename, mappedValues):
+        """ Reduce the values mapped from the file. It runs in the main process. """
+        for mapReduceRule, value in zip(self.mapReduceRules, mappedValues):
+            if value is not None:
+                mapReduceRule.reduce(filename, value)
+
+    def SetTimeBudget(self, ruleBudget, fileBudget):
+        """
+        Set the CPU time budget in seconds which a rule (ruleBudget) and all
+        rules (fileBudget) may spend on a file. 0 means no limit.
+        """
+        if ruleBudget > 0 or fileBudget > 0:
+            self.watchdog = RuleWatchdog(ruleBudget, fileBudget)
+        else:
+            self.watchdog = None
 
     ##########################################################################
     # Rule Resister Methods
@@ -193,9 +385,13 @@ class RuleManager:
     def ResetRegisteredRules(self):
         """ Reset all registered rules. """
 
+        self.loadedRuleNames = None
         self.functionNameRules.clear()
         self.functionScopeRules.clear()
         self.lineRules.clear()
+        self.bulkLineRules.clear()
+        self.fileTextRules.clear()
+        self.fileTextScanner = None
         self.rules.clear()
         self.typeNameRules.clear()
         self.typeScopeRules.clear()
@@ -204,8 +400,13 @@ class RuleManager:
         self.sessionStartRules.clear()
         self.sessionEndRules.clear()
         self.projectRules.clear()
+        self.mapReduceRules.clear()
+        self.mappedValues = []
         self.preprocessRules.clear()
         self.commentRules.clear()
+        self.ruleClasses.clear()
+        self.fileRuleBindings = []
+        self.requiredFacts.clear()
 
     def AddPreprocessRule(self, user_function: Callable[[Lexer, ContextStack], None]):
         """ Add rule which runs in preprocess statements """
@@ -230,6 +431,27 @@ class RuleManager:
         """ Add rule on the each line """
         self.lineRules.append(user_function)
 
+    def AddBulkLineRule(self, user_function: Callable[[Lexer, LineTable], None]):
+        """
+        Add rule on the line table of the file.
+        It's called once per file with the LineInfo list of all lines.
+        """
+        self.bulkLineRules.append(user_function)
+
+    def AddFileTextRule(self, pattern: str,
+                        user_function: Callable[[Lexer, re.Match, Token, LineNumber], None]):
+        """
+        Add rule on each match of the pattern in the text of the file.
+        The pattern is compiled with re.MULTILINE. It's combined with the patterns
+        of the other text rules, so it can't use numbered back references. The
+        patterns which can't be combined (e.g. with inline flags) scan the file
+        one by one.
+        The rule is called with the match, the token at the start of the match
+        and the line number of the start of the match.
+        """
+        self.fileTextRules.append((re.compile(pattern, re.MULTILINE), user_function))
+        self.fileTextScanner = None
+
     def AddRule(self, user_function: Callable[[Lexer, ContextStack], None]):
         """ Add rule on any token """
         self.rules.append(user_function)
@@ -275,28 +497,224 @@ class RuleManager:
         """ Add rule on the project """
         self.projectRules.append(user_function)
 
+    def AddMapReduceRule(self, ruleClass):
+        """
+        Add rule which checks across files, implemented as a subclass of
+        MapReduceRule. A single instance is created now and kept for the
+        whole session of this rule manager.
+        """
+        self.mapReduceRules.append(ruleClass())
+
+    def AddRuleClass(self, ruleClass):
+        """
+        Add rule implemented as a subclass of RuleBase.
+
+        If ruleClass.perFile is True, a new instance is created at the start
+        of each file and dropped at its end. Otherwise a single instance is
+        created now and kept for the whole session of this rule manager.
+        """
+        self.RequireFacts(*ruleClass.facts)
+        if ruleClass.perFile:
+            self.ruleClasses.append(ruleClass)
+        else:
+            self._BindRuleInstance(ruleClass(), _sessionCallbacks)
+
+    def RequireFacts(self, *names):
+        """
+        Declare the facts used by the rule (see nsiqcppstyle_facts).
+        An unknown fact fails at the rule loading. The cost of the declared
+        facts and their dependencies is shown in the verbose mode.
+        """
+        for name in names:
+            if not nsiqcppstyle_facts.IsFactAvailable(name):
+                raise KeyError("Unknown fact '%s'" % name)
+            self.requiredFacts.add(name)
+            self.requiredFacts.update(nsiqcppstyle_facts.GetDependencies(name))
+
+    def _BindRuleInstance(self, ruleInstance, callbacks):
+        bindings = []
+        for methodName, listName in callbacks:
+            if getattr(type(ruleInstance), methodName) is getattr(RuleBase, methodName):
+                continue
+            method = getattr(ruleInstance, methodName)
+            ruleList = getattr(self, listName)
+            ruleList.append(method)
+            bindings.append((ruleList, method))
+        return bindings
+
+    def _CreateFileRuleInstances(self):
+        self._DropFileRuleInstances()
+        for ruleClass in self.ruleClasses:
+            self.fileRuleBindings.extend(
+                self._BindRuleInstance(ruleClass(), _fileCallbacks))
+
+    def _DropFileRuleInstances(self):
+        for ruleList, method in self.fileRuleBindings:
+            ruleList.remove(method)
+        self.fileRuleBindings = []
+
+
+class RuleWatchdog:
+    """
+    Measures the CPU time each rule spends on the current file.
+    A rule which exceeds its budget, or any rule after all rules together
+    exceeded the file budget, is skipped for the rest of the file and
+    "rule skipped (budget)" is reported.
+
+    The time is checked after each call of the rule, so a single call
+    which never returns is not interrupted. The time spent for the facts
+    (see nsiqcppstyle_facts) counts in the file budget only, as the facts
+    are shared by the rules.
+    """
+
+    def __init__(self, ruleBudget, fileBudget):
+        self.ruleBudget = ruleBudget
+        self.fileBudget = fileBudget
+        self.StartFile(None)
+
+    def StartFile(self, filename):
+        self.filename = filename
+        self.ruleCost = {}
+        self.fileCost = 0.0
+        self.skippedRules = set()
+
+    def RunRules(self, ruleList, lexer, args):
+        for rule in ruleList:
+            if rule in self.skippedRules:
+                continue
+            if self.fileBudget > 0 and self.fileCost > self.fileBudget:
+                self.SkipRule(rule, "all rules used %.2fs CPU, the file budget is %.2fs"
+                              % (self.fileCost, self.fileBudget))
+                continue
+            data = lexer.Backup()
+            start = time.process_time()
+            factCost = lexer.facts.totalCost
+            try:
+                rule(lexer, *args)
+            finally:
+                cost = time.process_time() - start
+                self.fileCost += cost
+                ruleCost = self.ruleCost.get(rule, 0.0) + cost - (lexer.facts.totalCost - factCost)
+                self.ruleCost[rule] = ruleCost
+            lexer.Restore(data)
+            if self.ruleBudget > 0 and ruleCost > self.ruleBudget:
+                self.SkipRule(rule, "used %.2fs CPU, the rule budget is %.2fs"
+                              % (ruleCost, self.ruleBudget))
+
+    def SkipRule(self, rule, reason):
+        import nsiqcppstyle_reporter
+        self.skippedRules.add(rule)
+        nsiqcppstyle_reporter.ReportRuleSkipped(self.filename, rule.__module__,
+                                                "rule skipped (budget): " + reason)
+
 
-class RollbackImporter:
-    def __init__(self):
-        """Creates an instance and installs as the global importer"""
-        self.previousModules = sys.modules.copy()
-        self.realImport = __builtins__["__import__"]
-        __builtins__["__import__"] = self._import
-        self.newModules = {}
-
-    def _import(self, name, *args, **kwargs):
-        result = self.realImport(name, *args, **kwargs)
-        if name.find("rules") != -1:
-            self.newModules[name] = 1
-        return result
-
-    def uninstall(self):
-        for modname in self.newModules.keys():
-            if modname.find("rules") != -1:
-                if modname not in self.previousModules:
-                    # Force reload when modname next imported
-                    del(sys.modules[modname])
-        __builtins__["__import__"] = self.realImport
+class RuleBase:
+    """
+    Base class for rules which keep state while analyzing.
+
+    Instead of module globals, the state is kept in the rule instance.
+    RuleManager creates a new instance at the start of each file
+    (perFile = True) or a single one per rule manager, i.e. per worker,
+    for rules which collect state across files (perFile = False).
+
+    Only the overridden callbacks are registered. Each one takes the same
+    arguments as the rule function given to the matching Add*Rule method.
+    The facts (see nsiqcppstyle_facts) used by the rule are listed in facts.
+    """
+    perFile = True
+    facts = ()
+
+    def on_file_start(self, lexer: Lexer, filename: FileName, dirname: DirName):
+        """ Called at the start of each file """
+
+    def on_file_end(self, lexer: Lexer, filename: FileName, dirname: DirName):
+        """ Called at the end of each file """
+
+    def on_token(self, lexer: Lexer, contextStack: ContextStack):
+        """ Called on any token (see AddRule) """
+
+    def on_line(self, lexer: Lexer, line: LineText, lineno: LineNumber):
+        """ Called on each line (see AddLineRule) """
+
+    def on_line_table(self, lexer: Lexer, lineTable: LineTable):
+        """ Called once with the line table of the file (see AddBulkLineRule) """
+
+    def on_comment(self, lexer: Lexer, token: Token):
+        """ Called on each comment (see AddCommentRule) """
+
+    def on_preprocess(self, lexer: Lexer, contextStack: ContextStack):
+        """ Called in preprocess statements (see AddPreprocessRule) """
+
+    def on_function_name(self, lexer: Lexer, fullName: FullFunctionName, decl: Declaration,
+                         contextStack: ContextStack, context: Context):
+        """ Called on the function name (see AddFunctionNameRule) """
+
+    def on_function_scope(self, lexer: Lexer, contextStack: ContextStack):
+        """ Called in function scope (see AddFunctionScopeRule) """
+
+    def on_type_name(self, lexer: Lexer, typeName: TypeName, typeFullName: TypeFullName,
+                     decl: Declaration, contextStack: ContextStack, context: Context):
+        """ Called on the type name (see AddTypeNameRule) """
+
+    def on_type_scope(self, lexer: Lexer, contextStack: ContextStack):
+        """ Called in type scope (see AddTypeScopeRule) """
+
+    def on_session_start(self):
+        """ Called at the session start. Only for perFile = False """
+
+    def on_session_end(self):
+        """ Called at the session end. Only for perFile = False """
+
+    def on_project(self, targetName: TargetDirectory):
+        """ Called once a project. Only for perFile = False """
+
+
+class MapReduceRule:
+    """
+    Base class for rules which check across files (e.g. the same filename
+    is used more than once). The files may be analyzed by several processes
+    (see nsiqcppstyle_parallel), so the rule is split in three steps.
+
+    - map() runs at the end of each file, in the process which analyzed
+      the file. It returns a small picklable value of the file, or None.
+      The value is kept in the manifest (--manifest) for the unchanged
+      file if it's a JSON value. The tuples come back as lists.
+    - reduce() runs in the main process with the value of each file, in the
+      order of the files. The instance keeps the merged values. It may
+      report the violations of the file as the file was just analyzed.
+    - report() runs in the main process at the end of each target.
+    """
+
+    def map(self, lexer: Lexer, filename: FileName, dirname: DirName):
+        """ Get the value of the file """
+        return None
+
+    def reduce(self, filename: FileName, value):
+        """ Merge the value of the file """
+
+    def report(self, targetName: TargetDirectory):
+        """ Report on the merged values """
+
+
+# RuleBase callback name and the rule list of RuleManager it is registered in
+_fileCallbacks = (
+    ("on_file_start", "fileStartRules"),
+    ("on_file_end", "fileEndRules"),
+    ("on_token", "rules"),
+    ("on_line", "lineRules"),
+    ("on_line_table", "bulkLineRules"),
+    ("on_comment", "commentRules"),
+    ("on_preprocess", "preprocessRules"),
+    ("on_function_name", "functionNameRules"),
+    ("on_function_scope", "functionScopeRules"),
+    ("on_type_name", "typeNameRules"),
+    ("on_type_scope", "typeScopeRules"),
+)
+_sessionCallbacks = _fileCallbacks + (
+    ("on_session_start", "sessionStartRules"),
+    ("on_session_end", "sessionEndRules"),
+    ("on_project", "projectRules"),
+)
 
 
 ruleManager = RuleManager(GetRuntimePath())
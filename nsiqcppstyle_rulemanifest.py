@@ -0,0 +1,283 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Rule manifest
+#
+# The manifest (rules/rulemanifest.json) lists the available rules with the
+# callback kinds they register, the token types they compare against, the
+# analysis stage they need and whether they can run in parallel workers.
+# It lets the rule manager know the available rules without importing the
+# rules folder. Only the rules named in filefilter.txt are imported. Each
+# entry has the hash of the rule source, so the entries of the added or
+# changed rules are generated again when the manifest is loaded.
+#
+# Regenerate it after adding or changing a rule:
+#   python nsiqcppstyle_rulemanifest.py
+
+import ast
+import hashlib
+import json
+import os
+import sys
+
+MANIFEST_FILENAME = "rulemanifest.json"
+
+# Rule manager method and the kind (rule list of RuleManager) it registers
+_addMethodKinds = {
+    "AddPreprocessRule": "preprocessRules",
+    "AddCommentRule": "commentRules",
+    "AddFunctionScopeRule": "functionScopeRules",
+    "AddFunctionNameRule": "functionNameRules",
+    "AddLineRule": "lineRules",
+    "AddBulkLineRule": "bulkLineRules",
+    "AddFileTextRule": "fileTextRules",
+    "AddRule": "rules",
+    "AddTypeNameRule": "typeNameRules",
+    "AddTypeScopeRule": "typeScopeRules",
+    "AddFileEndRule": "fileEndRules",
+    "AddFileStartRule": "fileStartRules",
+    "AddSessionEndRule": "sessionEndRules",
+    "AddSessionStartRule": "sessionStartRules",
+    "AddProjectRules": "projectRules",
+    "AddMapReduceRule": "mapReduceRules",
+}
+
+# Analysis stages in the order of the cost. ProcessFile stops at the stage
+# which the loaded rules need.
+# - filename - the file is neither read nor lexed
+# - tokens - the file is lexed and the #if branches are resolved. The line
+#            table is built on the tokens as well.
+# - context - the context (function, class, ... blocks) of each token is
+#             constructed
+STAGE_FILENAME = "filename"
+STAGE_TOKENS = "tokens"
+STAGE_CONTEXT = "context"
+STAGES = (STAGE_FILENAME, STAGE_TOKENS, STAGE_CONTEXT)
+
+# Kinds which run without the context or without the tokens
+_filenameKinds = {"fileStartRules", "fileEndRules", "sessionStartRules",
+                  "sessionEndRules", "projectRules", "mapReduceRules"}
+_tokenKinds = {"lineRules", "bulkLineRules", "fileTextRules"}
+
+# Lexer attributes available in each stage
+_filenameLexerAttributes = {"filename"}
+_tokenLexerAttributes = _filenameLexerAttributes | {
+    "data", "lines", "tokenlist", "GetLineTable", "GetTokenAt",
+    "GetLineNumberAt", "GetDirectives", "GetDirective"}
+
+# Token attributes set while constructing the context
+_contextTokenAttributes = {"contextStack", "context", "pp", "fullName", "decl"}
+
+
+def GetKindStage(kind):
+    """ The analysis stage which the callbacks of the kind need at least """
+    if kind in _filenameKinds:
+        return STAGE_FILENAME
+    if kind in _tokenKinds:
+        return STAGE_TOKENS
+    return STAGE_CONTEXT
+
+
+# Kinds which run once in the main process
+_sessionKinds = {"sessionStartRules", "sessionEndRules", "projectRules"}
+
+# Methods which change a list, a dict or a set in place
+_mutatingMethods = {"append", "extend", "insert", "remove", "pop", "clear", "update",
+                    "setdefault", "add", "discard", "popitem", "sort", "reverse",
+                    "appendleft", "extendleft", "popleft", "intersection_update",
+                    "difference_update", "symmetric_difference_update"}
+
+
+def GetManifestPath(rulesPath):
+    return os.path.join(rulesPath, MANIFEST_FILENAME)
+
+
+def LoadManifest(rulesPath):
+    """
+    Load the manifest of the given rules folder. The entries of the rule
+    files which are added or changed since the manifest was generated (the
+    hash of the source differs) are generated again. The manifest file isn't
+    written, as the rules folder may be the installed one.
+    """
+    try:
+        with open(GetManifestPath(rulesPath)) as f:
+            savedManifest = json.load(f)
+    except (OSError, ValueError):
+        savedManifest = {}
+    if not isinstance(savedManifest, dict):
+        savedManifest = {}
+    manifest = {}
+    for eachRuleFile, data in _ReadRuleFiles(rulesPath):
+        entry = savedManifest.get(eachRuleFile[:-3])
+        if not isinstance(entry, dict) or entry.get("hash") != _GetSourceHash(data):
+            entry = _GenerateEntry(eachRuleFile, data)
+        manifest[eachRuleFile[:-3]] = entry
+    return manifest
+
+
+def SaveManifest(rulesPath, manifest):
+    with open(GetManifestPath(rulesPath), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def GenerateManifest(rulesPath):
+    """ Build the manifest by parsing (not importing) each rule file """
+    return dict((eachRuleFile[:-3], _GenerateEntry(eachRuleFile, data))
+                for eachRuleFile, data in _ReadRuleFiles(rulesPath))
+
+
+def _ReadRuleFiles(rulesPath):
+    """ The name and the source of each rule file """
+    for eachRuleFile in sorted(os.listdir(rulesPath)):
+        if not eachRuleFile.endswith(".py") or eachRuleFile.find("__init__") != -1:
+            continue
+        with open(os.path.join(rulesPath, eachRuleFile), "rb") as f:
+            yield eachRuleFile, f.read()
+
+
+def _GetSourceHash(data):
+    return hashlib.sha1(data.replace(b"\r\n", b"\n")).hexdigest()
+
+
+def _GenerateEntry(ruleFile, data):
+    tree = ast.parse(data, ruleFile)
+    kinds = _GetCallbackKinds(tree)
+    return {
+        "kinds": sorted(kinds),
+        "tokenTypes": sorted(_GetTokenTypes(tree)),
+        "stage": _GetStage(tree, kinds),
+        "parallel": _IsParallel(tree, kinds),
+        "hash": _GetSourceHash(data),
+    }
+
+
+def _GetCallbackKinds(tree):
+    import nsiqcppstyle_rulemanager
+    classes = dict((node.name, node) for node in tree.body
+                   if isinstance(node, ast.ClassDef))
+    classCallbacks = dict(nsiqcppstyle_rulemanager._sessionCallbacks)
+    kinds = set()
+    for node in tree.body:
+        if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+            continue
+        func = node.value.func
+        if not isinstance(func, ast.Attribute):
+            continue
+        if func.attr in _addMethodKinds:
+            kinds.add(_addMethodKinds[func.attr])
+        elif func.attr == "AddRuleClass" and len(node.value.args) == 1:
+            ruleClass = classes.get(getattr(node.value.args[0], "id", None))
+            if ruleClass is None:
+                continue
+            for method in ruleClass.body:
+                if isinstance(method, ast.FunctionDef) and method.name in classCallbacks:
+                    kinds.add(classCallbacks[method.name])
+    return kinds
+
+
+def _GetStage(tree, kinds):
+    """
+    The analysis stage the rule needs. The callback kinds decide the stage,
+    unless the rule uses a lexer or token attribute of the later stage.
+    """
+    if kinds - _filenameKinds - _tokenKinds:
+        return STAGE_CONTEXT
+    stage = STAGE_TOKENS if kinds & _tokenKinds else STAGE_FILENAME
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Attribute):
+            continue
+        if node.attr in _contextTokenAttributes:
+            return STAGE_CONTEXT
+        if not isinstance(node.value, ast.Name) or node.value.id != "lexer":
+            continue
+        if node.attr in _filenameLexerAttributes:
+            continue
+        if node.attr not in _tokenLexerAttributes:
+            return STAGE_CONTEXT
+        stage = STAGE_TOKENS
+    return stage
+
+
+def _IsParallel(tree, kinds):
+    """
+    Whether the files can be analyzed by the rule in separate processes.
+    A rule which keeps the state across files (module globals, a RuleBase
+    class with perFile = False or file callbacks with session or project
+    callbacks) sees only a part of the files in each process.
+    """
+    if kinds & _sessionKinds and kinds - _sessionKinds:
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Global):
+            return False
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and \
+                node.value.value is False and \
+                any(isinstance(target, ast.Name) and target.id == "perFile" for target in node.targets):
+            return False
+    return not _HasMutatedGlobals(tree)
+
+
+def _HasMutatedGlobals(tree):
+    """
+    Whether a function changes a module-level object without the global
+    statement (e.g. filenameMap[name] = lineno or names.append(name))
+    """
+    moduleNames = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for each in ast.walk(target):
+                    if isinstance(each, ast.Name):
+                        moduleNames.add(each.id)
+    if not moduleNames:
+        return False
+    for function in ast.walk(tree):
+        if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        # The names bound in the function are local
+        localNames = set(arg.arg for arg in ast.walk(function.args) if isinstance(arg, ast.arg))
+        for node in ast.walk(function):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                localNames.add(node.id)
+        globalNames = moduleNames - localNames
+        for node in ast.walk(function):
+            if isinstance(node, (ast.Subscript, ast.Attribute)) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                target = node.value
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and \
+                    node.func.attr in _mutatingMethods:
+                target = node.func.value
+            else:
+                continue
+            while isinstance(target, (ast.Subscript, ast.Attribute)):
+                target = target.value
+            if isinstance(target, ast.Name) and target.id in globalNames:
+                return True
+    return False
+
+
+def _GetTokenTypes(tree):
+    """ Token types compared against the type of a token (e.g. t.type == "LBRACE") """
+    tokenTypes = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Compare):
+            continue
+        if not isinstance(node.left, ast.Attribute) or node.left.attr != "type":
+            continue
+        for comparator in node.comparators:
+            values = [comparator]
+            if isinstance(comparator, (ast.List, ast.Tuple, ast.Set)):
+                values = comparator.elts
+            for value in values:
+                if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                    tokenTypes.add(value.value)
+    return tokenTypes
+
+
+if __name__ == "__main__":
+    rulesPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules")
+    if len(sys.argv) > 1:
+        rulesPath = sys.argv[1]
+    SaveManifest(rulesPath, GenerateManifest(rulesPath))
+    print("%s is generated." % GetManifestPath(rulesPath))
@@ -42,7 +42,15 @@ class _NsiqCppStyleState(object):
         self.showUrl = False
         self.reportError = False
         self.suppressRules = {}
+        self.suppressRulesLoader = None
         self.varMap = {}
+        # --define / --undef macros (see nsiqcppstyle_preprocessor)
+        self.macros = {}
+        # --git-diff changed lines (see nsiqcppstyle_git). None reports all lines.
+        self.changedLines = None
+        # The contents analyzed instead of the files (e.g. the editor buffers
+        # sent to the daemon) by the real path
+        self.buffers = {}
 
     def SetOutputFormat(self, output_format):
         """Sets the output format for errors."""
@@ -66,13 +74,34 @@ class _NsiqCppStyleState(object):
         errorsPerFile[category] = errorsPerFile.get(category, 0) + 1
         self.errorPerFile[file] = errorsPerFile
 
+    def MergeErrorCount(self, errorCount, errorPerChecker, errorPerFile):
+        """Adds the error statistic of another process."""
+        self.error_count += errorCount
+        for category, count in errorPerChecker.items():
+            self.errorPerChecker[category] = self.errorPerChecker.get(
+                category, 0) + count
+        for file, errors in errorPerFile.items():
+            errorsPerFile = self.errorPerFile.get(file, {})
+            for category, count in errors.items():
+                errorsPerFile[category] = errorsPerFile.get(category, 0) + count
+            self.errorPerFile[file] = errorsPerFile
+
     def SuppressRule(self, ruleName):
         self.suppressRules[ruleName] = True
 
-    def ResetRuleSuppression(self):
+    def ResetRuleSuppression(self, loader=None):
+        """
+        Reset the suppressed rules. If the loader is given, it's called
+        to suppress the rules of the file on the first check.
+        """
         self.suppressRules = {}
+        self.suppressRulesLoader = loader
 
     def CheckRuleSuppression(self, ruleName):
+        if self.suppressRulesLoader is not None:
+            loader = self.suppressRulesLoader
+            self.suppressRulesLoader = None
+            loader()
         return self.suppressRules.get(ruleName, False)
 
     def GetVar(self, key, defaultValue):
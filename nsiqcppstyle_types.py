@@ -24,6 +24,12 @@ FullFunctionName = NewType('FullFunctionName', str)
 # The lexer object used to analyze the source file
 Lexer = NewType('Lexer', nsiqcppstyle_checker.CppLexerNavigator)
 
+# The classification of a source line (see CppLexerNavigator.GetLineTable)
+LineInfo = nsiqcppstyle_checker.LineInfo
+
+# The list of LineInfo of the file being analyzed (index is the line number - 1)
+LineTable = NewType('LineTable', list)
+
 # The line number (> 0) of the <LineType> in the file currently being processed
 LineNumber = NewType('LineNumber', int)
 
@@ -0,0 +1,129 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Watch mode (--watch)
+#
+# After the first pass, the files of the target are polled. The files which
+# are new or changed (the mtime or the size) are analyzed again and the
+# removed ones are dropped. The rules, the filter and the lexer stay loaded.
+#
+# The violations and the values mapped by the map/reduce rules are kept for
+# each file, so only the changed files are lexed again. The cross-file rules
+# reduce the kept values of all files again and the project rules run again:
+# a rule can't take the old values of a changed file back from its state, so
+# a pass isn't limited to the keys of the changed files.
+# The delta of the violations (the new ones and the fixed ones) is reported
+# after each pass, followed by the summary.
+
+import collections
+import os
+
+import nsiqcppstyle_reporter
+from nsiqcppstyle_outputer import _consoleOutputer as console
+from nsiqcppstyle_state import _nsiqcppstyle_state
+
+
+class ProjectViolationRecorder(nsiqcppstyle_reporter.ViolationRecorder):
+    """
+    The violations reported by the map/reduce rules and the project rules,
+    which may be on any file. They're not written.
+    """
+
+    def __init__(self):
+        nsiqcppstyle_reporter.ViolationRecorder.__init__(self, False)
+
+    def Add(self, filename, lineno, column, ruleName, message):
+        self.violations.append([filename, lineno, column, ruleName, message])
+
+
+def GetStatKey(filename):
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class WatchedFiles(object):
+    """
+     - Represent the files of the watched target and their last results
+     - It has the interface of FileManifest, so the first pass records
+       the results as the incremental analysis does.
+    """
+
+    def __init__(self):
+        # The mtime and the size of each file, in the order of the target
+        self.statKeys = collections.OrderedDict()
+        self.violations = {}
+        self.mappedValues = {}
+        # The violations of the map/reduce rules and the project rules
+        self.projectViolations = []
+
+    def GetResult(self, filename):
+        """ The file is always analyzed. Its mtime and size are kept. """
+        self.statKeys[filename] = GetStatKey(filename)
+        return None
+
+    def GetCost(self, filename):
+        return None
+
+    def Record(self, filename, violations, mappedValues, cost=None):
+        # The violations are incomplete if a rule was skipped
+        self.violations[filename] = violations if violations is not None else []
+        self.mappedValues[filename] = mappedValues
+
+    def Save(self):
+        pass
+
+    def GetFiles(self):
+        return list(self.statKeys.keys())
+
+    def GetMappedValues(self, filename):
+        return self.mappedValues.get(filename, [])
+
+    def Update(self, targetFiles):
+        """
+        Take the current target files and return the new or changed ones
+        and the removed ones. The files which can't be read any more are
+        removed.
+        """
+        statKeys = collections.OrderedDict()
+        changedFiles = []
+        for eachFile, dirname, fname in targetFiles:
+            try:
+                statKeys[eachFile] = GetStatKey(eachFile)
+            except OSError:
+                continue
+            if self.statKeys.get(eachFile) != statKeys[eachFile]:
+                changedFiles.append((eachFile, dirname, fname))
+        removedFiles = [eachFile for eachFile in self.statKeys if eachFile not in statKeys]
+        for eachFile in removedFiles:
+            self.violations.pop(eachFile, None)
+            self.mappedValues.pop(eachFile, None)
+        self.statKeys = statKeys
+        return changedFiles, removedFiles
+
+    def GetViolations(self):
+        """ The count of each violation (filename, lineno, column, ruleName, message) """
+        violations = collections.Counter()
+        for eachFile, fileViolations in self.violations.items():
+            for lineno, column, ruleName, message in fileViolations:
+                violations[(eachFile, lineno, column, ruleName, message)] += 1
+        for violation in self.projectViolations:
+            violations[tuple(violation)] += 1
+        return violations
+
+
+def ReportDelta(before, after):
+    """
+    Write the new violations and the fixed ones. The error count is the
+    count of the current violations.
+    """
+    _nsiqcppstyle_state.ResetErrorCount()
+    newViolations = after - before
+    fixedViolations = before - after
+    for filename, lineno, column, ruleName, message in sorted(newViolations.elements()):
+        nsiqcppstyle_reporter.WriteError(filename, lineno, column, ruleName, message)
+    for filename, lineno, column, ruleName, message in (after - newViolations).elements():
+        _nsiqcppstyle_state.IncrementErrorCount(ruleName, filename)
+    for filename, lineno, column, ruleName, message in sorted(fixedViolations.elements()):
+        console.Out.Ci("Fixed: %s(%s, %s):  %s  [%s]" % (filename, lineno, column, message, ruleName))
+    console.Out.Ci(" ** New Violations            : %d" % sum(newViolations.values()))
+    console.Out.Ci(" ** Fixed Violations          : %d" % sum(fixedViolations.values()))
@@ -0,0 +1,121 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import io
+import os
+import shutil
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import nsiqcppstyle_client
+import nsiqcppstyle_daemon
+import nsiqcppstyle_exe
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+class daemonTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = os.path.realpath(tempfile.mkdtemp())
+        self.target = os.path.join(self.directory, "target")
+        os.makedirs(self.target)
+        with open(os.path.join(self.target, "filefilter.txt"), "w") as f:
+            f.write("~ RULE_4_4_A_do_not_write_over_120_columns_per_line\n")
+        self.source = os.path.join(self.target, "a.cpp")
+        with open(self.source, "w") as f:
+            f.write("int a;\n")
+        self.socketPath = os.path.join(self.directory, "socket")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def Start(self):
+        thread = threading.Thread(target=nsiqcppstyle_daemon.Serve,
+                                  args=(self.socketPath, nsiqcppstyle_exe.main))
+        thread.start()
+        for i in range(100):
+            if os.path.exists(self.socketPath):
+                break
+            time.sleep(0.05)
+        return thread
+
+    def testServe(self):
+        thread = self.Start()
+        try:
+            self.assertRaises(nsiqcppstyle_daemon.DaemonError, nsiqcppstyle_daemon.Listen, self.socketPath)
+            request = {"argv": ["--output=emacs", "target"], "cwd": self.directory, "buffers": {}}
+            response = nsiqcppstyle_client.Request(self.socketPath, request)
+            self.assertEqual(response["exitCode"], 0)
+            self.assertIn("Total Errors Occurs       : 0", response["output"])
+            # The buffer is analyzed instead of the file
+            request["buffers"] = {os.path.join("target", "a.cpp"): "int a; // " + "a" * 120 + "\n"}
+            response = nsiqcppstyle_client.Request(self.socketPath, request)
+            self.assertEqual(response["exitCode"], 1)
+            self.assertIn(self.source + ":1:", response["output"])
+            # Nothing is kept from the last request
+            request["buffers"] = {}
+            response = nsiqcppstyle_client.Request(self.socketPath, request)
+            self.assertEqual(response["exitCode"], 0)
+        finally:
+            nsiqcppstyle_client.Request(self.socketPath, {"command": "stop"})
+            thread.join()
+        self.assertFalse(os.path.exists(self.socketPath))
+
+    def testHandleRequest(self):
+        def Analyze(argv):
+            sys.stdout.write(" ".join(argv))
+            sys.exit("failed")
+        response = nsiqcppstyle_daemon.HandleRequest({"argv": ["a"], "cwd": self.directory}, Analyze)
+        self.assertEqual(response, {"output": "nsiqcppstyle a", "errorOutput": "failed\n", "exitCode": 1})
+        response = nsiqcppstyle_daemon.HandleRequest({"argv": "a"}, Analyze)
+        self.assertEqual(response["exitCode"], -1)
+        self.assertIn("DaemonError", response["errorOutput"])
+
+    def testRejectedOptions(self):
+        def Analyze(argv):
+            return 0
+        for argv in (["--daemon=socket"], ["--watch", "target"], ["--wat"], ["--stdin", "--stdin-filename=a.cpp"]):
+            response = nsiqcppstyle_daemon.HandleRequest({"argv": argv, "cwd": self.directory}, Analyze)
+            self.assertEqual(response["exitCode"], -1)
+            self.assertIn("can't be given to the daemon", response["errorOutput"])
+        response = nsiqcppstyle_daemon.HandleRequest({"argv": ["--stdin-filename=a.cpp", "--", "--watch"],
+                                                      "cwd": self.directory}, Analyze)
+        self.assertEqual(response["exitCode"], 0)
+
+    def testStdinRequest(self):
+        stdin = sys.stdin
+        sys.stdin = io.StringIO("int a;\n")
+        try:
+            args, buffers = nsiqcppstyle_client.GetStdinRequest(["--stdin", "--stdin-filename", "a.cpp", "-f", "f"])
+        finally:
+            sys.stdin = stdin
+        self.assertEqual(args, ["-f", "f", "a.cpp"])
+        self.assertEqual(buffers, {"a.cpp": "int a;\n"})
+        self.assertEqual(nsiqcppstyle_client.GetStdinRequest(["target"]), (["target"], {}))
+
+    def testSocketMode(self):
+        server = nsiqcppstyle_daemon.Listen(self.socketPath)
+        try:
+            self.assertEqual(stat.S_IMODE(os.stat(self.socketPath).st_mode), 0o600)
+        finally:
+            server.close()
+
+    def testFilterManagerCache(self):
+        path = os.path.join(self.target, "filefilter.txt")
+        filterManager = nsiqcppstyle_exe.GetFilterManager(path, [], {}, {}, "default")
+        self.assertEqual(filterManager.GetActiveFilter().nsiqCppStyleRules,
+                         ["RULE_4_4_A_do_not_write_over_120_columns_per_line"])
+        filterManager.GetActiveFilter().nsiqCppStyleRules = []
+        cached = nsiqcppstyle_exe.GetFilterManager(path, [], {}, {}, "default")
+        self.assertEqual(cached.GetActiveFilter().nsiqCppStyleRules,
+                         ["RULE_4_4_A_do_not_write_over_120_columns_per_line"])
+        # The changed filter file is parsed again
+        with open(path, "a") as f:
+            f.write("~ RULE_3_1_A_do_not_start_filename_with_underbar\n")
+        changed = nsiqcppstyle_exe.GetFilterManager(path, [], {}, {}, "default")
+        self.assertEqual(changed.GetActiveFilter().nsiqCppStyleRules,
+                         ["RULE_4_4_A_do_not_write_over_120_columns_per_line",
+                          "RULE_3_1_A_do_not_start_filename_with_underbar"])
@@ -0,0 +1,247 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+import nsiqcppstyle_exe
+from nsiqcppstyle_state import _nsiqcppstyle_state
+
+EXTENSIONS = {"c", "cpp", "h"}
+
+
+def CheckFileInclusion(filefilter, path):
+    """ The filters evaluated one by one, the last matching one wins """
+    inclusion = True
+    for eachfilter in filefilter:
+        if eachfilter[2]:
+            if path.startswith(eachfilter[1]):
+                inclusion = eachfilter[0]
+        elif path.find(eachfilter[1]) != -1:
+            inclusion = eachfilter[0]
+    return inclusion
+
+
+class filterTest(unittest.TestCase):
+    def testSameAsSequentialFilters(self):
+        rand = random.Random(0)
+        parts = ["src", "test", "lib", "a", "ab", ".cpp", ".h", "/", "\\", "(", "*"]
+        for i in range(300):
+            filter = nsiqcppstyle_exe.Filter("default", {}, {})
+            for j in range(rand.randint(0, 8)):
+                eachFilter = "".join(rand.choice(parts) for k in range(rand.randint(1, 3)))
+                filter.AddFilter(rand.random() < 0.5, eachFilter)
+                if rand.random() < 0.2:
+                    filter.filefilter[-1][2] = True
+                    filter.matcher = None
+            for j in range(20):
+                path = filter.NormalizePath("".join(rand.choice(parts) for k in range(rand.randint(0, 6))))
+                self.assertEqual(filter.CheckFileInclusion(path),
+                                 CheckFileInclusion(filter.filefilter, path),
+                                 (filter.filefilter, path))
+
+    def testLastMatchWins(self):
+        filter = nsiqcppstyle_exe.Filter("default", {}, {})
+        filter.AddExclude("/")
+        filter.AddInclude("/src/")
+        filter.AddExclude("/src/test/")
+        self.assertFalse(filter.CheckFileInclusion("/lib/a.cpp"))
+        self.assertTrue(filter.CheckFileInclusion("/src/a.cpp"))
+        self.assertFalse(filter.CheckFileInclusion("/src/test/a.cpp"))
+        # The same filter is moved to the end
+        filter.AddInclude("/src/")
+        self.assertTrue(filter.CheckFileInclusion("/src/test/a.cpp"))
+
+    def testManyFilters(self):
+        filter = nsiqcppstyle_exe.Filter("default", {}, {})
+        for i in range(500):
+            filter.AddExclude("/vendor%d/" % i)
+        self.assertEqual(len(filter.GetMatcher()), 1)
+        self.assertFalse(filter.CheckFileInclusion("/vendor123/a.cpp"))
+        self.assertTrue(filter.CheckFileInclusion("/vendor1234/a.cpp"))
+
+
+class walkTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for path in ["a.cpp", "b.txt", "src/b.cpp", "src/test/c.cpp", "src/test/keep/d.h",
+                     "lib/e.c", ".svn/f.cpp", "src/.git/g.cpp"]:
+            path = os.path.join(self.directory, *path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("int a;\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def GetFilter(self, filters):
+        filter = nsiqcppstyle_exe.Filter("default", {}, {})
+        for each in filters:
+            if each.startswith("+"):
+                filter.AddInclude(each[1:].strip())
+            else:
+                filter.AddExclude(each[1:].strip())
+        return filter
+
+    def Walk(self, filter):
+        return [os.path.relpath(path, self.directory).replace(os.sep, "/")
+                for path, dirname, fname in nsiqcppstyle_exe.WalkTargetFiles(
+                    self.directory, filter, EXTENSIONS, nsiqcppstyle_exe.NullBaseFileList())]
+
+    def OsWalk(self, filter):
+        files = []
+        for root, dirs, names in os.walk(self.directory):
+            for each in [".cvs", ".svn", ".git", ".hg"]:
+                if each in dirs:
+                    dirs.remove(each)
+            for fname in names:
+                path = os.path.join(root, fname)
+                if (fname[fname.rfind('.') + 1:] in EXTENSIONS and
+                        filter.CheckFileInclusion(path[len(self.directory):])):
+                    files.append(os.path.relpath(path, self.directory).replace(os.sep, "/"))
+        return files
+
+    def testSameAsOsWalk(self):
+        for filters in [[], ["- /test/"], ["- /", "+ /src/"], ["- /src/", "+ /keep/"],
+                        ["- .cpp"], ["- /test/", "- /lib/"]]:
+            filter = self.GetFilter(filters)
+            self.assertEqual(self.Walk(filter), self.OsWalk(filter), filters)
+
+    def testDirectoryExcluded(self):
+        filter = self.GetFilter(["- /test/", "- /lib/"])
+        self.assertTrue(filter.IsDirectoryExcluded(os.sep + "src" + os.sep + "test" + os.sep))
+        self.assertTrue(filter.IsDirectoryExcluded(os.sep + "lib" + os.sep))
+        self.assertFalse(filter.IsDirectoryExcluded(os.sep + "src" + os.sep))
+        # A file under the directory may be included again
+        filter = self.GetFilter(["- /src/", "+ /keep/"])
+        self.assertFalse(filter.IsDirectoryExcluded(os.sep + "src" + os.sep))
+        filter = self.GetFilter(["- /src/", "+ /keep/", "- /"])
+        self.assertTrue(filter.IsDirectoryExcluded(os.sep + "src" + os.sep))
+
+    def testBaseFileList(self):
+        path = os.path.join(self.directory, "a.cpp")
+        with open(os.path.join(self.directory, "basefilelist.txt"), "w") as f:
+            f.write("a.cpp%d\n" % os.path.getsize(path))
+        basefilelist = nsiqcppstyle_exe.BaseFileList(self.directory)
+        files = [fname for path, dirname, fname in nsiqcppstyle_exe.WalkTargetFiles(
+            self.directory, self.GetFilter([]), EXTENSIONS, basefilelist)]
+        self.assertNotIn("a.cpp", files)
+        self.assertIn("b.cpp", files)
+
+
+class fileListTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = os.path.realpath(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def WriteFile(self, fname, data):
+        path = os.path.join(self.directory, fname)
+        with open(path, "w", newline="") as f:
+            f.write(data)
+        return path
+
+    def testFilesFrom(self):
+        self.assertEqual(nsiqcppstyle_exe.ReadFilesFrom(self.WriteFile("list.txt", "a.cpp\r\n\nsp ace.h\n")),
+                         ["a.cpp", "sp ace.h"])
+        self.assertEqual(nsiqcppstyle_exe.ReadFilesFrom(self.WriteFile("list0.txt", "a.cpp\0new\nline.h\0")),
+                         ["a.cpp", "new\nline.h"])
+
+    def testCompileCommands(self):
+        path = self.WriteFile("compile_commands.json", json.dumps([
+            {"directory": os.path.join(self.directory, "build"), "file": "../src/a.cpp", "command": "cc -c ../src/a.cpp"},
+            {"directory": self.directory, "file": os.path.join(self.directory, "src", "b.cpp"), "arguments": []},
+            {"file": "c.cpp"}]))
+        self.assertEqual(nsiqcppstyle_exe.ReadCompileCommands(path),
+                         [os.path.join(self.directory, "build", "..", "src", "a.cpp"),
+                          os.path.join(self.directory, "src", "b.cpp"),
+                          os.path.join(self.directory, "c.cpp")])
+
+    def testListedTargetFiles(self):
+        filesFrom = self.WriteFile("list.txt", "\n".join([
+            os.path.join(self.directory, "src", "a.cpp"),
+            os.path.join(self.directory, "src", "..", "src", "a.cpp"),
+            os.path.join(self.directory, "src", "test", "b.cpp"),
+            os.path.join(self.directory, "src", "c.txt"),
+            os.path.join(self.directory, "other", "d.cpp")]))
+        listedFiles = nsiqcppstyle_exe.GetListedFiles([filesFrom], [])
+        self.assertEqual(len(listedFiles), 4)
+        filter = nsiqcppstyle_exe.Filter("default", {}, {})
+        filter.AddExclude("/test/")
+        targetPath = os.path.join(self.directory, "src")
+        self.assertEqual(nsiqcppstyle_exe.GetListedTargetFiles(targetPath, filter, EXTENSIONS, listedFiles),
+                         [(os.path.join(targetPath, "a.cpp"), os.sep, "a.cpp")])
+
+
+class shardTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = os.path.realpath(tempfile.mkdtemp())
+        self.targetFiles = []
+        for i in range(20):
+            fname = "f%d.cpp" % i
+            with open(os.path.join(self.directory, fname), "w") as f:
+                f.write("int a;\n" * (i + 1))
+            self.targetFiles.append((os.path.join(self.directory, fname), os.sep, fname))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testPartition(self):
+        for shardBy in ["path", "size"]:
+            shards = [nsiqcppstyle_exe.SelectShardFiles(self.directory, self.targetFiles, (index, 3), shardBy)
+                      for index in range(1, 4)]
+            self.assertEqual(sorted(sum(shards, [])), sorted(self.targetFiles), shardBy)
+            # The same partition on the other node
+            self.assertEqual(nsiqcppstyle_exe.SelectShardFiles(self.directory, list(reversed(self.targetFiles)),
+                                                               (2, 3), shardBy), list(reversed(shards[1])))
+        loads = [sum(os.path.getsize(eachFile) for eachFile, dirname, fname in shard) for shard in shards]
+        self.assertLessEqual(max(loads) - min(loads), 20 * len("int a;\n"))
+
+    def testGetShard(self):
+        self.assertEqual(nsiqcppstyle_exe.GetShard("2/3", "--shard"), (2, 3))
+        for value in ["4/3", "a/b"]:
+            self.assertRaises(SystemExit, nsiqcppstyle_exe.GetShard, value, "--shard")
+
+
+class fileCostTest(unittest.TestCase):
+    def testGetFileCosts(self):
+        class Manifest(object):
+            def GetCost(self, filename):
+                return {"a.cpp": 2.0, "b.cpp": None}.get(filename)
+        fileSizes = {"a.cpp": 100, "b.cpp": 50, "c.cpp": 200}
+        self.assertEqual(nsiqcppstyle_exe.GetFileCosts(["a.cpp", "b.cpp", "c.cpp"], fileSizes, Manifest()),
+                         [2.0, 1.0, 4.0])
+        self.assertEqual(nsiqcppstyle_exe.GetFileCosts(["b.cpp", "c.cpp"], fileSizes,
+                                                       nsiqcppstyle_exe.nsiqcppstyle_incremental.NullFileManifest()),
+                         [50, 200])
+
+
+class stdinTest(unittest.TestCase):
+    def setUp(self):
+        self.stdin = sys.stdin
+        sys.stdin = io.StringIO("int a;\n")
+
+    def tearDown(self):
+        sys.stdin = self.stdin
+        _nsiqcppstyle_state.buffers = {}
+
+    def testStdinTarget(self):
+        path = os.path.join(tempfile.gettempdir(), "nosuchdir", "a.cpp")
+        self.assertEqual(nsiqcppstyle_exe.GetStdinTargetPath([], path), os.path.realpath(path))
+        self.assertEqual(_nsiqcppstyle_state.buffers, {os.path.realpath(path): "int a;\n"})
+        self.assertTrue(nsiqcppstyle_exe.IsFileTarget(os.path.realpath(path)))
+        self.assertEqual(nsiqcppstyle_exe.GetOutputPath(os.path.realpath(path), ""),
+                         os.path.dirname(os.path.realpath(path)))
+
+    def testBufferGiven(self):
+        path = os.path.realpath("a.cpp")
+        _nsiqcppstyle_state.buffers = {path: "int b;\n"}
+        self.assertEqual(nsiqcppstyle_exe.GetStdinTargetPath([], "a.cpp"), path)
+        self.assertEqual(_nsiqcppstyle_state.buffers, {path: "int b;\n"})
+        self.assertEqual(sys.stdin.read(), "int a;\n")
@@ -0,0 +1,73 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import unittest
+import nsiqcppstyle_checker
+import nsiqcppstyle_facts
+import nsiqcppstyle_rulemanager
+
+
+class factsTest(unittest.TestCase):
+    def GetLexer(self, filename, data):
+        lexer = nsiqcppstyle_checker.CppLexerNavigator(filename, data)
+        nsiqcppstyle_checker.ConstructContextInfo(lexer)
+        lexer.Reset()
+        return lexer
+
+    def GetToken(self, lexer, value):
+        for token in lexer.tokenlist:
+            if token.value == value:
+                return token
+        return None
+
+    def testAccessSpecifier(self):
+        lexer = self.GetLexer("a.h", """
+class A {
+    void B();
+private:
+    void C();
+public:
+    void D();
+};
+""")
+        self.assertEqual(lexer.GetFact("accessSpecifier", self.GetToken(lexer, "B")), None)
+        self.assertEqual(lexer.GetFact("accessSpecifier", self.GetToken(lexer, "C")), "PRIVATE")
+        self.assertEqual(lexer.GetFact("accessSpecifier", self.GetToken(lexer, "D")), "PUBLIC")
+
+    def testPreviousComment(self):
+        lexer = self.GetLexer("a.h", "/** doc */\nvoid A();")
+        comment = lexer.GetFact("previousComment", self.GetToken(lexer, "A"))
+        self.assertEqual(comment.value, "/** doc */")
+
+    def testFactIsComputedOnce(self):
+        called = []
+        nsiqcppstyle_facts.AddFact("testCount", lambda lexer: called.append(1) or len(called))
+        lexer = self.GetLexer("a.cpp", "int a;")
+        self.assertEqual(lexer.GetFact("testCount"), 1)
+        self.assertEqual(lexer.GetFact("testCount"), 1)
+        self.assertEqual(len(called), 1)
+        self.assertIn("testCount", lexer.facts.cost)
+        lexer.facts.Clear()
+        self.assertEqual(lexer.GetFact("testCount"), 2)
+
+    def testDependencies(self):
+        nsiqcppstyle_facts.AddFact("testBase", lambda lexer: 1)
+        nsiqcppstyle_facts.AddFact("testMiddle", lambda lexer: lexer.GetFact("testBase") + 1, ["testBase"])
+        nsiqcppstyle_facts.AddFact("testTop", lambda lexer: lexer.GetFact("testMiddle") + 1,
+                                   ["testMiddle", "testBase"])
+        self.assertEqual(nsiqcppstyle_facts.GetDependencies("testTop"), ["testBase", "testMiddle"])
+        ruleManager = nsiqcppstyle_rulemanager.ruleManager
+        ruleManager.RequireFacts("testTop")
+        try:
+            self.assertTrue({"testTop", "testMiddle", "testBase"} <= ruleManager.requiredFacts)
+        finally:
+            ruleManager.requiredFacts -= {"testTop", "testMiddle", "testBase"}
+        # The nested facts are counted once in the total
+        lexer = self.GetLexer("a.cpp", "int a;")
+        self.assertEqual(lexer.GetFact("testTop"), 3)
+        self.assertEqual(lexer.facts.totalCost, lexer.facts.cost["testTop"])
+
+    def testUnknownFact(self):
+        self.assertRaises(KeyError, nsiqcppstyle_facts.AddFact,
+                          "testUnknown", lambda lexer: None, ["noSuchFact"])
+        self.assertRaises(KeyError, nsiqcppstyle_rulemanager.ruleManager.RequireFacts, "noSuchFact")
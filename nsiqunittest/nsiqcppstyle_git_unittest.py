@@ -0,0 +1,100 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import nsiqcppstyle_git
+
+DIFF = """diff --git a/src/a.cpp b/src/a.cpp
+index 1111111..2222222 100644
+--- a/src/a.cpp
++++ b/src/a.cpp
+@@ -3 +3 @@ int a;
+-int b;
++int c;
+@@ -10,0 +11,2 @@ int d;
++int e;
++int f;
+@@ -20,2 +22,0 @@ int g;
+-int h;
+-int i;
+diff --git a/old.h b/old.h
+deleted file mode 100644
+--- a/old.h
++++ /dev/null
+@@ -1 +0,0 @@
+-int j;
+diff --git "a/sp ace\\tb.h" "b/sp ace\\tb.h"
+new file mode 100644
+--- /dev/null
++++ "b/sp ace\\tb.h"
+@@ -0,0 +1 @@
++int k;
+"""
+
+
+class gitTest(unittest.TestCase):
+    def testParseDiff(self):
+        lineRanges = nsiqcppstyle_git.ParseDiff(DIFF, os.sep + "top")
+        self.assertEqual(lineRanges, {
+            os.path.join(os.sep + "top", "src", "a.cpp"): [(3, 3), (11, 12)],
+            os.path.join(os.sep + "top", "sp ace\tb.h"): [(1, 1)]})
+
+    def testIsReported(self):
+        changedLines = nsiqcppstyle_git.ChangedLines({"a.cpp": [(11, 12), (3, 3)], "b.cpp": []},
+                                                     ["RULE_FILE"])
+        self.assertTrue(changedLines.IsChangedFile("b.cpp"))
+        self.assertFalse(changedLines.IsChangedFile("c.cpp"))
+        self.assertEqual([lineno for lineno in range(1, 15) if changedLines.IsReported("a.cpp", lineno, "RULE_A")],
+                         [3, 11, 12])
+        self.assertFalse(changedLines.IsReported("b.cpp", 1, "RULE_A"))
+        self.assertTrue(changedLines.IsReported("b.cpp", 1, "RULE_FILE"))
+        self.assertFalse(changedLines.IsReported("c.cpp", 1, "RULE_FILE"))
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not available")
+class repositoryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = os.path.realpath(tempfile.mkdtemp())
+        self.Git("init")
+        self.WriteFile("a.cpp", "int a;\nint b;\n")
+        self.Git("add", ".")
+        self.Git("commit", "-m", "base")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def Git(self, *args):
+        subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@test"] + list(args),
+                       cwd=self.directory, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def WriteFile(self, filename, data):
+        with open(os.path.join(self.directory, filename), "w", newline="") as f:
+            f.write(data)
+
+    def testGetChangedLines(self):
+        self.WriteFile("a.cpp", "int a;\nint c;\nint d;\n")
+        changedLines = nsiqcppstyle_git.GetChangedLines(self.directory, "HEAD")
+        self.assertEqual(changedLines.lineRanges, {os.path.join(self.directory, "a.cpp"): ([2], [3])})
+        self.assertRaises(nsiqcppstyle_git.GitError, nsiqcppstyle_git.GetChangedLines, self.directory, "nosuch")
+
+    def testStagedBlobs(self):
+        self.WriteFile("a.cpp", "int a;\r\nint c;\r\n")
+        self.WriteFile("b c.h", "int e;\n")
+        self.Git("add", ".")
+        # Not staged
+        self.WriteFile("a.cpp", "int f;\n")
+        changedLines = nsiqcppstyle_git.GetChangedLines(self.directory)
+        self.assertEqual(changedLines.GetFiles(), [os.path.join(self.directory, "a.cpp"),
+                                                   os.path.join(self.directory, "b c.h")])
+        self.assertTrue(changedLines.IsReported(os.path.join(self.directory, "a.cpp"), 2, "RULE_A"))
+        blobs = nsiqcppstyle_git.StagedBlobs(self.directory)
+        try:
+            self.assertEqual(blobs.Read(os.path.join(self.directory, "a.cpp")), "int a;\nint c;\n")
+            self.assertEqual(blobs.Read(os.path.join(self.directory, "b c.h")), "int e;\n")
+            self.assertRaises(nsiqcppstyle_git.GitError, blobs.Read, os.path.join(self.directory, "d.h"))
+        finally:
+            blobs.Close()
@@ -0,0 +1,185 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import os
+import shutil
+import tempfile
+import unittest
+import nsiqcppstyle_incremental
+import nsiqcppstyle_reporter
+from nsiqcppstyle_state import _nsiqcppstyle_state
+
+
+class manifestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.target = os.path.join(self.directory, "target")
+        os.makedirs(os.path.join(self.target, "sub"))
+        self.manifestPath = os.path.join(self.directory, "manifest.json")
+        self.files = [self.WriteFile("a.cpp", "int a;\n"), self.WriteFile(os.path.join("sub", "a.cpp"), "int a;\n")]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def WriteFile(self, filename, data):
+        path = os.path.join(self.target, filename)
+        with open(path, "w") as f:
+            f.write(data)
+        return path
+
+    def Run(self, configHash="config", violations=[], mappedValues=[]):
+        """ Return the files which are new or changed and record them """
+        manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath, self.target, configHash)
+        changed = [eachFile for eachFile in self.files if manifest.GetResult(eachFile) is None]
+        for eachFile in changed:
+            manifest.Record(eachFile, violations, mappedValues)
+        manifest.Save()
+        return changed
+
+    def testUnchangedFilesAreSkipped(self):
+        self.assertEqual(self.Run(), self.files)
+        self.assertEqual(self.Run(), [])
+
+    def testSameNameAndSize(self):
+        self.Run()
+        # The same size in the other directory
+        self.WriteFile(os.path.join("sub", "a.cpp"), "int b;\n")
+        self.assertEqual(self.Run(), [self.files[1]])
+        self.assertEqual(self.Run(), [])
+
+    def testTouchedFile(self):
+        self.Run()
+        stat = os.stat(self.files[0])
+        os.utime(self.files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.Run(), [])
+
+    def testConfigChanged(self):
+        self.Run()
+        self.assertEqual(self.Run("other"), self.files)
+
+    def testFileNotRecorded(self):
+        manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath, self.target, "config")
+        self.assertEqual(manifest.GetResult(self.files[0]), None)
+        manifest.Save()
+        self.assertEqual(self.Run(), self.files)
+
+    def testRecordedResult(self):
+        violations = [[1, 0, "RULE_A", "message"]]
+        self.Run(violations=violations, mappedValues=[["a.cpp", "/"], None])
+        manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath, self.target, "config")
+        result = manifest.GetResult(self.files[0])
+        self.assertEqual(result["violations"], violations)
+        self.assertEqual(result["mappedValues"], [["a.cpp", "/"], None])
+
+    def testIncompleteResult(self):
+        # A rule was skipped
+        self.Run(violations=None)
+        self.assertEqual(self.Run(), self.files)
+        # The mapped value can't be kept
+        self.Run("other", mappedValues=[object()])
+        self.assertEqual(self.Run("other"), self.files)
+
+    def testConfigHash(self):
+        rulesPath = os.path.join(os.getcwd(), "rules")
+        rule = "RULE_4_4_A_do_not_write_over_120_columns_per_line"
+        configHash = nsiqcppstyle_incremental.GetConfigHash(rulesPath, [rule], {}, {}, "1")
+        self.assertEqual(configHash, nsiqcppstyle_incremental.GetConfigHash(rulesPath, [rule], {}, {}, "1"))
+        self.assertNotEqual(configHash, nsiqcppstyle_incremental.GetConfigHash(rulesPath, [rule], {"a": "b"}, {}, "1"))
+        self.assertNotEqual(configHash, nsiqcppstyle_incremental.GetConfigHash(rulesPath, [rule], {}, {"A": "1"}, "1"))
+        self.assertNotEqual(configHash, nsiqcppstyle_incremental.GetConfigHash(rulesPath, [], {}, {}, "1"))
+
+    def testSameTargetName(self):
+        violations = [[1, 0, "RULE_A", "message"]]
+        self.Run(violations=violations)
+        # The target of the same name in the other directory
+        otherTarget = os.path.join(self.directory, "other", "target")
+        os.makedirs(otherTarget)
+        otherFile = os.path.join(otherTarget, "a.cpp")
+        shutil.copy2(self.files[0], otherFile)
+        manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath, otherTarget, "config")
+        self.assertEqual(manifest.GetResult(otherFile), None)
+        manifest.Record(otherFile, [], [])
+        manifest.Save()
+        # The entries of the first target are kept
+        manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath, self.target, "config")
+        self.assertEqual(manifest.GetResult(self.files[0])["violations"], violations)
+        manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath, otherTarget, "config")
+        self.assertEqual(manifest.GetResult(otherFile)["violations"], [])
+
+    def testMergedResults(self):
+        violations = [[1, 0, "RULE_A", "message"]]
+        cwd = os.getcwd()
+        os.chdir(self.directory)
+        try:
+            for shard, eachFile in enumerate(self.files):
+                manifest = nsiqcppstyle_incremental.FileManifest(self.manifestPath + str(shard), self.target,
+                                                                 "config")
+                manifest.GetResult(eachFile)
+                manifest.Record(eachFile, violations, [shard])
+                manifest.Save()
+            # Merged on the other machine from the same directory of the checkout
+            os.makedirs(os.path.join(self.directory, "moved", "target"))
+            os.chdir(os.path.join(self.directory, "moved"))
+            manifestPaths = [self.manifestPath + str(shard) for shard in range(len(self.files))]
+            # The sources aren't read
+            merged = nsiqcppstyle_incremental.MergedResults(manifestPaths,
+                                                            os.path.join(self.directory, "moved", "target"), "config")
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(merged.GetFiles(), [os.path.join(self.directory, "moved", "target", "a.cpp"),
+                                             os.path.join(self.directory, "moved", "target", "sub", "a.cpp")])
+        self.assertEqual(merged.GetResult(merged.GetFiles()[1])["mappedValues"], [1])
+        self.assertEqual(merged.GetResult(merged.GetFiles()[0])["violations"], violations)
+        # The target of the other directory has no results
+        self.assertEqual(nsiqcppstyle_incremental.MergedResults(manifestPaths, self.target, "config").GetFiles(), [])
+        os.chdir(self.directory)
+        try:
+            self.assertRaises(nsiqcppstyle_incremental.ManifestError, nsiqcppstyle_incremental.MergedResults,
+                              manifestPaths, self.target, "other")
+        finally:
+            os.chdir(cwd)
+        self.assertRaises(nsiqcppstyle_incremental.ManifestError, nsiqcppstyle_incremental.MergedResults,
+                          [self.manifestPath], self.target, "config")
+
+
+class recordingTest(unittest.TestCase):
+    def setUp(self):
+        self.outputFormat = _nsiqcppstyle_state.output_format
+        self.error = nsiqcppstyle_reporter.Error
+        nsiqcppstyle_reporter.Error = nsiqcppstyle_reporter.ErrorInternal
+        _nsiqcppstyle_state.output_format = "csv"
+        _nsiqcppstyle_state.ResetRuleSuppression()
+        _nsiqcppstyle_state.ResetErrorCount()
+
+    def tearDown(self):
+        _nsiqcppstyle_state.output_format = self.outputFormat
+        nsiqcppstyle_reporter.Error = self.error
+
+    def testRecordAndReplay(self):
+        rows = []
+
+        class Writer(object):
+            def writerow(self, row):
+                rows.append(row)
+        writer = nsiqcppstyle_reporter.writer
+        nsiqcppstyle_reporter.writer = Writer()
+        try:
+            recorder = nsiqcppstyle_reporter.StartRecording()
+            nsiqcppstyle_reporter.Error(nsiqcppstyle_reporter.DummyToken("a.cpp", "int a;", 2, 3),
+                                        "rules.RULE_A", "message")
+            nsiqcppstyle_reporter.Error(nsiqcppstyle_reporter.DummyToken("a.cpp", "int a; // NS", 3, 0),
+                                        "rules.RULE_A", "suppressed")
+            self.assertIs(nsiqcppstyle_reporter.StopRecording(), recorder)
+            self.assertEqual(recorder.violations, [[2, 3, "RULE_A", "message"]])
+            self.assertTrue(recorder.complete)
+
+            nsiqcppstyle_reporter.ReplayViolations("a.cpp", recorder.violations)
+            self.assertEqual(rows, [("a.cpp", 2, 3, "message", "RULE_A", "")] * 2)
+            self.assertEqual(_nsiqcppstyle_state.errorPerFile, {"a.cpp": {"RULE_A": 2}})
+
+            recorder = nsiqcppstyle_reporter.StartRecording()
+            nsiqcppstyle_reporter.ReportRuleSkipped("a.cpp", "rules.RULE_A", "rule skipped (budget)")
+            nsiqcppstyle_reporter.StopRecording()
+            self.assertFalse(recorder.complete)
+        finally:
+            nsiqcppstyle_reporter.writer = writer
@@ -0,0 +1,82 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import os
+import shutil
+import tempfile
+import unittest
+import nsiqcppstyle_parallel
+import nsiqcppstyle_reporter
+from nsiqcppstyle_outputer import _consoleOutputer as console
+from nsiqcppstyle_state import _NsiqCppStyleState
+
+LONG_LINE_RULE = "RULE_4_4_A_do_not_write_over_120_columns_per_line"
+
+
+class parallelTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        # The rule unit tests replace it (the workers are forked)
+        self.error = nsiqcppstyle_reporter.Error
+        nsiqcppstyle_reporter.Error = nsiqcppstyle_reporter.ErrorInternal
+
+    def tearDown(self):
+        nsiqcppstyle_reporter.Error = self.error
+        shutil.rmtree(self.directory)
+
+    def WriteFile(self, filename, data):
+        path = os.path.join(self.directory, filename)
+        with open(path, "w") as f:
+            f.write(data)
+        return path
+
+    def testAnalyzeFiles(self):
+        files = [self.WriteFile("a%d.cpp" % i, "int a;\n" * i + "// " + "a" * 130 + "\n")
+                 for i in range(5)]
+        settings = nsiqcppstyle_parallel.GetSettings(os.getcwd(), [LONG_LINE_RULE], 0, 0)
+        settings["consoleLevel"] = console.Level.Info
+        settings["outputFormat"] = "vs7"
+        results = list(nsiqcppstyle_parallel.AnalyzeFiles(files, 2, settings))
+        self.assertEqual([result.filename for result in results], files)
+        for i, result in enumerate(results):
+            self.assertTrue(result.output.startswith("Processing:  " + files[i] + "\n"))
+            self.assertIn("%s(%d, 0):" % (files[i], i + 1), result.output)
+            self.assertEqual(result.errorCount, 1)
+            self.assertEqual(result.errorPerFile, {files[i]: {LONG_LINE_RULE: 1}})
+
+    def testCostliestFirst(self):
+        files = [self.WriteFile("a%d.cpp" % i, "int a;\n" * (i * 10)) for i in range(6)]
+        settings = nsiqcppstyle_parallel.GetSettings(os.getcwd(), [LONG_LINE_RULE], 0, 0)
+        results = list(nsiqcppstyle_parallel.AnalyzeFiles(files, 2, settings, [1, 1, 1, 1, 1, 100]))
+        # Yielded in the order of the files
+        self.assertEqual([result.filename for result in results], files)
+        self.assertTrue(all(result.cost >= 0 for result in results))
+
+    def testGetChunks(self):
+        files = ["a%d.cpp" % i for i in range(40)]
+        costs = [100] + [1] * 39
+        chunks = nsiqcppstyle_parallel.GetChunks(files, 2, costs)
+        self.assertEqual(chunks[0], ["a0.cpp"])
+        self.assertEqual(sorted(sum(chunks, [])), sorted(files))
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        self.assertEqual(nsiqcppstyle_parallel.GetChunks(files[:3], 2), [[eachFile] for eachFile in files[:3]])
+
+    def testMappedValues(self):
+        os.mkdir(os.path.join(self.directory, "sub"))
+        files = [self.WriteFile("a.cpp", ""), self.WriteFile(os.path.join("sub", "a.cpp"), "")]
+        settings = nsiqcppstyle_parallel.GetSettings(
+            os.getcwd(), ["RULE_3_2_B_do_not_use_same_filename_more_than_once"], 0, 0)
+        results = list(nsiqcppstyle_parallel.AnalyzeFiles(files, 2, settings))
+        # The filenames are reduced by the main process
+        self.assertEqual([result.mappedValues for result in results],
+                         [[("a.cpp", os.path.dirname(eachFile))] for eachFile in files])
+        self.assertEqual([result.errorCount for result in results], [0, 0])
+
+    def testMergeErrorCount(self):
+        state = _NsiqCppStyleState()
+        state.IncrementErrorCount("RULE_A", "a.cpp")
+        state.MergeErrorCount(3, {"RULE_B": 1, "RULE_A": 2},
+                              {"a.cpp": {"RULE_A": 2}, "b.cpp": {"RULE_B": 1}})
+        self.assertEqual(state.error_count, 4)
+        self.assertEqual(list(state.errorPerChecker.items()), [("RULE_A", 3), ("RULE_B", 1)])
+        self.assertEqual(state.errorPerFile, {"a.cpp": {"RULE_A": 3}, "b.cpp": {"RULE_B": 1}})
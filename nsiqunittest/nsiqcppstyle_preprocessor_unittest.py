@@ -0,0 +1,80 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import unittest
+from nsiqcppstyle_preprocessor import ConditionalState, Evaluate, ParseDefine
+
+
+class preprocessorTest(unittest.TestCase):
+    def testEvaluate(self):
+        macros = {"A": "1", "B": "A + 2", "C": None, "D": ""}
+        self.assertEqual(Evaluate("1 + 2 * 3", macros), 7)
+        self.assertEqual(Evaluate("(1 + 2) * 3 == 9", macros), 1)
+        self.assertEqual(Evaluate("0x10 >> 2 | 1", macros), 5)
+        self.assertEqual(Evaluate("-7 / 2", macros), -3)
+        self.assertEqual(Evaluate("-7 % 2", macros), -1)
+        self.assertEqual(Evaluate("'a' == 97 && 10L > 011", macros), 1)
+        self.assertEqual(Evaluate("A ? 2 : 3", macros), 2)
+        self.assertEqual(Evaluate("B == 3", macros), 1)
+        self.assertEqual(Evaluate("defined(A) && !defined C", macros), 1)
+        # An undefined macro is 0
+        self.assertEqual(Evaluate("C", macros), 0)
+
+    def testEvaluateUnknown(self):
+        macros = {"A": "1", "C": None, "D": ""}
+        self.assertEqual(Evaluate("UNKNOWN", macros), None)
+        self.assertEqual(Evaluate("defined(UNKNOWN)", macros), None)
+        self.assertEqual(Evaluate("UNKNOWN > 1", macros), None)
+        self.assertEqual(Evaluate("FUNC(1)", macros), None)
+        self.assertEqual(Evaluate("D", macros), None)
+        self.assertEqual(Evaluate("1 / 0", macros), None)
+        self.assertEqual(Evaluate("1 +", macros), None)
+        # One side can decide the result of && and ||
+        self.assertEqual(Evaluate("UNKNOWN && C", macros), 0)
+        self.assertEqual(Evaluate("UNKNOWN || A", macros), 1)
+        self.assertEqual(Evaluate("UNKNOWN || C", macros), None)
+
+    def testParseDefine(self):
+        self.assertEqual(ParseDefine("A"), ("A", "1"))
+        self.assertEqual(ParseDefine("A=2"), ("A", "2"))
+        self.assertEqual(ParseDefine("A="), ("A", ""))
+
+    def GetActiveStates(self, macros, directives):
+        state = ConditionalState(macros)
+        actives = []
+        for kind, expression in directives:
+            state.Process(kind, expression)
+            actives.append(state.IsActive())
+        return actives
+
+    def testConditionalState(self):
+        directives = [("if", "A == 2"), ("elif", "A == 1"), ("else", ""), ("endif", "")]
+        self.assertEqual(self.GetActiveStates({"A": "1"}, directives), [False, True, False, True])
+        self.assertEqual(self.GetActiveStates({"A": "3"}, directives), [False, False, True, True])
+        self.assertEqual(self.GetActiveStates({}, directives), [True, True, True, True])
+
+    def testConditionalStateNested(self):
+        directives = [("ifdef", "A"), ("ifndef", "B"), ("else", ""), ("endif", ""),
+                      ("else", ""), ("if", "1"), ("endif", ""), ("endif", "")]
+        self.assertEqual(self.GetActiveStates({"A": "1", "B": None}, directives),
+                         [True, True, False, True, False, False, False, True])
+        self.assertEqual(self.GetActiveStates({"A": None}, directives),
+                         [False, False, False, False, True, True, True, True])
+
+    def testConditionalStateUnknownElif(self):
+        # The branches after the unknown condition are active unless one is taken
+        directives = [("if", "0"), ("elif", "UNKNOWN"), ("elif", "1"), ("else", ""), ("endif", "")]
+        self.assertEqual(self.GetActiveStates({}, directives), [False, True, True, False, True])
+
+    def testConditionalStateWithoutMacro(self):
+        # The constant conditions are evaluated without any macro
+        self.assertEqual(self.GetActiveStates({}, [("if", "1"), ("else", ""), ("endif", "")]),
+                         [True, False, True])
+        self.assertEqual(self.GetActiveStates({}, [("if", "0"), ("else", ""), ("endif", "")]),
+                         [False, True, True])
+        self.assertEqual(self.GetActiveStates({}, [("if", "0 || X"), ("else", ""), ("endif", "")]),
+                         [True, True, True])
+        self.assertEqual(self.GetActiveStates({}, [("if", "0 && X"), ("else", ""), ("endif", "")]),
+                         [False, True, True])
+        self.assertEqual(self.GetActiveStates({}, [("if", "0"), ("elif", "1"), ("else", ""), ("endif", "")]),
+                         [False, True, False, True])
@@ -0,0 +1,348 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import nsiqcppstyle_checker
+import nsiqcppstyle_facts
+import nsiqcppstyle_rulemanager
+import nsiqcppstyle_rulemanifest
+from nsiqcppstyle_rulemanager import MapReduceRule, RuleBase
+
+
+class CountingRule(RuleBase):
+    instances = []
+
+    def __init__(self):
+        self.functions = []
+        self.ended = False
+        CountingRule.instances.append(self)
+
+    def on_function_name(self, lexer, fullName, decl, contextStack, context):
+        self.functions.append(fullName)
+
+    def on_file_end(self, lexer, filename, dirname):
+        self.ended = True
+
+
+class ProjectCountingRule(CountingRule):
+    perFile = False
+
+
+class FilenameCountRule(MapReduceRule):
+    def __init__(self):
+        self.reduced = []
+        self.reported = []
+
+    def map(self, lexer, filename, dirname):
+        return len(filename)
+
+    def reduce(self, filename, value):
+        self.reduced.append((filename, value))
+
+    def report(self, targetName):
+        self.reported.append(targetName)
+
+
+class ruleManagerTest(unittest.TestCase):
+    def setUp(self):
+        self.ruleManager = nsiqcppstyle_rulemanager.ruleManager
+        self.ruleManager.ResetRules()
+        self.ruleManager.ResetRegisteredRules()
+        CountingRule.instances = []
+
+    def tearDown(self):
+        self.ruleManager.ResetRegisteredRules()
+
+    def testRuleInstancePerFile(self):
+        self.ruleManager.AddRuleClass(CountingRule)
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "void A() {}")
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "b.cpp", "void B() {}")
+        self.assertEqual(len(CountingRule.instances), 2)
+        self.assertEqual(CountingRule.instances[0].functions, ["A"])
+        self.assertEqual(CountingRule.instances[1].functions, ["B"])
+        self.assertTrue(CountingRule.instances[1].ended)
+        # The per file instance is not called after the end of the file
+        self.assertEqual(self.ruleManager.functionNameRules, [])
+
+    def testRuleInstancePerRuleManager(self):
+        self.ruleManager.AddRuleClass(ProjectCountingRule)
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "void A() {}")
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "b.cpp", "void B() {}")
+        self.assertEqual(len(CountingRule.instances), 1)
+        self.assertEqual(CountingRule.instances[0].functions, ["A", "B"])
+
+    def testOldStyleRule(self):
+        called = []
+        self.ruleManager.AddFunctionNameRule(
+            lambda lexer, fullName, decl, contextStack, context: called.append(fullName))
+        self.ruleManager.AddRuleClass(CountingRule)
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "void A() {}")
+        self.assertEqual(called, ["A"])
+        self.assertEqual(CountingRule.instances[0].functions, ["A"])
+
+    def testMapReduceRule(self):
+        self.ruleManager.AddMapReduceRule(FilenameCountRule)
+        rule = self.ruleManager.mapReduceRules[0]
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "void A() {}")
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "bb.cpp", "void B() {}")
+        self.assertEqual(rule.reduced, [("a.cpp", 5), ("bb.cpp", 6)])
+        # The worker keeps the values for the main process
+        self.ruleManager.deferReduce = True
+        try:
+            nsiqcppstyle_checker.ProcessFile(self.ruleManager, "ccc.cpp", "void C() {}")
+        finally:
+            self.ruleManager.deferReduce = False
+        self.assertEqual(len(rule.reduced), 2)
+        self.ruleManager.RunReduceRules("ccc.cpp", self.ruleManager.mappedValues)
+        self.assertEqual(rule.reduced[-1], ("ccc.cpp", 7))
+        self.ruleManager.RunProjectRules("target")
+        self.assertEqual(rule.reported, ["target"])
+
+    def testFileTextRule(self):
+        found = []
+        self.ruleManager.AddFileTextRule(
+            r"strcpy", lambda lexer, match, token, lineno: found.append(("A", token.value, lineno)))
+        self.ruleManager.AddFileTextRule(
+            r"str\w+", lambda lexer, match, token, lineno: found.append(("B", match.group(0), lineno)))
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp",
+                                         "void A() {\n  strcpy(a, b); /* strcat */\n}")
+        self.assertEqual(found, [("A", "strcpy", 2), ("B", "strcpy", 2),
+                                 ("B", "strcat", 2)])
+        # The token of the last match is the comment
+        found = []
+        self.ruleManager.AddFileTextRule(
+            r"cat", lambda lexer, match, token, lineno: found.append(("C", token.type, lineno)))
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "/*\n strcat */")
+        self.assertEqual(found, [("B", "strcat", 2), ("C", "COMMENT", 2)])
+
+    def testFileTextRuleNotCombined(self):
+        found = []
+        self.ruleManager.AddFileTextRule(
+            r"(?i)todo", lambda lexer, match, token, lineno: found.append(("A", match.group(0), lineno)))
+        self.ruleManager.AddFileTextRule(
+            r"(?P<name>str)\w+", lambda lexer, match, token, lineno: found.append(("B", match.group(0), lineno)))
+        self.ruleManager.AddFileTextRule(
+            r"(?P<name>TODO)", lambda lexer, match, token, lineno: found.append(("C", match.group(0), lineno)))
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp",
+                                         "// TODO strcpy\n/* todo */ strcat(a, b);")
+        self.assertEqual(found, [("A", "TODO", 1), ("C", "TODO", 1), ("B", "strcpy", 1),
+                                 ("A", "todo", 2), ("B", "strcat", 2)])
+
+    def testFileTextRuleAfterBulkLineRuleError(self):
+        found = []
+
+        def RaiseError(lexer, lines):
+            raise ValueError("bulk line rule")
+        self.ruleManager.AddBulkLineRule(RaiseError)
+        self.ruleManager.AddFileTextRule(
+            r"strcpy", lambda lexer, match, token, lineno: found.append(lineno))
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "void A() {\n  strcpy(a, b);\n}")
+        self.assertEqual(found, [2])
+
+    def testManifestIsUpToDate(self):
+        # Run "python nsiqcppstyle_rulemanifest.py" when this test fails
+        rulesPath = self.ruleManager.rulesPath
+        with open(nsiqcppstyle_rulemanifest.GetManifestPath(rulesPath)) as f:
+            self.assertEqual(nsiqcppstyle_rulemanifest.GenerateManifest(rulesPath), json.load(f))
+
+    def testStaleManifestEntries(self):
+        rulesPath = tempfile.mkdtemp()
+        try:
+            def WriteRule(name, data):
+                with open(os.path.join(rulesPath, name + ".py"), "w") as f:
+                    f.write(data)
+            WriteRule("RULE_A", "ruleManager.AddFileStartRule(RunRule)\n")
+            WriteRule("RULE_B", "ruleManager.AddFileStartRule(RunRule)\n")
+            nsiqcppstyle_rulemanifest.SaveManifest(rulesPath, nsiqcppstyle_rulemanifest.GenerateManifest(rulesPath))
+            # The changed rule, the added rule and the removed rule
+            WriteRule("RULE_A", "ruleManager.AddFileStartRule(RunRule)\nruleManager.AddFunctionScopeRule(RunRule)\n")
+            WriteRule("RULE_C", "ruleManager.AddLineRule(RunRule)\n")
+            os.remove(os.path.join(rulesPath, "RULE_B.py"))
+            manifestData = open(nsiqcppstyle_rulemanifest.GetManifestPath(rulesPath)).read()
+            manifest = nsiqcppstyle_rulemanifest.LoadManifest(rulesPath)
+            self.assertEqual(manifest, nsiqcppstyle_rulemanifest.GenerateManifest(rulesPath))
+            self.assertEqual(sorted(manifest), ["RULE_A", "RULE_C"])
+            self.assertEqual(manifest["RULE_A"]["stage"], "context")
+            # The manifest isn't written
+            self.assertEqual(open(nsiqcppstyle_rulemanifest.GetManifestPath(rulesPath)).read(), manifestData)
+            os.remove(nsiqcppstyle_rulemanifest.GetManifestPath(rulesPath))
+            self.assertEqual(sorted(nsiqcppstyle_rulemanifest.LoadManifest(rulesPath)), ["RULE_A", "RULE_C"])
+            self.assertFalse(os.path.exists(nsiqcppstyle_rulemanifest.GetManifestPath(rulesPath)))
+        finally:
+            shutil.rmtree(rulesPath)
+
+    def testManifestParallel(self):
+        rules = {
+            "RULE_A": "names = {}\ndef RunRule(lexer, filename, dirname):\n    names[filename] = dirname\n",
+            "RULE_B": "names = []\ndef RunRule(lexer, filename, dirname):\n    names.append(filename)\n",
+            "RULE_C": "names = {}\ndef RunRule(lexer, filename, dirname):\n    names.setdefault(filename, []).append(1)\n",
+            # The local name and the read of the module-level name
+            "RULE_D": "names = {}\ndef RunRule(lexer, filename, dirname):\n"
+                      "    found = names.get(filename)\n    names2 = {}\n    names2[filename] = found\n",
+            "RULE_E": "names = {}\ndef RunRule(lexer, filename, dirname):\n    names = {}\n    names[filename] = 1\n",
+        }
+        rulesPath = tempfile.mkdtemp()
+        try:
+            for name, data in rules.items():
+                with open(os.path.join(rulesPath, name + ".py"), "w") as f:
+                    f.write(data + "ruleManager.AddFileStartRule(RunRule)\n")
+            manifest = nsiqcppstyle_rulemanifest.GenerateManifest(rulesPath)
+        finally:
+            shutil.rmtree(rulesPath)
+        self.assertEqual(dict((name, manifest[name]["parallel"]) for name in rules),
+                         {"RULE_A": False, "RULE_B": False, "RULE_C": False, "RULE_D": True, "RULE_E": True})
+
+    def testManifestKinds(self):
+        manifest = self.ruleManager.manifest
+        self.assertEqual(manifest["RULE_4_4_A_do_not_write_over_120_columns_per_line"]["kinds"],
+                         ["bulkLineRules"])
+        self.assertEqual(manifest["RULE_A_3_avoid_too_deep_blocks"]["kinds"],
+                         ["functionNameRules", "functionScopeRules"])
+        self.assertIn("LBRACE", manifest["RULE_A_3_avoid_too_deep_blocks"]["tokenTypes"])
+        self.assertEqual(manifest["RULE_3_1_A_do_not_start_filename_with_underbar"]["stage"], "filename")
+        self.assertEqual(manifest["RULE_4_4_A_do_not_write_over_120_columns_per_line"]["stage"], "tokens")
+        # The file start rule which reads the tokens
+        self.assertEqual(manifest["RULE_8_1_A_provide_file_info_comment"]["stage"], "context")
+        self.assertTrue(manifest["RULE_3_2_F_use_representitive_classname_for_cpp_filename"]["parallel"])
+        self.assertTrue(manifest["RULE_3_2_B_do_not_use_same_filename_more_than_once"]["parallel"])
+        # The file callbacks with the session callbacks
+        self.assertFalse(manifest["TOOL_trace_nsiqcppstyle_callbacks"]["parallel"])
+
+    def testSerialRules(self):
+        self.ruleManager.LoadRules(["TOOL_trace_nsiqcppstyle_callbacks",
+                                    "RULE_4_4_A_do_not_write_over_120_columns_per_line"])
+        try:
+            self.assertEqual(self.ruleManager.GetSerialRules(),
+                             ["TOOL_trace_nsiqcppstyle_callbacks"])
+        finally:
+            self.ruleManager.ResetRules()
+
+    def testRulesKeptForSameRuleList(self):
+        sameFilename = "RULE_3_2_B_do_not_use_same_filename_more_than_once"
+        lineRule = "RULE_4_4_A_do_not_write_over_120_columns_per_line"
+        try:
+            self.ruleManager.LoadRules([sameFilename, lineRule])
+            loadedRule = list(self.ruleManager.loadedRule)
+            bulkLineRules = list(self.ruleManager.bulkLineRules)
+            mapReduceRule = self.ruleManager.mapReduceRules[0]
+            mapReduceRule.reduce("a.cpp", ("a.cpp", "/"))
+            # The modules are kept and the state is reset
+            self.ruleManager.LoadRules([sameFilename, lineRule])
+            self.assertEqual(self.ruleManager.loadedRule, loadedRule)
+            self.assertEqual(self.ruleManager.bulkLineRules, bulkLineRules)
+            self.assertEqual(len(self.ruleManager.mapReduceRules), 1)
+            self.assertIsNot(self.ruleManager.mapReduceRules[0], mapReduceRule)
+            self.assertEqual(self.ruleManager.mapReduceRules[0].filenameMap, {})
+            # The other rule list is imported again
+            self.ruleManager.LoadRules([lineRule])
+            self.assertEqual(len(self.ruleManager.mapReduceRules), 0)
+            self.assertIsNot(self.ruleManager.loadedRule[0], loadedRule[1])
+            # The rules are registered again after the reset
+            self.ruleManager.ResetRegisteredRules()
+            self.ruleManager.LoadRules([lineRule])
+            self.assertEqual(len(self.ruleManager.bulkLineRules), 1)
+        finally:
+            self.ruleManager.ResetRules()
+
+    def testSerialRulesImportedAgain(self):
+        ruleNames = ["TOOL_trace_nsiqcppstyle_callbacks"]
+        try:
+            self.ruleManager.LoadRules(ruleNames)
+            ruleModule = self.ruleManager.loadedRule[0]
+            self.ruleManager.LoadRules(ruleNames)
+            self.assertIsNot(self.ruleManager.loadedRule[0], ruleModule)
+        finally:
+            self.ruleManager.ResetRules()
+
+    def testRuleErrorWithoutContext(self):
+        import rules.RULE_4_4_A_do_not_write_over_120_columns_per_line as lineRule
+        called = []
+
+        def RaiseError(lexer, line, lineno):
+            called.append(lineno)
+            raise ValueError("line rule")
+        # The rule of the tokens stage, so the context isn't constructed
+        RaiseError.__module__ = lineRule.__name__
+        self.ruleManager.ResetRegisteredRules()
+        self.ruleManager.AddLineRule(RaiseError)
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "tokens")
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "int a;\nint b;\n")
+        self.assertEqual(called, [1, 2])
+
+    def testRequiredStage(self):
+        import rules.RULE_3_1_A_do_not_start_filename_with_underbar as filenameRule
+        import rules.RULE_4_4_A_do_not_write_over_120_columns_per_line as lineRule
+        self.ruleManager.ResetRegisteredRules()
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "filename")
+        self.ruleManager.AddFileStartRule(filenameRule.RunRule)
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "filename")
+        # The file is not read
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "/nonexistent/a.cpp")
+        self.ruleManager.AddBulkLineRule(lineRule.RunRule)
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "tokens")
+        # A rule which is not in the manifest needs the context
+        self.ruleManager.AddRuleClass(CountingRule)
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "context")
+
+    def testRequiredStageOfRegisteredKind(self):
+        import rules.RULE_3_1_A_do_not_start_filename_with_underbar as filenameRule
+        called = []
+
+        def FunctionScopeRule(lexer, contextStack):
+            called.append(lexer.GetCurToken().value)
+        # The rule registers a callback which its manifest entry doesn't know
+        FunctionScopeRule.__module__ = filenameRule.__name__
+        self.ruleManager.ResetRegisteredRules()
+        self.ruleManager.AddFileStartRule(filenameRule.RunRule)
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "filename")
+        self.ruleManager.AddFunctionScopeRule(FunctionScopeRule)
+        self.assertEqual(self.ruleManager.GetRequiredStage(), "context")
+        nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "void A() {\n  B();\n}\n")
+        self.assertIn("B", called)
+
+    def testRuleSkippedOnBudget(self):
+        called = []
+
+        def SlowRule(lexer, contextStack):
+            called.append(lexer.GetCurToken())
+            end = time.process_time() + 0.01
+            while time.process_time() < end:
+                pass
+
+        self.ruleManager.AddRule(SlowRule)
+        self.ruleManager.SetTimeBudget(0.001, 0)
+        try:
+            nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "int a; int b;")
+            self.assertEqual(len(called), 1)
+            # The budget is reset at the start of the next file
+            nsiqcppstyle_checker.ProcessFile(self.ruleManager, "b.cpp", "int a; int b;")
+            self.assertEqual(len(called), 2)
+        finally:
+            self.ruleManager.SetTimeBudget(0, 0)
+
+    def testFactNotChargedToRule(self):
+        called = []
+
+        def SlowFact(lexer):
+            end = time.process_time() + 0.01
+            while time.process_time() < end:
+                pass
+            return True
+
+        def FactRule(lexer, contextStack):
+            called.append(lexer.GetFact("testSlowFact"))
+
+        nsiqcppstyle_facts.AddFact("testSlowFact", SlowFact)
+        self.ruleManager.RequireFacts("testSlowFact")
+        self.ruleManager.AddRule(FactRule)
+        self.ruleManager.SetTimeBudget(0.005, 0)
+        try:
+            nsiqcppstyle_checker.ProcessFile(self.ruleManager, "a.cpp", "int a; int b;")
+        finally:
+            self.ruleManager.SetTimeBudget(0, 0)
+        self.assertEqual(called, [True] * 6)
@@ -189,3 +189,119 @@ foo (bar*)[];
         navigator.Reset()
         tok = navigator.GetNextTokenSkipWhiteSpaceAndComment()
         assert(tok.type == 'ID' and tok.value == 'foo')
+
+    def testLineTable(self):
+        data = "int a;\n\n  // comment\n#define A \\\n\t 1\n/* a\n b */\n" + "x" * 130
+        navigator = nsiqcppstyle_checker.CppLexerNavigator("a.cpp", data)
+        table = navigator.GetLineTable()
+        self.assertEqual(len(table), 8)
+        self.assertIs(table, navigator.GetLineTable())
+        self.assertEqual([each.blank for each in table],
+                         [False, True, False, False, False, False, False, False])
+        self.assertEqual([each.commentOnly for each in table],
+                         [False, False, True, False, False, True, True, False])
+        self.assertEqual([each.preprocessor for each in table],
+                         [False, False, False, True, True, False, False, False])
+        self.assertEqual([each.continuation for each in table],
+                         [False, False, False, False, True, False, False, False])
+        self.assertEqual(table[2].indent, 2)
+        self.assertTrue(table[4].mixedIndent)
+        self.assertFalse(table[2].mixedIndent)
+        self.assertEqual(table[7].length, 130)
+        self.assertEqual(table[0].firstToken.value, "int")
+        self.assertIsNone(table[6].firstToken)
+
+    def testFunctionSignature(self):
+        data = """
+class A {
+public:
+    static const std::vector<int>& Get(int a, std::map<int, int> m = std::map<int, int>(),
+                                       void (*fp)(int, int)) const;
+    virtual bool IsX(void) = 0;
+};
+"""
+        navigator = nsiqcppstyle_checker.CppLexerNavigator("a.h", data)
+        nsiqcppstyle_checker.ConstructContextInfo(navigator)
+        functions = [t for t in navigator.tokenlist if t.type == "FUNCTION"]
+        self.assertEqual([t.value for t in functions], ["Get", "IsX"])
+
+        signature = navigator.GetFunctionSignature(functions[0])
+        self.assertIs(signature, navigator.GetFunctionSignature(functions[0]))
+        self.assertEqual([t.value for t in signature.specifiers], ["static"])
+        self.assertEqual("".join(t.value for t in signature.returnType), "conststd::vector<int>&")
+        self.assertEqual([t.value for t in signature.qualifiers], ["const"])
+        self.assertEqual((signature.startLine, signature.endLine), (4, 5))
+        self.assertEqual([p.nameToken.value for p in signature.parameters], ["a", "m", "fp"])
+        self.assertEqual("".join(t.value for t in signature.parameters[1].typeTokens), "std::map<int,int>")
+        self.assertEqual("".join(t.value for t in signature.parameters[1].default), "std::map<int,int>()")
+        # The commas in the template arguments but not in the parentheses of fp
+        self.assertEqual([t.lineno for t in signature.commas], [4, 4, 4, 4])
+
+        signature = navigator.GetFunctionSignature(functions[1])
+        self.assertEqual([t.value for t in signature.returnType], ["bool"])
+        self.assertEqual(signature.parameters, [])
+        self.assertEqual([t.value for t in signature.qualifiers], ["=", "0"])
+
+    def testDirectives(self):
+        data = """#include <stdio.h>
+#ifndef A
+#define A(x, y) \\
+    ((x) + (y))
+#if 0
+#pragma once
+#else
+#endif
+#endif
+#error what
+"""
+        navigator = nsiqcppstyle_checker.CppLexerNavigator("a.h", data)
+        self.assertEqual([d.kind for d in navigator.GetDirectives()],
+                         ["include", "ifndef", "define", "if", "pragma", "else", "endif", "endif", "other"])
+        self.assertEqual([d.level for d in navigator.GetDirectives()], [0, 0, 1, 1, 2, 1, 1, 0, 0])
+        include = navigator.GetDirectives("include")[0]
+        self.assertEqual(include.name, "<stdio.h>")
+        define = navigator.GetDirectives("define")[0]
+        self.assertIs(navigator.GetDirective(define.token), define)
+        self.assertEqual(define.name, "A")
+        self.assertEqual(define.text, "#define A(x, y)      ((x) + (y))")
+        self.assertEqual((define.startLine, define.endLine), (3, 4))
+        self.assertEqual(navigator.GetDirectives("undef"), [])
+
+    def testStringizingInContinuedLine(self):
+        data = """#define S(x) \\
+  #x
+#if 0
+int a;
+#endif
+int b;
+"""
+        navigator = nsiqcppstyle_checker.CppLexerNavigator("a.cpp", data, {})
+        self.assertEqual([d.kind for d in navigator.GetDirectives()], ["define", "if", "endif"])
+        self.assertEqual([t.value for t in navigator.tokenlist if t.value in "ab" and not t.inactive], ["b"])
+
+    def testConditionalCompilation(self):
+        data = """#if 0
+int a() {
+#else
+int b() {
+#endif
+}
+#if defined(FOO) && VERSION > 2
+int c;
+#elif UNKNOWN
+int d;
+#endif
+"""
+        def GetActiveNames(macros):
+            navigator = nsiqcppstyle_checker.CppLexerNavigator("a.cpp", data, macros)
+            return [t.value for t in navigator.tokenlist
+                    if t.value in "abcd" and not t.inactive]
+        self.assertEqual(GetActiveNames({}), ["b", "c", "d"])
+        self.assertEqual(GetActiveNames({"FOO": "1", "VERSION": "3"}), ["b", "c"])
+        self.assertEqual(GetActiveNames({"FOO": None}), ["b", "d"])
+        # The braces in the inactive branch are not matched
+        navigator = nsiqcppstyle_checker.CppLexerNavigator("a.cpp", data, {})
+        lbraces = [t for t in navigator.tokenlist if t.type == "LBRACE"]
+        self.assertTrue(lbraces[0].inactive)
+        navigator._MoveToToken(lbraces[1])
+        self.assertEqual(navigator.GetNextMatchingToken().lineno, 6)
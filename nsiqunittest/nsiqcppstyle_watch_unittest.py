@@ -0,0 +1,76 @@
+# Copyright (c) 2022 All rights reserved.
+# SPDX-License-Identifier: GPL-2.0-only
+
+import collections
+import os
+import shutil
+import tempfile
+import unittest
+import nsiqcppstyle_reporter
+import nsiqcppstyle_watch
+from nsiqcppstyle_state import _nsiqcppstyle_state
+
+
+class watchTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.files = [self.WriteFile("a.cpp", "int a;\n"), self.WriteFile("b.cpp", "int b;\n")]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def WriteFile(self, fname, data):
+        path = os.path.join(self.directory, fname)
+        with open(path, "w") as f:
+            f.write(data)
+        return (path, self.directory, fname)
+
+    def testUpdate(self):
+        watchedFiles = nsiqcppstyle_watch.WatchedFiles()
+        for eachFile, dirname, fname in self.files:
+            self.assertEqual(watchedFiles.GetResult(eachFile), None)
+            watchedFiles.Record(eachFile, [[1, 0, "RULE_A", "message"]], [fname])
+        self.assertEqual(watchedFiles.Update(self.files), ([], []))
+
+        self.files[0] = self.WriteFile("a.cpp", "int aa;\n")
+        newFile = self.WriteFile("c.cpp", "int c;\n")
+        changedFiles, removedFiles = watchedFiles.Update([self.files[0], newFile])
+        self.assertEqual(changedFiles, [self.files[0], newFile])
+        self.assertEqual(removedFiles, [self.files[1][0]])
+        self.assertEqual(watchedFiles.GetFiles(), [self.files[0][0], newFile[0]])
+        self.assertEqual(watchedFiles.GetViolations(),
+                         collections.Counter({(self.files[0][0], 1, 0, "RULE_A", "message"): 1}))
+
+    def testReportDelta(self):
+        rows = []
+
+        class Writer(object):
+            def writerow(self, row):
+                rows.append(row)
+        outputFormat = _nsiqcppstyle_state.output_format
+        writer = nsiqcppstyle_reporter.writer
+        _nsiqcppstyle_state.output_format = "csv"
+        nsiqcppstyle_reporter.writer = Writer()
+        try:
+            before = collections.Counter({("a.cpp", 1, 0, "RULE_A", "kept"): 1, ("a.cpp", 2, 0, "RULE_A", "fixed"): 1})
+            after = collections.Counter({("a.cpp", 1, 0, "RULE_A", "kept"): 1, ("b.cpp", 3, 0, "RULE_B", "new"): 1})
+            nsiqcppstyle_watch.ReportDelta(before, after)
+        finally:
+            _nsiqcppstyle_state.output_format = outputFormat
+            nsiqcppstyle_reporter.writer = writer
+        self.assertEqual(rows, [("b.cpp", 3, 0, "new", "RULE_B", "")])
+        self.assertEqual(_nsiqcppstyle_state.error_count, 2)
+        self.assertEqual(_nsiqcppstyle_state.errorPerFile, {"a.cpp": {"RULE_A": 1}, "b.cpp": {"RULE_B": 1}})
+        _nsiqcppstyle_state.ResetErrorCount()
+
+    def testProjectViolationRecorder(self):
+        _nsiqcppstyle_state.ResetRuleSuppression()
+        _nsiqcppstyle_state.ResetErrorCount()
+        recorder = nsiqcppstyle_reporter.StartRecording(nsiqcppstyle_watch.ProjectViolationRecorder())
+        try:
+            nsiqcppstyle_reporter.ErrorInternal(nsiqcppstyle_reporter.DummyToken("a.cpp", "", 1, 0),
+                                                "rules.RULE_A", "message")
+        finally:
+            nsiqcppstyle_reporter.StopRecording()
+        self.assertEqual(recorder.violations, [["a.cpp", 1, 0, "RULE_A", "message"]])
+        self.assertEqual(_nsiqcppstyle_state.error_count, 0)
@@ -0,0 +1,106 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_10_1_A_do_not_use_bufferoverflow_risky_function_for_unix import *
+import rules.RULE_10_1_A_do_not_use_bufferoverflow_risky_function_for_unix as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = strcat()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+
+void func1() {
+#define strcat() k
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+void strcat() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+void strcat () {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = help.strcat ()
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = fmt::strcat ()
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = std::strcat ()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test8(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = random::strcat ()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test8(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = ::strcat ()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test9(self):
+        # known issue. Not a problem
+        self.Analyze("thisfile.c",
+                     """
+#define strcat k
+void func1()
+{
+    p = k()
+}
+""")
+        self.ExpectSuccess(rule.__name__)
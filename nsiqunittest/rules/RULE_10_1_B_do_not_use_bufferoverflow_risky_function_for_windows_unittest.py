@@ -0,0 +1,54 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_10_1_B_do_not_use_bufferoverflow_risky_function_for_windows import *
+import rules.RULE_10_1_B_do_not_use_bufferoverflow_risky_function_for_windows as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = strcat()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+
+void func1() {
+#define strcat() k
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+void strcat() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+void strcat () {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = help.strcat ()
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,16 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_1_A_do_not_start_filename_with_underbar import *
+import rules.RULE_3_1_A_do_not_start_filename_with_underbar as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFileStartRule(RunRule)
+
+    def test1(self):
+        self.Analyze("_thisfile.c", "")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thi_sfile.c", "")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,36 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_2_B_do_not_use_same_filename_more_than_once import *
+import rules.RULE_3_2_B_do_not_use_same_filename_more_than_once as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddMapReduceRule(SameFilenameRule)
+
+    def test1(self):
+        """
+            Test for correct reporting of multiple files with same name
+        """
+        self.Analyze("test/thisfile.c", "")
+        self.Analyze("test2/thisfile.c", "")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        """
+            Test for correct reporting of multiple files with different names
+        """
+        self.Analyze("test/thisfile.c", "")
+        self.Analyze("test/thisfile.h", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        """
+                Test for correct resolution of exceptions
+        """
+        self.Analyze("test/stdafx.h", "")
+        self.Analyze("test/stdafx.h", "")
+        self.Analyze("test/thisfile.c", "")
+        self.Analyze("test/main.c", "")
+        self.Analyze("test2/main.c", "")
+        self.Analyze("test/thisfile.h", "")
+        self.ExpectSuccess(rule.__name__)
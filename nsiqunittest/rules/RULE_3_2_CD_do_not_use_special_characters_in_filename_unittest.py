@@ -0,0 +1,18 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_2_CD_do_not_use_special_characters_in_filename import *
+import rules.RULE_3_2_CD_do_not_use_special_characters_in_filename as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFileStartRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/this-file.c", "")
+        self.Analyze("test2/!thisfile22.c", "")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisfile.c", "")
+        self.Analyze("test/thisfile.h", "")
+        self.ExpectSuccess(rule.__name__)
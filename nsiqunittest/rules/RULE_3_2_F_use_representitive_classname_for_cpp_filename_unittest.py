@@ -0,0 +1,98 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_2_F_use_representitive_classname_for_cpp_filename import *
+import rules.RULE_3_2_F_use_representitive_classname_for_cpp_filename as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddRuleClass(RepresentitiveClassnameRule)
+
+    def test1(self):
+        self.Analyze("test/aa.c",
+                     """
+void AA::DSD() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/ab.c",
+                     """
+void AA::DSD() {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/aa.c",
+                     """
+void CAA::DSD() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/aa.c",
+                     """
+void DSD() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/aa.cpp",
+                     """
+struct AA {
+}
+
+class BB {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/aa.cpp",
+                     """
+struct AA1 {
+}
+
+class BB {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/CamRecorderFactory.cpp",
+                     """
+class __declspec(dllexport) CCamRecorderFactory
+{
+};
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/CamRecorderFactory.cpp",
+                     """
+class DLLEXPORT CCamRecorderFactory
+{
+};
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+        self.Analyze("test/CamRecorderFactory.h",
+                     """
+class CamRecorderFactory final
+{
+};
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test10(self):
+        self.Analyze("test/CamRecorderFact.h",
+                     """
+class CamRecorderFactory final
+{
+};
+""")
+        self.ExpectError(rule.__name__)
@@ -0,0 +1,44 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_2_H_do_not_use_underbars_for_cpp_filename import *
+import rules.RULE_3_2_H_do_not_use_underbars_for_cpp_filename as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFileStartRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisfile.cpp", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/this_file.c", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisfile.cxx", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisfile.cc", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisfile.mm", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/this_file.cxx", "")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/this_file.cpp", "")
+        self.ExpectError(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/this_file.cc", "")
+        self.ExpectError(rule.__name__)
+
+    def test9(self):
+        self.Analyze("test/this_file.mm", "")
+        self.ExpectError(rule.__name__)
@@ -0,0 +1,20 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_2_H_do_not_use_uppercase_for_c_filename import *
+import rules.RULE_3_2_H_do_not_use_uppercase_for_c_filename as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFileStartRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c", "")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/ThisFile.cpp", "")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/this_file.c", "")
+        self.ExpectSuccess(rule.__name__)
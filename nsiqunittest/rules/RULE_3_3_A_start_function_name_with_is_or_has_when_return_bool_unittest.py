@@ -0,0 +1,120 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_3_A_start_function_name_with_is_or_has_when_return_bool import *
+import rules.RULE_3_3_A_start_function_name_with_is_or_has_when_return_bool as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool canHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool CTEST:canHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern bool CTEST:canHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern int CTEST:canHave() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern int CTEST:isIt() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+extern bool CTEST:canHave();
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/thisFile.c", """
+/**
+              *          Check if the requesting is necessary.
+              */
+             bool IsSetToRequest() const;
+
+
+             /// Gates
+             /**
+              *          Add the exit gate item.
+              */
+             void AddGate(GATE gate){m_GateCont.push_back(gate); }
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/thisFile.c",
+                     """
+boolean operator=();
+boolean KK::operator=();
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+        self.Analyze("test/thisFile.c",
+                     """
+/**
+  * This tests for correct parsing of fn name and nested templates
+  **/
+template<class ObjectTypePtr,
+         typename = typename std::enable_if<std::is_pointer<ObjectTypePtr>::value>::type>
+bool canHave(ObjectTypePtr obj) {
+}
+
+template<class ObjectTypeNotPtr,
+         typename = typename std::enable_if<!std::is_pointer<ObjectTypeNotPtr>::value>::type>
+bool canHave(ObjectTypeNotPtr obj) {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test10(self):
+        self.Analyze("test/thisFile.c",
+                     """
+/**
+  * This tests for correct parsing of fn name and nested templates
+  **/
+template<class ObjectTypePtr,
+         typename = typename std::enable_if<std::is_pointer<ObjectTypePtr>::value>::type>
+bool isIt(ObjectTypePtr obj) {
+}
+
+template<class ObjectTypeNotPtr,
+         typename = typename std::enable_if<!std::is_pointer<ObjectTypeNotPtr>::value>::type>
+bool isIt(ObjectTypeNotPtr obj) {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def testTemplateArgument(self):
+        self.Analyze("test/thisFile.c",
+                     """
+pair<iterator, bool> insert_unique_noresize(const value_type& obj) {
+}
+_SimdWrapper<bool, _Np> __extract_part(const _SimdWrapper<_Tp, _Np> __x) {
+}
+std::vector<std::pair<int, bool>> getPairs() {
+}""")
+        self.ExpectSuccess(rule.__name__)
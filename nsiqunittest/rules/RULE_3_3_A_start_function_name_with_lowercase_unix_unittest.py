@@ -0,0 +1,122 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_3_A_start_function_name_with_lowercase_unix import *
+import rules.RULE_3_3_A_start_function_name_with_lowercase_unix as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool CanHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool CTEST:CanHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern bool CTEST:canHave() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern int CTEST:_CanHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class AA {
+extern int ~IsIt();
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+extern bool CTEST:canHave();
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+   a = new EE();
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+  int Hello()
+  int EE();
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test9(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+  int K()
+  int ~K()
+  int ee();
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test10(self):
+        self.Analyze("test/thisFile.c",
+                     """
+#define TT KK() {\
+}}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test11(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void KK::KK() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test12(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void KK::~KK() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test13(self):
+        self.Analyze("test/thisFile.c",
+                     """
+TEST()
+   BLOCK1()
+   BLOCK2()
+   BLOCK3()
+
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test14(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void KK() {
+}
+""")
+        self.ExpectError(rule.__name__)
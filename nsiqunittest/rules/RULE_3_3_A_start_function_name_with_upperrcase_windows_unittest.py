@@ -0,0 +1,140 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_3_A_start_function_name_with_upperrcase_windows import *
+import rules.RULE_3_3_A_start_function_name_with_upperrcase_windows as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool CanHave() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool CTEST:CanHave() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern bool CTEST:canHave() {
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+extern int CTEST:_CanHave() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+calss AA {
+extern int ~IsIt();
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+extern bool CTEST:canHave();
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("a.c",
+                     """
+void ** *(d) (((int &,
+  char **(*)(char *, char **));        // d is a pointer to a function that takes
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("a.c",
+                     """
+class A {
+    void B() {
+    void C() {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+        self.Analyze("a.c",
+                     """
+void operator=() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test10(self):
+        self.Analyze("a.c",
+                     """
+bool ConvertToTM(struct)
+{
+    int a= {0};
+    memcpy(szTemp);
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test11(self):
+        self.Analyze("a.c",
+                     """
+bool& TT::operator=(struct)
+{
+    int a= {0};
+    memcpy(szTemp);
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test12(self):
+        self.Analyze("a.c",
+                     """
+typedef c d();
+""")
+        self.ExpectError(rule.__name__)
+
+    def test13(self):
+        self.Analyze("test/thisFile.c",
+                     """
+const std::string seasons = {
+std::string("Spring"),
+std::string("Summer"),
+std::string("Autumn"),
+std::string("Winter")
+};
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test14(self):
+        self.Analyze("test/thisFile.c",
+                     """
+[event_source(native)]
+interface ICamRecorder
+{
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test15(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void _tmain() {
+}
+void _tWinMain() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,143 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_3_3_B_start_private_function_name_with_underbar import *
+import rules.RULE_3_3_B_start_private_function_name_with_underbar as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+        global currentVisibility
+        currentVisibility = False
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+bool CanHave() {
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class TT::K {
+private:
+bool CTEST:CanHave() {
+}
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+private:
+bool CTEST:_CanHave() {
+}
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+public:
+bool CTEST:_CanHave() {
+}
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+private:
+bool CTEST:_CanHave() ;
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+private:
+public :
+bool CTEST:CanHave();
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+public :
+private:
+bool CTEST:CanHave();
+""")
+        self.ExpectError(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class TT::K {
+public :
+private:
+ K();
+ ~K();
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+        self.Analyze("test/thisFile.c",
+                     """
+int KK:KK(Hello wow){
+};
+
+int KK:~KK() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test10(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class KK {
+    private :
+        int K1();
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test11(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class TT {
+    private :
+        void operator=(sdsd) {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test12(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+public :
+private:
+ K();
+ ~K();
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test13(self):
+        self.Analyze("test/thisFile.c",
+                     """
+DEF_DD(wewe)
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test14(self):
+        self.Analyze("test/thisFile.c",
+                     """
+DEF11_DD(wewe)
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,42 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_1_A_A_use_tab_for_indentation import *
+import rules.RULE_4_1_A_A_use_tab_for_indentation as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddBulkLineRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     "\tbool CanHave() {\n\t}")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+    Hello
+}""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+
+Hello
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+ /**
+    * Check for Doxygen Comment. This rule doesn't care about doxygen comment block.
+  */
+class K {
+
+Hello
+}""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,30 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_1_A_B_use_space_for_indentation import *
+import rules.RULE_4_1_A_B_use_space_for_indentation as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddBulkLineRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     "\tbool CanHave() {\n\t}")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+    Hello
+}""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class K {
+
+Hello
+}""")
+        self.ExpectSuccess(rule.__name__)
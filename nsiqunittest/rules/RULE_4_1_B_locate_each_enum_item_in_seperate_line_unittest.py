@@ -0,0 +1,73 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_1_B_locate_each_enum_item_in_seperate_line import *
+import rules.RULE_4_1_B_locate_each_enum_item_in_seperate_line as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+enum A {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+enum C {
+    AA, BB
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+enum C {
+    AA = 4,
+    BB
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+enum C {
+    AA = 4
+    ,BB
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+enum C
+{
+    AA = 4
+    ,BB
+} TT;
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+enum COLOR
+{
+        COLOR_TRANSPARENT = RGB(0, 0, 255),
+        COLOR_ROOM_IN_OUT = 0xffff00,
+        COLOR_CHAT_ITEM = 0xff9419,
+        COLOR_CHAT_MY = 0x00b4ff,
+        COLOR_CHAT_YOUR = 0xa3d5ff,
+        COLOR_ROOM_INFO = 0x00ffff,
+        COLOR_RESULT_SCORE = 0xffcc00,
+        COLOR_RESULT_RATING = 0x00fcff,
+        COLOR_RESULT_POINT = 0x33ff00
+}; """)
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,142 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_1_C_align_long_function_parameter_list import *
+import rules.RULE_4_1_C_align_long_function_parameter_list as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j
+              int pp)
+{
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j,
+             int pp)
+{
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j,
+
+             int pp)
+{
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class A {
+void function(int k, int j,
+              int pp);
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class A {
+void function(int k, int j,
+            int pp);
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class A {
+void function(int k, int j,
+              int pp)
+{
+    function(KK, DD,
+             TT);
+}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/thisFile.c",
+                     """
+class A {
+void function(int k, int j,
+              int pp)
+{
+    function(KK, DD,
+             TT);
+}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+        self.Analyze("test/thisFile.c",
+                     """
+Void aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa( int a,
+                                          int b)
+{
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test10(self):
+        self.Analyze("test/thisFile.c",
+                     """
+OrgDNSHandler::RESULT_CODE OrgDNSHandler::process( const NRootDNSConfig* pNRootDNSConfig,
+                                                   const nano::Variant::List& params,
+                                                   int a)
+{
+    return NULL;
+};
+
+void functionA(int a, int b
+               int c);
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def testCallOperator(self):
+        # The parameter list of operator() is the one after "()"
+        self.Analyze("test/thisFile.c",
+                     """
+struct A {
+    bool operator()(int a,
+        int b) const;
+};
+""")
+        self.ExpectError(rule.__name__)
+
+    def testAlignedCallOperator(self):
+        self.Analyze("test/thisFile.c",
+                     """
+struct A {
+    bool operator()(int a,
+                    int b) const;
+};
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,65 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_1_E_align_conditions import *
+import rules.RULE_4_1_E_align_conditions as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+    if (AA == D &&
+    kK = 22) {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+    if (AA == D &&
+        kK = 22) {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+    while (AA == D &&
+        kK = 22) {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+while (AA == D &&
+kK = 22) {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void F() {
+    while (AA == D &&
+           kK = 22
+        ) {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,96 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_2_A_B_space_around_word import *
+import rules.RULE_4_2_A_B_space_around_word as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+        ruleManager.AddPreprocessRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+  for(a;b;c) {
+  }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+  if(k==3)
+  {
+  }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+  if (k==3)
+  {
+  }else {
+  }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("test/thisFile.c",
+                     """
+if(k==3)
+{
+}
+void function(int k, int j, int pp)
+{
+  if (k==3)
+  {
+  } else {
+  }
+  while(True) {
+  }
+  for (k;j; c) {
+  }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("test/thisFile.c",
+                     """
+#define AA do {\\
+} while(0)
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("test/thisFile.c",
+                     """
+#define AA if\\
+{} while(0)
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("test/thisFile.c",
+                     """
+#define AA if(\\
+{} while(0)
+""")
+        self.ExpectError(rule.__name__)
+
+    def test8(self):
+        self.Analyze("test/thisFile.c",
+                     """
+#  include <boost/preprocessor/repetition/for.hpp>
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,29 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_4_A_do_not_write_over_120_columns_per_line import *
+import rules.RULE_4_4_A_do_not_write_over_120_columns_per_line as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddBulkLineRule(RunRule)
+
+    def test1(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+%s
+}
+""" % ("d" * 121))
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("test/thisFile.c",
+                     """
+void function(int k, int j, int pp)
+{
+%s
+%s
+}
+""" % ("d" * 119, " " * 130))
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,57 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_5_A_brace_for_namespace_should_be_located_in_seperate_line import *
+import rules.RULE_4_5_A_brace_for_namespace_should_be_located_in_seperate_line as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+public class A {
+
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+class C : public AA {
+
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+class K
+{
+    void function() const {
+    }
+    class T
+    {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+namespace K
+{
+    void function() const {
+    }
+    class T {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+namespace K {
+    int k;
+}
+""")
+        self.ExpectError(rule.__name__)
@@ -0,0 +1,59 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_5_A_braces_for_function_definition_should_be_located_in_seperate_line import *
+import rules.RULE_4_5_A_braces_for_function_definition_should_be_located_in_seperate_line as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void function() {
+
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+void function() const {
+
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+class K {
+    void function() const
+    {
+
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+void function()
+{
+    while(True) {
+    }
+}
+class A {
+void function()
+  {
+  }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+class K {
+    void function() const
+    {   }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,95 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_5_A_braces_for_type_definition_should_be_located_in_seperate_line import *
+import rules.RULE_4_5_A_braces_for_type_definition_should_be_located_in_seperate_line as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+public class A {
+
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+class C : public AA {
+
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+class K
+{
+    void function() const {
+    }
+    class T
+    {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+class K
+{
+    void function() const {
+    }
+    class T {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+class C : public AA
+{
+    class T {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c", """
+class C : public AA
+{
+    class T
+    {
+      }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("thisfile.c", """
+class C : public AA
+{
+    class T
+    {   }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("thisfile.c", """
+namespace C {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+        self.Analyze("thisfile.c", """
+if (hello) {
+// {kr} m_btn5 {/kr}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,70 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_5_A_indent_blocks_inside_of_function import *
+import rules.RULE_4_5_A_indent_blocks_inside_of_function as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void function() {
+for (;;) {
+}
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+void function() {
+a = {
+}
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    a = {
+        }
+    while(True)
+    {
+    tt {
+    }
+    }
+    k = {}
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    a = {
+        }
+    while(True)
+    {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    a = { dsdsd}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c", """
+#define AA(p, t) \
+do {\
+aa = e;
+} while(0)
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,70 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_5_A_matching_braces_inside_of_function_should_be_located_same_column import *
+import rules.RULE_4_5_A_matching_braces_inside_of_function_should_be_located_same_column as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    for (;;) {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    a = {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    a = {
+        }
+    while(True)
+    {
+    }
+    k = {}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+void function() {
+    for (;;) {
+             }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+void function() {
+%sfor (;;) {
+             }
+}
+""" % ('\t'))
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c", """
+void function() {
+void function2() {
+for (;;)
+{
+  {
+  }
+}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,70 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_4_5_B_use_braces_even_for_one_statement import *
+import rules.RULE_4_5_B_use_braces_even_for_one_statement as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void function() {
+for (;;)
+    a = 3;
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+void function() {
+for (;;)  {
+    a = 3;
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+void function() {
+while(True)
+    sdsd();
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+void function() {
+do {
+} while(true);
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+void function() {
+if (true) {
+    sdsd();
+    } else
+        SSDD();
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c", """
+void function() {
+if (true) {
+    sdsd();
+    } else {
+        SSDD();
+    } else if (true) {
+    }
+
+}
+""")
+        self.ExpectSuccess(rule.__name__)
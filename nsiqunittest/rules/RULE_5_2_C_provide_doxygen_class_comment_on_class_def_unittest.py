@@ -0,0 +1,76 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_5_2_C_provide_doxygen_class_comment_on_class_def import *
+import rules.RULE_5_2_C_provide_doxygen_class_comment_on_class_def as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+class A {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ */
+class K {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+/**
+ */
+class K {
+    class T {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+/**
+ *
+ */
+class J {
+    int k;
+    /**
+     */
+    class T {
+    }
+}
+class T;
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ */
+struct K {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """
+/**
+ */
+template<class A, class B>
+class K {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,34 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_5_2_C_provide_doxygen_namespace_comment_on_namespace_def import *
+import rules.RULE_5_2_C_provide_doxygen_namespace_comment_on_namespace_def as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+namespace K;
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ */
+namespace K {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+/**
+ */
+using namespace A;
+""")
+        self.ExpectSuccess(rule.__name__)
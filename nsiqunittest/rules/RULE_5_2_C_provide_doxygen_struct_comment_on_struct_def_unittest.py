@@ -0,0 +1,73 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_5_2_C_provide_doxygen_struct_comment_on_struct_def import *
+import rules.RULE_5_2_C_provide_doxygen_struct_comment_on_struct_def as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+struct A {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ */
+struct K {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+/**
+ */
+struct K {
+    struct T {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+/**
+ *
+ */
+struct J {
+    int k;
+    /**
+     */
+    struct T {
+    }
+}
+class T;
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ */
+struct K {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """
+typedef struct  {
+} K
+""")
+        self.ExpectError(rule.__name__)
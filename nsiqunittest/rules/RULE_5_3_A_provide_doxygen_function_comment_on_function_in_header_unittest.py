@@ -0,0 +1,175 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_5_3_A_provide_doxygen_function_comment_on_function_in_header import *
+import rules.RULE_5_3_A_provide_doxygen_function_comment_on_function_in_header as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.h",
+                     """
+void FunctionA();
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.h",
+                     """
+/*
+ *
+ */
+extern void FunctionB();
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.h",
+                     """
+class A {
+public:
+    void ~A();
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+public :
+    /** HELLO */
+    A();
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.h",
+                     """
+/*
+ *
+ */
+ void FunctionB() {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.h",
+                     """
+int a;
+ void FunctionB();
+""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        self.Analyze("thisfile.h",
+                     """
+/**
+ *
+ */
+extern void FunctionB();
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+protected :
+    /** HELLO */
+    A();
+private :
+    B();
+    C() {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test9(self):
+        self.Analyze("thisfile.h",
+                     """
+///
+extern void FunctionB();
+""")
+        self.ExpectError(rule.__name__)
+
+    def test10(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+public :
+    /// HELLO
+    A();
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test11(self):
+        self.Analyze("thisfile.h",
+                     """
+extern void FunctionB();  ///< HELLO
+""")
+        self.ExpectError(rule.__name__)
+
+    def test12(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+public :
+    A();  ///< HELLO
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test13(self):
+        self.Analyze("thisfile.c",
+                     """
+void FunctionA();
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test14(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+protected :
+    /** HELLO */
+    A();
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test15(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+private :
+    /** HELLO */
+    A();
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test14(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+protected :
+    A();
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test15(self):
+        self.Analyze("thisfile.h",
+                     """
+class J {
+private :
+    A();
+}
+""")
+        self.ExpectError(rule.__name__)
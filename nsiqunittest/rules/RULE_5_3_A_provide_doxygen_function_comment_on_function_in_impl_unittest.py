@@ -0,0 +1,94 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_5_3_A_provide_doxygen_function_comment_on_function_in_impl import *
+import rules.RULE_5_3_A_provide_doxygen_function_comment_on_function_in_impl as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+void FunctionA() {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ *
+ */
+extern void FunctionB() {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+class A {
+public:
+    void ~A() {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+class J {
+    /** HELLO */
+    C() {
+    }
+public :
+    /** HELLO */
+    A();
+private :
+    B() {}
+
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+/*
+ *
+ */
+static void FunctionB() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.h",
+                     """
+int a;
+void FunctionB(){
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("thisfile.c",
+                     """
+int a;
+void FunctionB(){
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test8(self):
+        self.Analyze("thisfile.c",
+                     """
+class J {
+    C() {
+    }
+}
+""")
+        self.ExpectError(rule.__name__)
@@ -0,0 +1,147 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_6_1_A_do_not_omit_function_parameter_names import *
+import rules.RULE_6_1_A_do_not_omit_function_parameter_names as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int *a, K<a, b>, int b, int c, int c);
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int, int, int, Scope<T,J> a) {
+}
+
+int B;
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+class K {
+int functionA(int *a, int, int, tt&b, aa*s, k a);
+int B;
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+class K {
+int functionA(int *a, int c, int d, tt&b, aa*s, k a);
+int B;
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+class K {
+int functionA(void);
+int B;
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """
+class K {
+int functionA(void*);
+int B;
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("thisfile.c",
+                     """
+#include <stdio.h>
+#include <sys/socket.h>                // getpeername()
+
+#define ILOG_WARN(...) \\
+        iota::BoxLog::Instance().WriteFormat(box::Warn, __FILE__, __LINE__, __VA_ARGS__)
+
+
+void func(void)
+{
+    if (::getpeername(nFileDescriptor, (struct sockaddr*) &oSockAddr, (socklen_t*) &nSockAddrSize) == -1)
+    {
+        int        nErrorCode = errno;
+
+        ILOG_WARN("Initialize() - internal error. (getpeername) : \n\t\t"
+                            "* this=[%p], fd=[%d], \n\t\t"
+                            "* error-code=[%d], error-message=[%s]",
+                    this, nFileDescriptor, nErrorCode, strerror(nErrorCode));
+        return false;
+    }
+}
+
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test8(self):
+        self.Analyze("thisfile.c",
+                     """
+#define ILOG_WARN(A) \\
+        iota::BoxLog::Instance().WriteFormat(box::Warn, __FILE__, __LINE__, __VA_ARGS__)
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test9(self):
+
+        self.Analyze("thisfile.c",
+                     """
+/**
+ * @brief constructor with map
+ */
+ExeOptionDetail& ExeOptionDetail::operator=(const nano::Variant::Map& mapOptions)
+{
+    m_nTimeout = _getItemAsInt(mapOptions, "TIMEOUT", -1);
+    return *this;
+};
+
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test10(self):
+        self.Analyze("thisfile.c",
+                     """struct FnVisibility
+{
+void operator () (const DSObjMap::value_type& pair)
+{
+DSObject*    pObject = pair.second;
+CHTMLDomUtility::SetStyleProperty(pObject, _T("display"), _T("none"));    // ==> Original Code : Rule_6_1_A_Error
+}
+};
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test11(self):
+        self.Analyze("thisfile.c",
+                     """
+CPoint BtnTeamPos[]    = { CPoint(BTN_SINGLE_POS_X, BTN_SINGLE_POS_Y),
+                             CPoint(BTN_TEAM_A_POS_X, BTN_TEAM_A_POS_Y),
+                            CPoint(BTN_TEAM_B_POS_X, BTN_TEAM_B_POS_Y),
+                            CPoint(BTN_TEAM_C_POS_X, BTN_TEAM_C_POS_Y)
+                        };
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test12(self):
+        self.Analyze("thisfile.c",
+                     """
+void functionB(int );
+""")
+        self.ExpectError(rule.__name__)
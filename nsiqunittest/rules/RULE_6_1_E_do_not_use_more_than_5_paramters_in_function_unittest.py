@@ -0,0 +1,69 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_6_1_E_do_not_use_more_than_5_paramters_in_function import *
+import rules.RULE_6_1_E_do_not_use_more_than_5_paramters_in_function as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int *a, int b, int c, int d, Scope<T,J> a) {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int *a, int b, int c,   Scope<T,J> a) {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int *a, int b, int c, tt&b, aa*s, k a) {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+class T {
+int functionA(int *a, int b, int c, tt&b, aa*s, k a) {
+}
+};
+""")
+        self.ExpectError(rule.__name__)
+
+    def test5(self):
+        # The commas in the nested parentheses and the default values are not counted
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int a, int b, void (*c)(int, int, int), int d = g(1, 2, 3)) {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """
+int functionA(int a[2], int b, int c, int d, std::map<int, std::pair<int, int> > e) {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        # The parameter list of operator() is the one after "()"
+        self.Analyze("thisfile.c",
+                     """
+struct A {
+    bool operator()(int a, int b, int c, int d, int e, int f) const;
+};
+""")
+        self.ExpectError(rule.__name__)
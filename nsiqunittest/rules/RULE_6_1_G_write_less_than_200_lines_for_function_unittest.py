@@ -0,0 +1,20 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_6_1_G_write_less_than_200_lines_for_function import *
+import rules.RULE_6_1_G_write_less_than_200_lines_for_function as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", "int k() {%s};" % ("hello\n\n" * 201))
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", "int k() {%s};" % ("hello\n\n" * 120))
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", "int k() {%s};" % ("hello\n\n" * 200))
+        self.ExpectSuccess(rule.__name__)
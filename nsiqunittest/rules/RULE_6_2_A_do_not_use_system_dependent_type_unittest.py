@@ -0,0 +1,41 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_6_2_A_do_not_use_system_dependent_type import *
+import rules.RULE_6_2_A_do_not_use_system_dependent_type as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+int k;
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+void T() {
+    long long k = 1;
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+int32_t k = 2
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+void k() {
+    for (int j = 0; j < 11; j++) {
+    }
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,57 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_6_4_B_initialize_first_item_of_enum import *
+import rules.RULE_6_4_B_initialize_first_item_of_enum as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddTypeNameRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+enum KK {
+    tt,
+    kk
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+enum KK {
+    tt = 1,
+    kk
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+enum KK {
+    tt = 1, kk
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+typedef enum {
+    tt = 1, kk
+} KK;
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+void A() {
+enum KK{
+    tt, kk
+};
+}
+""")
+        self.ExpectError(rule.__name__)
@@ -0,0 +1,32 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_6_5_B_do_not_use_lowercase_for_macro_constants import *
+import rules.RULE_6_5_B_do_not_use_lowercase_for_macro_constants as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddPreprocessRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+#define k 1
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+#define tt(A) 3
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+#  define t "ewew"
+""")
+        self.ExpectError(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+#  define t # "ewew"
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,65 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_7_1_B_A_do_not_use_double_assignment import *
+import rules.RULE_7_1_B_A_do_not_use_double_assignment as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddLineRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void Hello() {
+   int k = a = 2;
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+int k = c = 2;
+void Hello() {
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+int k = 2; int j = 2;
+void Hello() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+a = "dsd=wew=e";
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+
+        l_Req.strGameInfoString = "P=&P0=YW55Y2FsbDQ0Mw==&P1=S19VTklUVEVTVA==&P2=MjU3&P3=aHR0cDovL2hhbmNkbi5oYW5nYW1lLmNvbS\
+                              9wdWIvcGxpaS9hbHBoYQ==&P4=U3FmYWplbzUyVm1JMStzamg4emREc0lNWDMvQkppRzR5ekttNFNFQ09MdzJXSjV\
+                              XUE54UlhIbzFKRzdPQnpnZUdnMWJoZFdvRUhOQU90WFlRN3d3VVdaR1RwbVBVV0hObW53YnB0U3Evb1NyVkEzbFNu\
+                              WElXeEQrVGxyVERRZVlSNkovbGlLbG03MzNTSDRlSVFzM1d5QzArWW5HOTc3ZE16cGxUZCs0M1V5REtvK2lYREc1a\
+                              HZsR1R3dXQ2Qk9pNVZaamxTSzFmQ1RUWjY0UWkyYzVXRVhDNHcyaVJrOElyMXZxbGRqdEhGNnZ2cmFSU1lGZUdNRl\
+                              FmNzdiU2J5WkU3QTdQM1k2SjV0Z2U2clhrSUZYaFdmUi9mNEpGOFBGekt1OTJFMmxuK0JhaUxESWI5aVI5Rlp6VWR\
+                              lWFJYellOZngvT0pQRnRDRXhaSlo2VElpVEJjYnI1SVNVa29TMA==&P5=bG9naW49QjQ4RTdFNEQ1QzFCNzQ5RUI1\
+                              NTI5RCUyQyUyQ0FOWUNBTEwlMkNGJTJDMzklMkNZJTJDTENGMDAxX0hDRjAwMV9GTkYwMDFBX1BORjAwMSUyQ1klM\
+                              kMqYW55Y2FsbDQ0MyUyQ0VDREYzOTEzMDI0RDI0OEVBNTQ1MjQxNTI4NjMlMkMlMkMlMkMlMkNOJTJDWSUyQ04lMk\
+                              N0ZXN0JTQwZnJlZWNoYWwuY29tJTJDRkNDRTJGMDcxNjVGNzUlMkNMT0MwMDElMkMlMkMzJTJDWSUyQzAlN0MwJTd\
+                              DbnVsbCUyQyUyQ05OJTIzTiUyM04lMkMlMkM7SEdfTE9HSU49UVNPUVY5SWpfY2s3V0tEWHJIOUctS0xOazlZOHFz\
+                              a3NlXzRTYThvaWVacGlrOUF2cVA4SVA3NXYxaS0td1FCWnJLSGRZRUE0aU5Jc1VBUU1WWUxJNGFMYWNibHVia21fY\
+                              TNwaEhvRE9Ta2xSNVV0MDd0emZFd1JqOW5jTDNQbFlMSXU0ZmYxT2JKMUNKdW1HWWtENlJjVWhKVWZMUTZHVWNlVE\
+                              w4Tmxwd0dEWXhSYnZIak9maGhvUzlsRXIxekN1UTJSZURKa3pTZWlLNnFhVG9kUV81eWZRTno0REFaOVY0VXRaLTV\
+                              DbmQyT0xwZ3FVWkwzT0lsQm9sWmQ1REdoMERPQUJRSFVuVWo3SHg3QUcwczduODNuYWNreVkxbXhtOXhCZE94dGRS\
+                              RmljNDA0eTQ5bHNhY1M4QUxBZ09QWTc4V2xMYWlJNE9oRkJJNVpubmRGS1ZER3g4MkQ4aXFBbHFlM3lWLVpuRlRvP\
+                              TtIR19DUF9MT0dJTj1lMmVvUzR2YlloU21rU1lKMFMzcWJVOTFjbjRjLU1td0xsZUNPQXo5bEcwZTVWdmNXeEZ0bD\
+                              RyZFREQTF4WVV0Nll1T0xfVWtQNi1udDlQLWFlc3RncXdkdmRvRm9KMnlyNmE1b1dxQlVia2ozcUJyOGtaTnFWQ3d\
+                              zUV9TSzI1TEtWZndxR2JtTkhwTU1Pczk0YWhNVXM3ZjdRWmVBZVVEMm52MVk0dTRMUGNreXhSZ1EzNVJyZER4UzBk\
+                              TzZfRXdVRXNxRUNjY1V4ZmpaamRobEtvYUtQS19CNjhUay02LV9mMm5wQ2RGZDJrNDhXdHVROWxnaHFMbS1mdzNzT\
+                              HdfMktsNjVGWC1uY3pVM0F6NVlUMFJ6UT09";
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,33 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_7_1_C_do_not_use_question_keyword import *
+import rules.RULE_7_1_C_do_not_use_question_keyword as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+        ruleManager.AddPreprocessRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void Hello() {
+   int k = true ? 1 : 2;
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+int k = true ? 1 : 2;
+void Hello() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+#define k (t ? 1 : 2);
+void Hello() {
+}
+""")
+        self.ExpectError(rule.__name__)
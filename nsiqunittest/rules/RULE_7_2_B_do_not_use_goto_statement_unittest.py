@@ -0,0 +1,25 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_7_2_B_do_not_use_goto_statement import *
+import rules.RULE_7_2_B_do_not_use_goto_statement as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+        ruleManager.AddPreprocessRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """
+void Hello() {
+   goto TT:
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+goto TT:
+void Hello() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
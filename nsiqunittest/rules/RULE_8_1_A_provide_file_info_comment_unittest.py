@@ -0,0 +1,66 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_8_1_A_provide_file_info_comment import *
+import rules.RULE_8_1_A_provide_file_info_comment as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFileStartRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """// license
+// copyright
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """/**
+#if 0
+#endif
+license
+coryright */ """)
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+// license
+// copyrigh1
+""")
+        self.ExpectError(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """#define "WEWE"
+// license
+// copyrigh1
+#include </ewe/kk> """)
+        self.ExpectError(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+#define "WEWE"
+// license
+// copyright
+#include </ewe/kk> """)
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """// license
+// copyright
+#define "WEWE"
+#include </ewe/kk> """)
+        self.ExpectSuccess(rule.__name__)
+
+    def test7(self):
+        self.Analyze("thisfile.c",
+                     """/*
+ * license
+ * copyright
+ */
+""")
+        self.ExpectSuccess(rule.__name__)
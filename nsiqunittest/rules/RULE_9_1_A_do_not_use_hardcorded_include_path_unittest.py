@@ -0,0 +1,39 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_9_1_A_do_not_use_hardcorded_include_path import *
+import rules.RULE_9_1_A_do_not_use_hardcorded_include_path as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFileTextRule(hardcodedIncludePattern, RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c", """# include "c:\k.h"
+void func1()
+{}""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c", """
+#include "/ewe/dsd" """)
+        self.ExpectError(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c", """
+#include "ewe\kk" """)
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c", """
+#include </ewe/kk> """)
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c", """
+#include /* c */ "/ewe/kk" """)
+        self.ExpectError(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c", """
+#include /* "/ewe/kk" */ "kk.h" """)
+        self.ExpectSuccess(rule.__name__)
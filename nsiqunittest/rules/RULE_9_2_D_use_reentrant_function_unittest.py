@@ -0,0 +1,75 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_9_2_D_use_reentrant_function import *
+import rules.RULE_9_2_D_use_reentrant_function as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddFunctionScopeRule(RunRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = ctime()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+
+void func1() {
+#define ctime() k
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+void ctime() {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+void ctime () {
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test5(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = help.ctime ()
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test6(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = toupper()
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test7(self):
+        nsiqcppstyle_state._nsiqcppstyle_state.varMap["ignore_toupper"] = "true"
+        self.Analyze("thisfile.c",
+                     """
+void func1()
+{
+    k = toupper()
+}
+""")
+        self.ExpectSuccess(rule.__name__)
@@ -0,0 +1,78 @@
+from nsiqunittest.nsiqcppstyle_unittestbase import *
+from rules.RULE_A_3_avoid_too_deep_blocks import *
+import rules.RULE_A_3_avoid_too_deep_blocks as rule
+
+
+class testRule(nct):
+    def setUpRule(self):
+        ruleManager.AddRuleClass(TooDeepBlockRule)
+
+    def test1(self):
+        self.Analyze("thisfile.c",
+                     """
+void func1() {
+{{{{{{{
+       }}}}}}}
+}
+""")
+        self.ExpectError(rule.__name__)
+
+    def test2(self):
+        self.Analyze("thisfile.c",
+                     """
+
+void func1() {
+{{{
+#define {{{{ }}}
+       }}}}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test3(self):
+        self.Analyze("thisfile.c",
+                     """
+void func(void)
+{
+if (...)
+{ // depth-1
+
+{ // depth-2
+
+{ // depth-3
+
+{ // depth-4
+
+printf("...");
+
+}
+}
+}
+}
+}
+""")
+        self.ExpectSuccess(rule.__name__)
+
+    def test4(self):
+        self.Analyze("thisfile.c",
+                     """
+void func(void)
+{
+if (...)
+{ // depth-1
+
+{ // depth-2
+
+{ // depth-3
+
+{ // depth-4
+{ // depth-5
+printf("...");
+}
+}
+}
+}
+}
+}
+""")
+        self.ExpectError(rule.__name__)
@@ -16,7 +16,6 @@ if they're found, this rule reports a volation.
     - strtrns()
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_rulemanager import *
 import nsiqcppstyle_reporter
@@ -75,110 +74,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = strcat()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-
-void func1() {
-#define strcat() k
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-void strcat() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-void strcat () {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = help.strcat ()
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = fmt::strcat ()
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test7(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = std::strcat ()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test8(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = random::strcat ()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test8(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = ::strcat ()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test9(self):
-        # known issue. Not a problem
-        self.Analyze("thisfile.c",
-                     """
-#define strcat k
-void func1()
-{
-    p = k()
-}
-""")
-        self.ExpectSuccess(__name__)
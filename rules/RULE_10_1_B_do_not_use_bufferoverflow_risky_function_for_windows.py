@@ -41,7 +41,6 @@ if they're found, this rule reports a violation.
   - Strlen()
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
 from nsiqcppstyle_rulemanager import *
 import nsiqcppstyle_reporter
 windows_bufferoverflow_functions = (
@@ -97,58 +96,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = strcat()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-
-void func1() {
-#define strcat() k
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-void strcat() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-void strcat () {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = help.strcat ()
-}
-""")
-        self.ExpectSuccess(__name__)
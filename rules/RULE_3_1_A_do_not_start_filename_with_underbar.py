@@ -11,7 +11,7 @@ Do not start the file name with underbars.
     BdSc.h
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_reporter import *  # @UnusedWildImport
 from nsiqcppstyle_rulemanager import *  # @UnusedWildImport
 
@@ -23,20 +23,3 @@ def RunRule(lexer, filename, dirname):
 
 
 ruleManager.AddFileStartRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunRule)
-
-    def test1(self):
-        self.Analyze("_thisfile.c", "")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thi_sfile.c", "")
-        self.ExpectSuccess(__name__)
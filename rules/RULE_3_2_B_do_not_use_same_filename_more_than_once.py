@@ -18,67 +18,32 @@ Do not use same filenames more than once.
     testdir/stadfx.*
     testdir1/stdafx.*
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_reporter import *  # @UnusedWildImport
 from nsiqcppstyle_rulemanager import *  # @UnusedWildImport
 import string
 
-filenameMap = {}
 
+class SameFilenameRule(MapReduceRule):
+    # The filenames are collected across all files
+    def __init__(self):
+        self.filenameMap = {}
 
-def RunRule(lexer, filename, dirname):
-    if filename.startswith("stdafx."):
-        return
-    if filename.startswith("main.c"):
-        return
-    filelist = filenameMap.get(filename, None)
-    if filelist is None:
-        filenameMap[filename] = []
-        filenameMap[filename].append(os.path.join(dirname, filename))
-    else:
-        filenameMap[filename].append(os.path.join(dirname, filename))
-        nsiqcppstyle_reporter.Error(DummyToken(lexer.filename, "", 0, 0), __name__,
-                                    'Do not use same filename(%s) more than once. This filename is used in %s' % (
-                                        filename, ", ".join(filenameMap[filename])))
+    def map(self, lexer, filename, dirname):
+        if filename.startswith("stdafx."):
+            return None
+        if filename.startswith("main.c"):
+            return None
+        return (filename, dirname)
 
+    def reduce(self, path, value):
+        filename, dirname = value
+        filelist = self.filenameMap.setdefault(filename, [])
+        filelist.append(os.path.join(dirname, filename))
+        if len(filelist) > 1:
+            nsiqcppstyle_reporter.Error(DummyToken(path, "", 0, 0), __name__,
+                                        'Do not use same filename(%s) more than once. This filename is used in %s' % (
+                                            filename, ", ".join(filelist)))
 
-ruleManager.AddFileStartRule(RunRule)
 
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunRule)
-        global filenameMap
-        filenameMap = {}
-
-    def test1(self):
-        """
-            Test for correct reporting of multiple files with same name
-        """
-        self.Analyze("test/thisfile.c", "")
-        self.Analyze("test2/thisfile.c", "")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        """
-            Test for correct reporting of multiple files with different names
-        """
-        self.Analyze("test/thisfile.c", "")
-        self.Analyze("test/thisfile.h", "")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        """
-                Test for correct resolution of exceptions
-        """
-        self.Analyze("test/stdafx.h", "")
-        self.Analyze("test/stdafx.h", "")
-        self.Analyze("test/thisfile.c", "")
-        self.Analyze("test/main.c", "")
-        self.Analyze("test2/main.c", "")
-        self.Analyze("test/thisfile.h", "")
-        self.ExpectSuccess(__name__)
+ruleManager.AddMapReduceRule(SameFilenameRule)
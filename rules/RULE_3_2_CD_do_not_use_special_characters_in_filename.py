@@ -12,7 +12,7 @@ Only alphabets, numbers and underbars can be used for a filename.
     testdir/test.c
     testdir1/test_1.c
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_reporter import *  # @UnusedWildImport
 from nsiqcppstyle_rulemanager import *  # @UnusedWildImport
 from nsiqcppstyle_checker import *  # @UnusedWildImport
@@ -25,22 +25,3 @@ def RunRule(lexer, filename, dirname):
 
 
 ruleManager.AddFileStartRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/this-file.c", "")
-        self.Analyze("test2/!thisfile22.c", "")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisfile.c", "")
-        self.Analyze("test/thisfile.h", "")
-        self.ExpectSuccess(__name__)
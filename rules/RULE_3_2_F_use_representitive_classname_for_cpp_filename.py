@@ -36,151 +36,41 @@ If the class/struct name starts with "C", "C" can be ommited in the file name.
 
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
-classname = None
 
+class RepresentitiveClassnameRule(RuleBase):
+    def __init__(self):
+        self.classname = set()
 
-def RunFunctionNameRule(lexer, fullName, decl, contextStack, context):
-    names = fullName.split("::")
-    if len(names) > 1:
-        if len(names[0]) != 0:
-            classname.add(names[0])
-
-
-def RunTypeNameRule(lexer, currentType, fullName, decl, contextStack, context):
-    if currentType in ["CLASS", "STRUCT"]:
+    def on_function_name(self, lexer, fullName, decl, contextStack, context):
         names = fullName.split("::")
-        if len(names[-1]) != 0:
-            classname.add(names[-1])
-
-
-def RunFileStartRule(lexer, filename, dirname):
-    global classname
-    classname = set()
-
-
-def RunFileEndRule(lexer, filename, dirname):
-    goodFileName = False
-    filename = filename.lower()
-    if len(classname) == 0:
-        return
-    for t in classname:
-        if t.startswith("C"):
-            t = t[1:]
-        if filename.find(t.lower()) != -1:
-            goodFileName = True
-            break
-    if not goodFileName:
-        nsiqcppstyle_reporter.Error(DummyToken(lexer.filename, "", 0, 0), __name__,
-                                    "The filename does not represent the classnames (%s)" % (classname))
-
-
-ruleManager.AddFileStartRule(RunFileStartRule)
-ruleManager.AddTypeNameRule(RunTypeNameRule)
-ruleManager.AddFunctionNameRule(RunFunctionNameRule)
-ruleManager.AddFileEndRule(RunFileEndRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunFileStartRule)
-        ruleManager.AddTypeNameRule(RunTypeNameRule)
-        ruleManager.AddFunctionNameRule(RunFunctionNameRule)
-        ruleManager.AddFileEndRule(RunFileEndRule)
-
-    def test1(self):
-        self.Analyze("test/aa.c",
-                     """
-void AA::DSD() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("test/ab.c",
-                     """
-void AA::DSD() {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("test/aa.c",
-                     """
-void CAA::DSD() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("test/aa.c",
-                     """
-void DSD() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("test/aa.cpp",
-                     """
-struct AA {
-}
-
-class BB {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("test/aa.cpp",
-                     """
-struct AA1 {
-}
-
-class BB {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test7(self):
-        self.Analyze("test/CamRecorderFactory.cpp",
-                     """
-class __declspec(dllexport) CCamRecorderFactory
-{
-};
-""")
-        self.ExpectSuccess(__name__)
-
-    def test8(self):
-        self.Analyze("test/CamRecorderFactory.cpp",
-                     """
-class DLLEXPORT CCamRecorderFactory
-{
-};
-""")
-        self.ExpectSuccess(__name__)
-
-    def test9(self):
-        self.Analyze("test/CamRecorderFactory.h",
-                     """
-class CamRecorderFactory final
-{
-};
-""")
-        self.ExpectSuccess(__name__)
-
-    def test10(self):
-        self.Analyze("test/CamRecorderFact.h",
-                     """
-class CamRecorderFactory final
-{
-};
-""")
-        self.ExpectError(__name__)
+        if len(names) > 1:
+            if len(names[0]) != 0:
+                self.classname.add(names[0])
+
+    def on_type_name(self, lexer, currentType, fullName, decl, contextStack, context):
+        if currentType in ["CLASS", "STRUCT"]:
+            names = fullName.split("::")
+            if len(names[-1]) != 0:
+                self.classname.add(names[-1])
+
+    def on_file_end(self, lexer, filename, dirname):
+        goodFileName = False
+        filename = filename.lower()
+        if len(self.classname) == 0:
+            return
+        for t in self.classname:
+            if t.startswith("C"):
+                t = t[1:]
+            if filename.find(t.lower()) != -1:
+                goodFileName = True
+                break
+        if not goodFileName:
+            nsiqcppstyle_reporter.Error(DummyToken(lexer.filename, "", 0, 0), __name__,
+                                        "The filename does not represent the classnames (%s)" % (self.classname))
+
+
+ruleManager.AddRuleClass(RepresentitiveClassnameRule)
@@ -19,7 +19,7 @@ Only alphabets, numbers can be used for a cpp filename.
     testdir1/test_1.c <== Don't care. it's c file.
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -33,48 +33,3 @@ def RunRule(lexer, filename, dirname):
 
 
 ruleManager.AddFileStartRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisfile.cpp", "")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("test/this_file.c", "")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisfile.cxx", "")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisfile.cc", "")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisfile.mm", "")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("test/this_file.cxx", "")
-        self.ExpectError(__name__)
-
-    def test7(self):
-        self.Analyze("test/this_file.cpp", "")
-        self.ExpectError(__name__)
-
-    def test8(self):
-        self.Analyze("test/this_file.cc", "")
-        self.ExpectError(__name__)
-
-    def test9(self):
-        self.Analyze("test/this_file.mm", "")
-        self.ExpectError(__name__)
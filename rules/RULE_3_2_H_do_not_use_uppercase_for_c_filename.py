@@ -13,7 +13,7 @@ This rule only applied on the only 'c' file.
     testdir1/test1.c      <== OK.
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -26,24 +26,3 @@ def RunRule(lexer, filename, dirname):
 
 
 ruleManager.AddFileStartRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c", "")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/ThisFile.cpp", "")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("test/this_file.c", "")
-        self.ExpectSuccess(__name__)
@@ -20,7 +20,7 @@ Please turn off this rule. If you think it's too overwhelming.
     }
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -29,129 +29,24 @@ from nsiqcppstyle_rulemanager import *
 def RunRule(lexer, fullName, decl, contextStack, context):
     t = lexer.GetCurToken()
     functionName = t.value.lower()
-    k = 0
-    t2 = None
-    while(True):
-        t2 = lexer.GetPrevTokenSkipWhiteSpaceAndCommentAndPreprocess()
-        if t2 is None or k > 4 or t2.type == "SEMI":
-            break
-        if t2.value.lower() == "bool":
+    signature = lexer.GetFunctionSignature(t)
+    if signature is None:
+        return
+    # bool in the template arguments (e.g. pair<iterator, bool>) isn't the return type
+    depth = 0
+    for t2 in signature.returnType:
+        if t2.type == "LT":
+            depth += 1
+        elif t2.type == "GT":
+            depth -= 1
+        elif t2.type == "RSHIFT":
+            depth -= 2
+        elif depth <= 0 and t2.value.lower() == "bool":
             if not Search("^(has|is)",
                           functionName) and functionName != "operator":
                 nsiqcppstyle_reporter.Error(t, __name__,
                                             "The function name(%s) should start with has or is when returinning bool" % fullName)
             break
-        k += 1
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-bool canHave() {
-}""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-bool CTEST:canHave() {
-}""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-extern bool CTEST:canHave() {
-}""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisFile.c",
-                     """
-extern int CTEST:canHave() {
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisFile.c",
-                     """
-extern int CTEST:isIt() {
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-extern bool CTEST:canHave();
-}""")
-        self.ExpectError(__name__)
-
-    def test7(self):
-        self.Analyze("test/thisFile.c", """
-/**
-              *          Check if the requesting is necessary.
-              */
-             bool IsSetToRequest() const;
-
-
-             /// Gates
-             /**
-              *          Add the exit gate item.
-              */
-             void AddGate(GATE gate){m_GateCont.push_back(gate); }
-""")
-        self.ExpectSuccess(__name__)
-
-    def test8(self):
-        self.Analyze("test/thisFile.c",
-                     """
-boolean operator=();
-boolean KK::operator=();
-""")
-        self.ExpectSuccess(__name__)
-
-    def test9(self):
-        self.Analyze("test/thisFile.c",
-                     """
-/**
-  * This tests for correct parsing of fn name and nested templates
-  **/
-template<class ObjectTypePtr,
-         typename = typename std::enable_if<std::is_pointer<ObjectTypePtr>::value>::type>
-bool canHave(ObjectTypePtr obj) {
-}
-
-template<class ObjectTypeNotPtr,
-         typename = typename std::enable_if<!std::is_pointer<ObjectTypeNotPtr>::value>::type>
-bool canHave(ObjectTypeNotPtr obj) {
-}""")
-        self.ExpectError(__name__)
-
-    def test10(self):
-        self.Analyze("test/thisFile.c",
-                     """
-/**
-  * This tests for correct parsing of fn name and nested templates
-  **/
-template<class ObjectTypePtr,
-         typename = typename std::enable_if<std::is_pointer<ObjectTypePtr>::value>::type>
-bool isIt(ObjectTypePtr obj) {
-}
-
-template<class ObjectTypeNotPtr,
-         typename = typename std::enable_if<!std::is_pointer<ObjectTypeNotPtr>::value>::type>
-bool isIt(ObjectTypeNotPtr obj) {
-}""")
-        self.ExpectSuccess(__name__)
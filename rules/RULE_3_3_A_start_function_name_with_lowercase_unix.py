@@ -20,7 +20,7 @@ It's rule for only Unix / Linux C/C++ code.
 
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -43,126 +43,3 @@ def RunRule(lexer, fullName, decl, contextStack, context):
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-bool CanHave() {
-}""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-bool CTEST:CanHave() {
-}""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-extern bool CTEST:canHave() {
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisFile.c",
-                     """
-extern int CTEST:_CanHave() {
-}""")
-        self.ExpectError(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class AA {
-extern int ~IsIt();
-}""")
-        self.ExpectError(__name__)
-
-    def test6(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-extern bool CTEST:canHave();
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test7(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-   a = new EE();
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test8(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-  int Hello()
-  int EE();
-}""")
-        self.ExpectError(__name__)
-
-    def test9(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-  int K()
-  int ~K()
-  int ee();
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test10(self):
-        self.Analyze("test/thisFile.c",
-                     """
-#define TT KK() {\
-}}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test11(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void KK::KK() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test12(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void KK::~KK() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test13(self):
-        self.Analyze("test/thisFile.c",
-                     """
-TEST()
-   BLOCK1()
-   BLOCK2()
-   BLOCK3()
-
-""")
-        self.ExpectSuccess(__name__)
-
-    def test14(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void KK() {
-}
-""")
-        self.ExpectError(__name__)
@@ -20,49 +20,18 @@ In addition, it suppresses the violation when the line contains only spaces and
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 from nsiqcppstyle_types import *
 
 
-def RunRule(lexer: Lexer, line: LineText, lineno: LineNumber) -> None:
-    if not Match(r"^\s*$", line):
-        if Search("^\t", line):
+def RunRule(lexer: Lexer, lineTable: LineTable) -> None:
+    for line in lineTable:
+        if line.firstToken is not None and line.text.startswith("\t"):
             nsiqcppstyle_reporter.Error(DummyToken(
-                lexer.filename, line, lineno, 0), __name__, "Do not use tab for indent")
+                lexer.filename, line.text, line.lineno, 0), __name__, "Do not use tab for indent")
 
 
-ruleManager.AddLineRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddLineRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     "\tbool CanHave() {\n\t}")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-    Hello
-}""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class K {
-
-Hello
-}""")
-        self.ExpectSuccess(__name__)
+ruleManager.AddBulkLineRule(RunRule)
@@ -16,22 +16,20 @@ align long function parameters on the first parameter when it's defined in multi
                    int c); <== OK.
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
 
 def RunRule(lexer, fullName, decl, contextStack, context):
-    lexer.GetNextTokenInType("LPAREN", False, True)
-    rparen = lexer.GetNextMatchingToken(True)
-    firstElement = lexer.PeekNextTokenSkipWhiteSpaceAndCommentAndPreprocess()
+    signature = lexer.GetFunctionSignature(lexer.GetCurToken())
+    if signature is None or not signature.tokens:
+        return
+    firstElement = signature.tokens[0]
     firstElementLineNo = firstElement.lineno
     firstElementColumn = GetRealColumn(firstElement)
-    while(True):
-        t = lexer.GetNextTokenSkipWhiteSpaceAndCommentAndPreprocess()
-        if t is None or t == rparen:
-            break
+    for t in signature.tokens:
         if firstElementLineNo != t.lineno:
             firstElementLineNo = t.lineno
             if firstElementColumn != GetRealColumn(t):
@@ -40,125 +38,3 @@ def RunRule(lexer, fullName, decl, contextStack, context):
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j
-              int pp)
-{
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j,
-             int pp)
-{
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j,
-
-             int pp)
-{
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class A {
-void function(int k, int j,
-              int pp);
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class A {
-void function(int k, int j,
-            int pp);
-}
-""")
-        self.ExpectError(__name__)
-
-    def test7(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class A {
-void function(int k, int j,
-              int pp)
-{
-    function(KK, DD,
-             TT);
-}
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test8(self):
-        self.Analyze("test/thisFile.c",
-                     """
-class A {
-void function(int k, int j,
-              int pp)
-{
-    function(KK, DD,
-             TT);
-}
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test9(self):
-        self.Analyze("test/thisFile.c",
-                     """
-Void aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa( int a,
-                                          int b)
-{
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test10(self):
-        self.Analyze("test/thisFile.c",
-                     """
-OrgDNSHandler::RESULT_CODE OrgDNSHandler::process( const NRootDNSConfig* pNRootDNSConfig,
-                                                   const nano::Variant::List& params,
-                                                   int a)
-{
-    return NULL;
-};
-
-void functionA(int a, int b
-               int c);
-""")
-        self.ExpectSuccess(__name__)
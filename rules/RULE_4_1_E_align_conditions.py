@@ -12,7 +12,7 @@ All conditions should be aligned in the same column with the first condition.
     if (a == b &&
         a == c) <== OK!
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -40,69 +40,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-    if (AA == D &&
-    kK = 22) {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-    if (AA == D &&
-        kK = 22) {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-    while (AA == D &&
-        kK = 22) {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisFile.c",
-                     """
-while (AA == D &&
-kK = 22) {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void F() {
-    while (AA == D &&
-           kK = 22
-        ) {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
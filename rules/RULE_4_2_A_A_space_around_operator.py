@@ -28,7 +28,7 @@ In the some operators(",", ";"), the spaces should be provided after the operato
     tt[c++]          <== OK. This rule doesn't care about the unary operator is used in the [ ( [
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -114,137 +114,3 @@ def RunRule(lexer, contextStack):
 
 ruleManager.AddRule(RunRule)
 ruleManager.AddPreprocessRule(RunRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddRule(RunRule)
-        ruleManager.AddPreprocessRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-int *a;
-void operator=(EWE) {
-HELLO = ewe << 3;
-TEST <= 3;
-TEST < 3;
-TEST | C;
-TEST & C;
-A != 3;
-t = a++;
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-(DD +ww);
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-HELLO = ewe <<3;
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisFile.c",
-                     """
-HELLo = TET ||B;
-""")
-        self.ExpectError(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisFile.c", "#define KK(dsd) TET ||B;")
-        self.ExpectError(__name__)
-
-    def test6(self):
-        self.Analyze("test/thisFile.c", "k = &b;")
-        self.ExpectSuccess(__name__)
-
-    def test7(self):
-        self.Analyze("test/thisFile.c", "k=b;")
-        self.ExpectError(__name__)
-
-    def test8(self):
-        self.Analyze("test/thisFile.c", "k|= b;")
-        self.ExpectError(__name__)
-
-    def test9(self):
-        self.Analyze("test/thisFile.c", "k++c;")
-        self.ExpectError(__name__)
-
-    def test10(self):
-        self.Analyze("test/thisFile.c", "#include <h/ds>")
-        self.ExpectSuccess(__name__)
-
-    def test11(self):
-        self.Analyze("test/thisFile.c", "hash ^= hash << 4;")
-        self.ExpectSuccess(__name__)
-
-    def test12(self):
-        self.Analyze("test/thisFile.c", """
-#define KK() ewee;\\
-hash ^= hash << 4;
-""")
-        self.ExpectSuccess(__name__)
-
-    def test13(self):
-        self.Analyze("test/thisFile.c", """
-#define KK() ewee;\\
-hash ^= hash<<4;
-""")
-        self.ExpectError(__name__)
-
-    def test14(self):
-        self.Analyze("test/thisFile.c", """
-#include <magic++.h>
-""")
-        self.ExpectSuccess(__name__)
-
-    def test15(self):
-        self.Analyze("test/thisFile.c", """
-m_mTabCommand.SetAt(nId++, p##TabName##TabCommand);
-""")
-        self.ExpectSuccess(__name__)
-
-    def test16(self):
-        self.Analyze("test/thisFile.c", """
-m_mTabCommand.SetAt(++nId, p##TabName##TabCommand);
-m_mTabCommand.SetAt(nId++dd);
-""")
-        self.ExpectError(__name__)
-
-    def test17(self):
-        self.Analyze("test/thisFile.c", """
-string k = "k=b %s";
-""")
-        self.ExpectSuccess(__name__)
-
-    def test18(self):
-        self.Analyze("test/thisFile.c", """
-sprintf(l_szConfigPath, ""
-"print%log");
-""")
-        self.ExpectSuccess(__name__)
-
-    def test19(self):
-        self.Analyze("test/thisFile.c", r"""
-sprintf(l_szConfigPath, "\\"
-"print"
-wewewe
-wewe);
-wewe
-"ewewe"
-
-""")
-        self.ExpectSuccess(__name__)
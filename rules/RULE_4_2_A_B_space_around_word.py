@@ -28,7 +28,7 @@ It doens't check 'switch' and 'while' because they are commonly attached followi
     }
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -55,100 +55,3 @@ def RunRule(lexer, contextStack):
 
 ruleManager.AddFunctionScopeRule(RunRule)
 ruleManager.AddPreprocessRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-        ruleManager.AddPreprocessRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-  for(a;b;c) {
-  }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-  if(k==3)
-  {
-  }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-  if (k==3)
-  {
-  }else {
-  }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("test/thisFile.c",
-                     """
-if(k==3)
-{
-}
-void function(int k, int j, int pp)
-{
-  if (k==3)
-  {
-  } else {
-  }
-  while(True) {
-  }
-  for (k;j; c) {
-  }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("test/thisFile.c",
-                     """
-#define AA do {\\
-} while(0)
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("test/thisFile.c",
-                     """
-#define AA if\\
-{} while(0)
-""")
-        self.ExpectSuccess(__name__)
-
-    def test7(self):
-        self.Analyze("test/thisFile.c",
-                     """
-#define AA if(\\
-{} while(0)
-""")
-        self.ExpectError(__name__)
-
-    def test8(self):
-        self.Analyze("test/thisFile.c",
-                     """
-#  include <boost/preprocessor/repetition/for.hpp>
-""")
-        self.ExpectSuccess(__name__)
@@ -11,50 +11,18 @@ This rule doesn't recognize tabs. It only think each character as 1 column.
 
     int K; <== OK. It's short.
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
 
-def RunRule(lexer, line, lineno):
-    if not Match(r"^\s*$", line):
-        if len(line) > 120:
+def RunRule(lexer, lineTable):
+    for line in lineTable:
+        # add code to recognise tabs as charachters
+        if line.length > 120 and line.firstToken is not None:
             nsiqcppstyle_reporter.Error(DummyToken(
-                lexer.filename, line, lineno, 0), __name__, 'Lines should very rarely be longer than 120 characters')
-        else:
-            # add code to recognise tabs as charachters
-            pass
-
-
-ruleManager.AddLineRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddLineRule(RunRule)
-
-    def test1(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-%s
-}
-""" % ("d" * 121))
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("test/thisFile.c",
-                     """
-void function(int k, int j, int pp)
-{
-%s
-%s
-}
-""" % ("d" * 119, " " * 130))
-        self.ExpectSuccess(__name__)
+                lexer.filename, line.text, line.lineno, 0), __name__, 'Lines should very rarely be longer than 120 characters')
+
+
+ruleManager.AddBulkLineRule(RunRule)
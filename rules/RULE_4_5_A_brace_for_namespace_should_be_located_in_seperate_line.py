@@ -15,7 +15,7 @@ Braces for namespace should be located in the seperate line.
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 
@@ -42,61 +42,3 @@ def RunRule(lexer, currentType, fullName, decl, contextStack, typeContext):
 
 
 ruleManager.AddTypeNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddTypeNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-public class A {
-
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-class C : public AA {
-
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-class K
-{
-    void function() const {
-    }
-    class T
-    {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-namespace K
-{
-    void function() const {
-    }
-    class T {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c", """
-namespace K {
-    int k;
-}
-""")
-        self.ExpectError(__name__)
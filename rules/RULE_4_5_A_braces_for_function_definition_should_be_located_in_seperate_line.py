@@ -24,7 +24,7 @@ Braces for function definition should be located in the seperate line.
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -48,63 +48,3 @@ def RunRule(lexer, fullName, decl, contextStack, typeContext):
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void function() {
-
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-void function() const {
-
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-class K {
-    void function() const
-    {
-
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-void function()
-{
-    while(True) {
-    }
-}
-class A {
-void function()
-  {
-  }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c", """
-class K {
-    void function() const
-    {   }
-}
-""")
-        self.ExpectSuccess(__name__)
@@ -22,7 +22,7 @@ Braces for type definition(class / struct / union / enum) should be located in t
         }
     }
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -46,99 +46,3 @@ def RunRule(lexer, currentType, fullName, decl, contextStack, typeContext):
 
 
 ruleManager.AddTypeNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddTypeNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-public class A {
-
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-class C : public AA {
-
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-class K
-{
-    void function() const {
-    }
-    class T
-    {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-class K
-{
-    void function() const {
-    }
-    class T {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c", """
-class C : public AA
-{
-    class T {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c", """
-class C : public AA
-{
-    class T
-    {
-      }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test7(self):
-        self.Analyze("thisfile.c", """
-class C : public AA
-{
-    class T
-    {   }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test8(self):
-        self.Analyze("thisfile.c", """
-namespace C {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test9(self):
-        self.Analyze("thisfile.c", """
-if (hello) {
-// {kr} m_btn5 {/kr}
-}
-""")
-        self.ExpectSuccess(__name__)
@@ -27,7 +27,7 @@ Braces inside of function definitions should be located in the end of line.
         }
     }
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -48,44 +48,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    for (;;)
-    {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a =
-    {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a = {
-    }
-    while(True) {
-    }
-    k = {}
-}
-""")
-        self.ExpectSuccess(__name__)
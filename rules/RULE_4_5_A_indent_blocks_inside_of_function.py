@@ -43,7 +43,7 @@ Indent blocks inside of function.
 
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 from nsiqcppstyle_rulehelper import *
@@ -63,74 +63,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void function() {
-for (;;) {
-}
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-void function() {
-a = {
-}
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a = {
-        }
-    while(True)
-    {
-    tt {
-    }
-    }
-    k = {}
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a = {
-        }
-    while(True)
-    {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a = { dsdsd}
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c", """
-#define AA(p, t) \
-do {\
-aa = e;
-} while(0)
-""")
-        self.ExpectSuccess(__name__)
@@ -24,7 +24,7 @@ Matching braces inside of function definitions should be the same column.
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -41,74 +41,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    for (;;) {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a = {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    a = {
-        }
-    while(True)
-    {
-    }
-    k = {}
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-void function() {
-    for (;;) {
-             }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c", """
-void function() {
-%sfor (;;) {
-             }
-}
-""" % ('\t'))
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c", """
-void function() {
-void function2() {
-for (;;)
-{
-  {
-  }
-}
-}
-""")
-        self.ExpectSuccess(__name__)
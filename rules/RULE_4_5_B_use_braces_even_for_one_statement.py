@@ -26,7 +26,7 @@ Use braces even for the one statement.
 
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_checker import *
 from nsiqcppstyle_rulemanager import *
@@ -51,74 +51,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void function() {
-for (;;)
-    a = 3;
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-void function() {
-for (;;)  {
-    a = 3;
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-void function() {
-while(True)
-    sdsd();
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-void function() {
-do {
-} while(true);
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c", """
-void function() {
-if (true) {
-    sdsd();
-    } else
-        SSDD();
-}
-""")
-        self.ExpectError(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c", """
-void function() {
-if (true) {
-    sdsd();
-    } else {
-        SSDD();
-    } else if (true) {
-    }
-
-}
-""")
-        self.ExpectSuccess(__name__)
@@ -23,7 +23,7 @@ It checks if there is doxygen sytle comment in front of each class definition.
 
     class B; <== Don't care. It's forward decl.
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -32,9 +32,7 @@ from nsiqcppstyle_rulemanager import *
 def RunRule(lexer, currentType, fullName, decl, contextStack, typeContext):
     if not decl and currentType == "CLASS" and typeContext is not None:
         t = lexer.GetCurToken()
-        lexer.PushTokenIndex()
-        t2 = lexer.GetPrevTokenInType("COMMENT")
-        lexer.PopTokenIndex()
+        t2 = lexer.GetFact("previousComment", t)
         lexer.PushTokenIndex()
         t3 = lexer.GetPrevTokenInTypeList(
             ["LBRACE", "SEMI", "PREPROCESSOR"], False, True)
@@ -47,80 +45,4 @@ def RunRule(lexer, currentType, fullName, decl, contextStack, typeContext):
 
 
 ruleManager.AddTypeNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddTypeNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-class A {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- */
-class K {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-/**
- */
-class K {
-    class T {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-/**
- *
- */
-class J {
-    int k;
-    /**
-     */
-    class T {
-    }
-}
-class T;
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- */
-struct K {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c",
-                     """
-/**
- */
-template<class A, class B>
-class K {
-}
-""")
-        self.ExpectSuccess(__name__)
+ruleManager.RequireFacts("previousComment")
@@ -25,7 +25,7 @@ It checks if there is doxygen sytle comment in front of each 'namespace' keyword
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -34,9 +34,7 @@ from nsiqcppstyle_rulemanager import *
 def RunRule(lexer, currentType, fullName, decl, contextStack, typeContext):
     if not decl and currentType == "NAMESPACE" and typeContext is not None:
         t = lexer.GetCurToken()
-        lexer.PushTokenIndex()
-        t2 = lexer.GetPrevTokenInType("COMMENT")
-        lexer.PopTokenIndex()
+        t2 = lexer.GetFact("previousComment", t)
         lexer.PushTokenIndex()
         t3 = lexer.GetPrevTokenInTypeList(
             ["SEMI", "PREPROCESSOR", "LBRACE"], False, True)
@@ -50,39 +48,4 @@ def RunRule(lexer, currentType, fullName, decl, contextStack, typeContext):
 
 
 ruleManager.AddTypeNameRule(RunRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddTypeNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-namespace K;
-""")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- */
-namespace K {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-/**
- */
-using namespace A;
-""")
-        self.ExpectSuccess(__name__)
+ruleManager.RequireFacts("previousComment")
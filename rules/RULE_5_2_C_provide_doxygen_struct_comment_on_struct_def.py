@@ -24,7 +24,7 @@ It checks if there is doxygen sytle comment in front of each struct/union defini
     struct A; <== Don't care. It's forward decl.
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -33,9 +33,7 @@ from nsiqcppstyle_rulemanager import *
 def RunRule(lexer, currentType, fullName, decl, contextStack, context):
     if not decl and currentType in ("STRUCT", "UNION") and context is not None:
         t = lexer.GetCurToken()
-        lexer.PushTokenIndex()
-        t2 = lexer.GetPrevTokenInType("COMMENT")
-        lexer.PopTokenIndex()
+        t2 = lexer.GetFact("previousComment", t)
         lexer.PushTokenIndex()
         t3 = lexer.GetPrevTokenInTypeList(
             ["SEMI", "PREPROCESSOR", "LBRACE"], False, True)
@@ -48,78 +46,4 @@ def RunRule(lexer, currentType, fullName, decl, contextStack, context):
 
 
 ruleManager.AddTypeNameRule(RunRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddTypeNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-struct A {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- */
-struct K {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-/**
- */
-struct K {
-    struct T {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-/**
- *
- */
-struct J {
-    int k;
-    /**
-     */
-    struct T {
-    }
-}
-class T;
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- */
-struct K {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c",
-                     """
-typedef struct  {
-} K
-""")
-        self.ExpectError(__name__)
+ruleManager.RequireFacts("previousComment")
@@ -53,16 +53,15 @@ void KK::C()  // NS
     void FunctionB();  <== Don't care. It's the declared in the header.
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
 import nsiqcppstyle_reporter
 from nsiqcppstyle_rulemanager import *
 
 
 def RunRule(lexer, fullName, decl, contextStack, context):
-    ext = lexer.filename[lexer.filename.rfind("."):]
-    if not decl and ext != ".h" and context is not None:
+    if not decl and lexer.GetFact("fileExtension") != ".h" and context is not None:
         upperBlock = contextStack.SigPeek()
-        if upperBlock is not None and upperBlock.type == "CLASS_BLOCK" and upperBlock.additional == "PRIVATE":
+        if upperBlock is not None and upperBlock.type == "CLASS_BLOCK" and \
+                lexer.GetFact("accessSpecifier", lexer.GetCurToken()) == "PRIVATE":
             return
 
         t1 = lexer.GetPrevTokenInType("STATIC", True)
@@ -71,9 +70,7 @@ def RunRule(lexer, fullName, decl, contextStack, context):
             return
 
         t = lexer.GetCurToken()
-        lexer.PushTokenIndex()
-        t2 = lexer.GetPrevTokenInType("COMMENT")
-        lexer.PopTokenIndex()
+        t2 = lexer.GetFact("previousComment", t)
         lexer.PushTokenIndex()
         t3 = lexer.GetPrevTokenInTypeList(
             ["SEMI", "PREPROCESSOR"], False, True)
@@ -86,111 +83,4 @@ def RunRule(lexer, fullName, decl, contextStack, context):
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-
-def RunTypeScopeRule(lexer, contextStack):
-    t = lexer.GetCurToken()
-    if t.type in ["PUBLIC", "PRIVATE", "PROTECTED"]:
-        curContext = contextStack.SigPeek()
-        if curContext.type in ["CLASS_BLOCK", "STRUCT_BLOCK"]:
-            curContext.additional = t.type
-
-
-ruleManager.AddTypeScopeRule(RunTypeScopeRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-        ruleManager.AddTypeScopeRule(RunTypeScopeRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-void FunctionA() {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- *
- */
-extern void FunctionB() {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-class A {
-public:
-    void ~A() {
-    }
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-class J {
-    /** HELLO */
-    C() {
-    }
-public :
-    /** HELLO */
-    A();
-private :
-    B() {}
-
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-/*
- *
- */
-static void FunctionB() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.h",
-                     """
-int a;
-void FunctionB(){
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test7(self):
-        self.Analyze("thisfile.c",
-                     """
-int a;
-void FunctionB(){
-}
-""")
-        self.ExpectError(__name__)
-
-    def test8(self):
-        self.Analyze("thisfile.c",
-                     """
-class J {
-    C() {
-    }
-}
-""")
-        self.ExpectError(__name__)
+ruleManager.RequireFacts("fileExtension", "previousComment", "accessSpecifier")
@@ -22,71 +22,21 @@ When you have to use such sentence, please // NS in the end of line to ignore th
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
 
 def RunRule(lexer, fullName, decl, contextStack, context):
-    lexer.GetNextTokenInType("LPAREN", False, True)
-    lexer.PushTokenIndex()
-    rparen = lexer.GetNextMatchingToken()
-    lexer.PopTokenIndex()
-    count = 0
-    while(True):
-        t = lexer.GetNextToken(True, True, True, True)
-        if t.type == "COMMA":
-            count += 1
-        elif rparen == t:
-            if count >= 5:
-                nsiqcppstyle_reporter.Error(
-                    t, __name__, "function (%s) has more than 5 parameters. please use struct instead." % fullName)
-            break
+    signature = lexer.GetFunctionSignature(lexer.GetCurToken())
+    if signature is None:
+        return
+    # The commas in the template arguments are counted as well, so
+    # len(signature.parameters) isn't used
+    if len(signature.commas) >= 5:
+        nsiqcppstyle_reporter.Error(
+            signature.rparen, __name__, "function (%s) has more than 5 parameters. please use struct instead." % fullName)
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-int functionA(int *a, int b, int c, int d, Scope<T,J> a) {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-int functionA(int *a, int b, int c,   Scope<T,J> a) {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-int functionA(int *a, int b, int c, tt&b, aa*s, k a) {
-}
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-class T {
-int functionA(int *a, int b, int c, tt&b, aa*s, k a) {
-}
-};
-""")
-        self.ExpectError(__name__)
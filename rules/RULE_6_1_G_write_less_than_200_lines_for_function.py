@@ -17,7 +17,7 @@ So it only counts non blank line.
 
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -28,8 +28,8 @@ def RunRule(lexer, fullName, decl, contextStack, context):
         startline = context.startToken.lineno
         endline = context.endToken.lineno
         count = 0
-        for eachLine in lexer.lines[startline - 1:endline - 1]:
-            if not Match(r"^\s*$", eachLine):
+        for eachLine in lexer.GetLineTable()[startline - 1:endline - 1]:
+            if not eachLine.blank:
                 count += 1
         if count > 200:
             nsiqcppstyle_reporter.Error(
@@ -37,24 +37,3 @@ def RunRule(lexer, fullName, decl, contextStack, context):
 
 
 ruleManager.AddFunctionNameRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", "int k() {%s};" % ("hello\n\n" * 201))
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", "int k() {%s};" % ("hello\n\n" * 120))
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", "int k() {%s};" % ("hello\n\n" * 200))
-        self.ExpectSuccess(__name__)
@@ -12,7 +12,7 @@ Instead use system independent types (int16_t, int64_t, int32_t) respectively.
 
     int32_t b;
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -30,46 +30,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddRule(RunRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-int k;
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-void T() {
-    long long k = 1;
-}
-""")
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-int32_t k = 2
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-void k() {
-    for (int j = 0; j < 11; j++) {
-    }
-}
-""")
-        self.ExpectSuccess(__name__)
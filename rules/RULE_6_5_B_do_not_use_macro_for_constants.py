@@ -19,18 +19,17 @@ and it doesn't report a violation on it.
     const int k = 3; <== OK
     const char *t = "EWEE"; <== OK
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
 
 def RunRule(lexer, contextStack):
-    t = lexer.GetCurToken()
-    if t.type == "PREPROCESSOR" and t.value.find("define") != -1:
-        d = lexer.GetNextTokenSkipWhiteSpaceAndComment()
-        k2 = lexer.GetNextTokenSkipWhiteSpaceAndComment()
-        if d.type == "ID" and k2 is not None and k2.type in [
+    directive = lexer.GetDirective(lexer.GetCurToken())
+    if directive is not None and directive.kind == "define" and len(directive.args) >= 2:
+        d, k2 = directive.args[0], directive.args[1]
+        if d.type == "ID" and k2.type in [
                 "NUMBER", "STRING", "CHARACTOR"] and d.lineno == k2.lineno:
             if not Search("^_", d.value):
                 nsiqcppstyle_reporter.Error(d, __name__,
@@ -38,37 +37,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddPreprocessRule(RunRule)
-
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddPreprocessRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-#define k 1
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-#define tt(A) 3
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-#  define t "ewew"
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-#  define _t "ewew"
-""")
-        self.ExpectSuccess(__name__)
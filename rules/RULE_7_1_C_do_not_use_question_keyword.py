@@ -19,7 +19,7 @@ if it's shown... this rule reports a violation.
     }
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -35,37 +35,3 @@ def RunRule(lexer, contextStack):
 
 ruleManager.AddFunctionScopeRule(RunRule)
 ruleManager.AddPreprocessRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-        ruleManager.AddPreprocessRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void Hello() {
-   int k = true ? 1 : 2;
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-int k = true ? 1 : 2;
-void Hello() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-#define k (t ? 1 : 2);
-void Hello() {
-}
-""")
-        self.ExpectError(__name__)
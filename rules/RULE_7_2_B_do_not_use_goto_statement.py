@@ -24,7 +24,7 @@ if it's shown... this rule reports a violation.
     }
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -38,29 +38,3 @@ def RunRule(lexer, contextStack):
 
 ruleManager.AddFunctionScopeRule(RunRule)
 ruleManager.AddPreprocessRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-        ruleManager.AddPreprocessRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """
-void Hello() {
-   goto TT:
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-goto TT:
-void Hello() {
-}
-""")
-        self.ExpectSuccess(__name__)
@@ -44,7 +44,7 @@ This rule detect following style file comment.
      * blar blar
      */
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -75,70 +75,3 @@ def RunRule(lexer, filename, dirname):
 
 
 ruleManager.AddFileStartRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFileStartRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """// license
-// copyright
-""")
-        self.ExpectSuccess(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """/**
-#if 0
-#endif
-license
-coryright */ """)
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-// license
-// copyrigh1
-""")
-        self.ExpectError(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """#define "WEWE"
-// license
-// copyrigh1
-#include </ewe/kk> """)
-        self.ExpectError(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-#define "WEWE"
-// license
-// copyright
-#include </ewe/kk> """)
-        self.ExpectError(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c",
-                     """// license
-// copyright
-#define "WEWE"
-#include </ewe/kk> """)
-        self.ExpectSuccess(__name__)
-
-    def test7(self):
-        self.Analyze("thisfile.c",
-                     """/*
- * license
- * copyright
- */
-""")
-        self.ExpectSuccess(__name__)
@@ -12,51 +12,22 @@ Do not use hardcoded paths in #include.
     #include "include/Hello.h"
 """
 
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
 
-def RunRule(lexer, contextStack):
-    t = lexer.GetCurToken()
-    if t.type == "PREPROCESSOR" and t.value.find("include") != -1:
-        d = lexer.GetNextTokenSkipWhiteSpaceAndComment()
-        if d is not None and d.type == "STRING":
-            value = d.value
-            if value.startswith("\"/") or Search(r"^\"[a-zA-Z]:", value):
-                nsiqcppstyle_reporter.Error(
-                    d, __name__, "Do not use absolute path(%s) in the include path" % value)
+# The white spaces and the comments between the directive and the path are skipped
+hardcodedIncludePattern = (r'#[ \t]*include\w*(?:\s|/\*[\s\S]*?\*/|//[^\n]*)*'
+                           r'("(?:/|[a-zA-Z]:)(?:[^"\\\n]|\\.)*")')
 
 
-ruleManager.AddPreprocessRule(RunRule)
+def RunRule(lexer, match, token, lineno):
+    if token.type == "PREPROCESSOR" and not token.inactive:
+        d = lexer.GetTokenAt(match.start(1))
+        nsiqcppstyle_reporter.Error(
+            d, __name__, "Do not use absolute path(%s) in the include path" % d.value)
 
-##########################################################################
-# Unit Test
-##########################################################################
 
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddPreprocessRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c", """# include "c:\k.h"
-void func1()
-{}""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c", """
-#include "/ewe/dsd" """)
-        self.ExpectError(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c", """
-#include "ewe\kk" """)
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c", """
-#include </ewe/kk> """)
-        self.ExpectSuccess(__name__)
+ruleManager.AddFileTextRule(hardcodedIncludePattern, RunRule)
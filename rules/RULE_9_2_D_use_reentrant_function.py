@@ -18,7 +18,7 @@ Use reentrant functions. Do not use not reentrant functions.(ctime, strtok, toup
       k = ctime;     <==  Correct. It may be the reentrant function.
   }
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
@@ -49,79 +49,3 @@ def RunRule(lexer, contextStack):
 
 
 ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = ctime()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-
-void func1() {
-#define ctime() k
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-void ctime() {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-void ctime () {
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test5(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = help.ctime ()
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test6(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = toupper()
-}
-""")
-        self.ExpectError(__name__)
-
-    def test7(self):
-        nsiqcppstyle_state._nsiqcppstyle_state.varMap["ignore_toupper"] = "true"
-        self.Analyze("thisfile.c",
-                     """
-void func1()
-{
-    k = toupper()
-}
-""")
-        self.ExpectSuccess(__name__)
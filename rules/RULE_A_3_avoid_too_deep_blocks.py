@@ -20,115 +20,31 @@ If the block depth in the function is more than 4, it reports a violation.
 
 
 """
-from nsiqunittest.nsiqcppstyle_unittestbase import *
+import nsiqcppstyle_reporter
 from nsiqcppstyle_rulehelper import *
 from nsiqcppstyle_reporter import *
 from nsiqcppstyle_rulemanager import *
 
-depth = 0
-reported = False
 
+class TooDeepBlockRule(RuleBase):
+    def __init__(self):
+        self.depth = 0
+        self.reported = False
 
-def RunRule(lexer, contextStack):
-    global depth
-    global reported
-    t = lexer.GetCurToken()
-    if t.type == "LBRACE":
-        depth += 1
-        if depth > 5 and not reported:
-            nsiqcppstyle_reporter.Error(
-                t, __name__, "Do not make too deep block(%d) ({). It makes not readable code" % depth)
-            reported = True
-    elif t.type == "RBRACE":
-        depth -= 1
+    def on_function_name(self, lexer, fullName, decl, contextStack, context):
+        self.reported = False
+        self.depth = 0
 
+    def on_function_scope(self, lexer, contextStack):
+        t = lexer.GetCurToken()
+        if t.type == "LBRACE":
+            self.depth += 1
+            if self.depth > 5 and not self.reported:
+                nsiqcppstyle_reporter.Error(
+                    t, __name__, "Do not make too deep block(%d) ({). It makes not readable code" % self.depth)
+                self.reported = True
+        elif t.type == "RBRACE":
+            self.depth -= 1
 
-def RunFunctionScopeRule(lexer, fullName, decl, contextStack, context):
-    global depth
-    global reported
-    reported = False
-    depth = 0
 
-
-ruleManager.AddFunctionNameRule(RunFunctionScopeRule)
-ruleManager.AddFunctionScopeRule(RunRule)
-
-##########################################################################
-# Unit Test
-##########################################################################
-
-
-class testRule(nct):
-    def setUpRule(self):
-        ruleManager.AddFunctionNameRule(RunFunctionScopeRule)
-        ruleManager.AddFunctionScopeRule(RunRule)
-
-    def test1(self):
-        self.Analyze("thisfile.c",
-                     """
-void func1() {
-{{{{{{{
-       }}}}}}}
-}
-""")
-        self.ExpectError(__name__)
-
-    def test2(self):
-        self.Analyze("thisfile.c",
-                     """
-
-void func1() {
-{{{
-#define {{{{ }}}
-       }}}}
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test3(self):
-        self.Analyze("thisfile.c",
-                     """
-void func(void)
-{
-if (...)
-{ // depth-1
-
-{ // depth-2
-
-{ // depth-3
-
-{ // depth-4
-
-printf("...");
-
-}
-}
-}
-}
-}
-""")
-        self.ExpectSuccess(__name__)
-
-    def test4(self):
-        self.Analyze("thisfile.c",
-                     """
-void func(void)
-{
-if (...)
-{ // depth-1
-
-{ // depth-2
-
-{ // depth-3
-
-{ // depth-4
-{ // depth-5
-printf("...");
-}
-}
-}
-}
-}
-}
-""")
-        self.ExpectError(__name__)
+ruleManager.AddRuleClass(TooDeepBlockRule)
@@ -1,3 +1,3 @@
 #!/bin/bash
 
-PYTHONPATH=./:./rules python -m unittest discover -s rules -p "*.py"
+PYTHONPATH=./ python -m unittest discover -s nsiqunittest/rules -t . -p "*_unittest.py"